@@ -1,7 +1,98 @@
+import asyncio
+import math
+import time
 import typing as t
+import weakref
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 
+from aiohttp import web
 
-__all__ = ['ConnectionInjector', ]
+from aiohttp_admin2.exceptions import AdminException
+
+
+__all__ = [
+    'ConnectionInjector',
+    'ConnectionAcquireTimeout',
+    'PoolStats',
+]
+
+
+# queries to set and to reset timeout of statements for different dialects,
+# timeout is specified in milliseconds
+STATEMENT_TIMEOUT_QUERIES = {
+    'postgresql': (
+        'SET statement_timeout = {}',
+        'SET statement_timeout = DEFAULT',
+    ),
+    'mysql': (
+        'SET SESSION max_execution_time = {}',
+        'SET SESSION max_execution_time = DEFAULT',
+    ),
+}
+
+
+class ConnectionAcquireTimeout(AdminException):
+    """Connection was not acquired from the pool in the specified time."""
+
+
+class PoolStats(t.NamedTuple):
+    """Object for represent state of the connections pool."""
+    size: int
+    free_size: int
+    min_size: int
+    max_size: int
+    # count of coroutines which are waiting for a free connection now
+    waiting: int
+    acquired_count: int
+    timeouts_count: int
+    # average time of waiting for a connection in seconds
+    average_wait: float
+
+
+# methods of requests which don't change data
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+class _PinnedConnection:
+    """
+    The connection which is shared between all queries inside the `pin`
+    block. Connection is acquired lazily by the first query.
+    """
+
+    def __init__(self, engine: t.Any = None) -> None:
+        # the pool of the connection, `None` means the primary pool
+        self.engine = engine
+        self.connection = None
+        self.context_manager = None
+        self.transaction = None
+        self.lock = asyncio.Lock()
+        self.owner: t.Optional[asyncio.Task] = None
+        # the connection to the replica which is used by read-only queries
+        self.replica: t.Optional[_PinnedConnection] = None
+        # read-only queries are executed on the primary after writes of the
+        # block (or of the previous request of the session) so they see
+        # these changes
+        self.written = False
+        self.sticky = False
+
+    @property
+    def read_primary(self) -> bool:
+        return (
+            self.replica is None
+            or self.transaction is not None
+            or self.written
+            or self.sticky
+        )
+
+
+# this context map to share pinned connections of injectors
+PinnedConnections = t.Dict['ConnectionInjector', _PinnedConnection]
+PinnedMap = ContextVar[t.Optional[PinnedConnections]]
+pinned_connections: PinnedMap = ContextVar(
+    'pinned_connections',
+    default=None,
+)
 
 
 class ConnectionInjector:
@@ -22,15 +113,73 @@ class ConnectionInjector:
 
     >>> @postgres_connection.inject
     >>> class Controller(PostgresController): pass
+
+    The injector can create and manage the pool of connections by itself
+
+    >>> postgres_connection = ConnectionInjector(
+    >>>     acquire_timeout=5,
+    >>>     statement_timeout=30,
+    >>> )
+    >>> await postgres_connection.create(
+    >>>     aiopg.sa.create_engine,
+    >>>     minsize=1,
+    >>>     maxsize=10,
+    >>>     dsn=dsn,
+    >>> )
+
+    and share one connection between all queries of the admin request
+
+    >>> setup_admin(app, middleware_list=[postgres_connection.middleware])
+
+    Read-only queries can be executed on replicas, queries of the session
+    are executed on the primary after its writes
+
+    >>> postgres_connection.init(db, replicas=[replica_db, other_replica_db])
     """
 
     connection: t.Any
+    # name of the cookie which marks requests of the session after writes
+    sticky_cookie_name = 'admin_read_primary'
+
+    def __init__(
+        self,
+        *,
+        acquire_timeout: t.Optional[float] = None,
+        statement_timeout: t.Optional[float] = None,
+        sticky_time: float = 10,
+    ) -> None:
+        # time in seconds
+        self.acquire_timeout = acquire_timeout
+        self.statement_timeout = statement_timeout
+        # time in seconds while read-only queries of the session are
+        # executed on the primary after writes, it must be larger than the
+        # lag of replicas
+        self.sticky_time = sticky_time
+        self.replicas: t.List[t.Any] = []
+
+        # pools which are created by the injector are used only by the
+        # admin, so the statement timeout is set once per connection of such
+        # pools and it isn't reset after queries of the admin
+        self._own_pools = False
+        self._configured_connections: weakref.WeakSet = weakref.WeakSet()
+        self._replica_index = 0
+        self._waiting = 0
+        self._acquired_count = 0
+        self._timeouts_count = 0
+        self._wait_time = 0.0
 
-    def init(self, connection: t.Any) -> None:
+    def init(
+        self,
+        connection: t.Any,
+        replicas: t.Sequence[t.Any] = (),
+    ) -> None:
         """
-        This method need to specify connection which need to share.
+        This method need to specify connection which need to share and
+        connections to replicas for read-only queries.
         """
         self.connection = connection
+        self.replicas = list(replicas)
+        self._own_pools = False
 
     def inject(self, cls: object) -> object:
         """
@@ -39,3 +188,305 @@ class ConnectionInjector:
         """
         cls.connection_injector = self
         return cls
+
+    async def create(
+        self,
+        factory: t.Callable[..., t.Awaitable[t.Any]],
+        *,
+        minsize: int = 1,
+        maxsize: int = 10,
+        replicas: t.Sequence[t.Dict[str, t.Any]] = (),
+        **kwargs: t.Any,
+    ) -> t.Any:
+        """
+        This method create a pool of connections (e.g. via the
+        `aiopg.sa.create_engine` function) and use it as connection. Pools
+        of replicas are created with the same parameters updated by items of
+        `replicas` (e.g. `[{"host": "replica"}]`).
+        """
+        connection = await factory(minsize=minsize, maxsize=maxsize, **kwargs)
+        replica_connections = [
+            await factory(
+                minsize=minsize,
+                maxsize=maxsize,
+                **{**kwargs, **replica},
+            )
+            for replica in replicas
+        ]
+        self.init(connection, replicas=replica_connections)
+        self._own_pools = True
+
+        return self.connection
+
+    async def close(self) -> None:
+        """Close pools of connections."""
+        for engine in [self.connection, *self.replicas]:
+            engine.close()
+            await engine.wait_closed()
+
+    @property
+    def stats(self) -> PoolStats:
+        """Return current state of the pool of connections."""
+        return PoolStats(
+            size=self.connection.size,
+            free_size=self.connection.freesize,
+            min_size=self.connection.minsize,
+            max_size=self.connection.maxsize,
+            waiting=self._waiting,
+            acquired_count=self._acquired_count,
+            timeouts_count=self._timeouts_count,
+            average_wait=self._wait_time / (self._acquired_count or 1),
+        )
+
+    async def _statement_timeout_query(self, conn, index: int) -> None:
+        if self.statement_timeout is None:
+            return
+
+        dialect = getattr(self.connection, 'dialect', None)
+        queries = STATEMENT_TIMEOUT_QUERIES.get(getattr(dialect, 'name', None))
+
+        if queries:
+            await conn.execute(
+                queries[index].format(int(self.statement_timeout * 1000))
+            )
+
+    async def _set_statement_timeout(self, conn) -> None:
+        """
+        Set the statement timeout for the acquired connection. For own pools
+        it's set only by the first acquire of the physical connection.
+        """
+        if self.statement_timeout is None:
+            return
+
+        if not self._own_pools:
+            await self._statement_timeout_query(conn, 0)
+            return
+
+        # sqlalchemy-like connections wrap the physical connection, a new
+        # wrapper is created by every acquire
+        physical_connection = getattr(conn, 'connection', conn)
+
+        if physical_connection not in self._configured_connections:
+            await self._statement_timeout_query(conn, 0)
+            self._configured_connections.add(physical_connection)
+
+    def _get_replica(self) -> t.Any:
+        """Return the next replica or `None` if there are no replicas."""
+        if not self.replicas:
+            return None
+
+        replica = self.replicas[self._replica_index % len(self.replicas)]
+        self._replica_index += 1
+
+        return replica
+
+    async def _connect(self, engine: t.Any = None) -> t.Tuple[t.Any, t.Any]:
+        if engine is None:
+            engine = self.connection
+
+        context_manager = engine.acquire()
+        start = time.monotonic()
+        self._waiting += 1
+
+        try:
+            conn = await asyncio.wait_for(
+                context_manager.__aenter__(),
+                self.acquire_timeout,
+            )
+        except asyncio.TimeoutError:
+            self._timeouts_count += 1
+            raise ConnectionAcquireTimeout(
+                f"Connection was not acquired in {self.acquire_timeout}s"
+            )
+        finally:
+            self._waiting -= 1
+            self._wait_time += time.monotonic() - start
+
+        self._acquired_count += 1
+
+        try:
+            await self._set_statement_timeout(conn)
+        except BaseException:
+            await context_manager.__aexit__(None, None, None)
+            raise
+
+        return conn, context_manager
+
+    async def _disconnect(self, conn, context_manager) -> None:
+        try:
+            if not self._own_pools:
+                await self._statement_timeout_query(conn, 1)
+        finally:
+            await context_manager.__aexit__(None, None, None)
+
+    @asynccontextmanager
+    async def acquire(self, readonly: bool = False) -> t.AsyncIterator[t.Any]:
+        """
+        Acquire connection from the pool. Inside the `pin` block the same
+        connection is returned for all calls and queries are executed one by
+        one.
+
+        If `readonly` is True than the connection is acquired from the pool
+        of the replica. Other connections are used for writes so inside the
+        `pin` block read-only connections are acquired from the primary pool
+        after the first of them or inside the transaction.
+        """
+        pinned = (pinned_connections.get() or {}).get(self)
+
+        if pinned is None:
+            engine = self._get_replica() if readonly else None
+            conn, context_manager = await self._connect(engine)
+
+            try:
+                yield conn
+            finally:
+                await self._disconnect(conn, context_manager)
+
+            return
+
+        if not readonly:
+            pinned.written = True
+        elif not pinned.read_primary:
+            pinned = pinned.replica
+
+        async with self._acquire_pinned(pinned) as conn:
+            yield conn
+
+    @asynccontextmanager
+    async def _acquire_pinned(
+        self,
+        pinned: _PinnedConnection,
+    ) -> t.AsyncIterator[t.Any]:
+        task = asyncio.current_task()
+
+        # nested acquire in the same task
+        if pinned.owner is task:
+            yield pinned.connection
+            return
+
+        async with pinned.lock:
+            pinned.owner = task
+
+            try:
+                if pinned.connection is None:
+                    pinned.connection, pinned.context_manager = \
+                        await self._connect(pinned.engine)
+
+                yield pinned.connection
+            finally:
+                pinned.owner = None
+
+    @asynccontextmanager
+    async def pin(self, transaction: bool = False) -> t.AsyncIterator[None]:
+        """
+        Share one connection between all queries which are executed inside
+        the current block (including concurrent tasks which are created
+        inside it). The connection is acquired only if it's needed.
+
+        If `transaction` is True than all queries of the block are executed
+        in one transaction which is committed at the end of the block or
+        rolled back if the block raise an exception. Nested blocks join the
+        outer transaction.
+        """
+        connections = pinned_connections.get() or {}
+        pinned = connections.get(self)
+        token = None
+
+        if pinned is None:
+            pinned = _PinnedConnection()
+            replica = self._get_replica()
+
+            if replica is not None:
+                pinned.replica = _PinnedConnection(replica)
+
+            token = pinned_connections.set({**connections, self: pinned})
+
+        is_transaction_owner = transaction and pinned.transaction is None
+
+        try:
+            # the transaction is started without changes so it doesn't
+            # mark the block as written
+            if is_transaction_owner:
+                async with self._acquire_pinned(pinned) as conn:
+                    pinned.transaction = await conn.begin()
+
+            try:
+                yield
+            except BaseException:
+                if is_transaction_owner:
+                    await self._finish_transaction(pinned, commit=False)
+                raise
+            else:
+                if is_transaction_owner:
+                    await self._finish_transaction(pinned, commit=True)
+        finally:
+            if token is not None:
+                pinned_connections.reset(token)
+
+                for item in [pinned, pinned.replica]:
+                    if item is not None and item.connection is not None:
+                        await self._disconnect(
+                            item.connection,
+                            item.context_manager,
+                        )
+
+    async def _finish_transaction(
+        self,
+        pinned: _PinnedConnection,
+        commit: bool,
+    ) -> None:
+        transaction, pinned.transaction = pinned.transaction, None
+
+        async with self._acquire_pinned(pinned):
+            if commit:
+                await transaction.commit()
+            else:
+                await transaction.rollback()
+
+    @property
+    def middleware(self) -> t.Callable:
+        """
+        The middleware which share one connection between all queries of the
+        request. Requests with unsafe methods (like POST) are executed as a
+        unit of work in one transaction.
+
+        If the injector has replicas than the cookie is set after writes of
+        the request so read-only queries of next requests of the session are
+        executed on the primary during `sticky_time` seconds.
+        """
+        @web.middleware
+        async def pin_connection_middleware(request, handler):
+            response = None
+            redirect = None
+
+            async with self.pin(
+                transaction=request.method not in SAFE_METHODS,
+            ):
+                pinned = pinned_connections.get()[self]
+                pinned.sticky = \
+                    self.sticky_cookie_name in request.cookies
+
+                try:
+                    response = await handler(request)
+                except web.HTTPException as e:
+                    # the admin use redirect after success update so we
+                    # need to commit changes in this case
+                    if e.status >= 400:
+                        raise
+
+                    redirect = e
+
+            if self.replicas and pinned.written:
+                (response or redirect).set_cookie(
+                    self.sticky_cookie_name,
+                    '1',
+                    max_age=math.ceil(self.sticky_time),
+                    httponly=True,
+                )
+
+            if redirect is not None:
+                raise redirect
+
+            return response
+
+        return pin_connection_middleware
@@ -1,19 +1,33 @@
+import asyncio
 import logging
+import time
 from enum import Enum
 import typing as t
+from contextlib import asynccontextmanager
 from collections import defaultdict
 from contextvars import ContextVar
 
 from aiohttp_admin2.resources.types import PK
 from aiohttp_admin2.resources.types import Instance
+from aiohttp_admin2.resources.types import InstanceBatch
 from aiohttp_admin2.resources.types import FiltersType
+from aiohttp_admin2.resources.types import CountStrategy
 from aiohttp_admin2.resources.abc import AbstractResource
+from aiohttp_admin2.resources.data_loader import clear_data_loaders
 from aiohttp_admin2.controllers.exceptions import PermissionDenied
+from aiohttp_admin2.controllers.permission_cache import PermissionCache
+from aiohttp_admin2.controllers.permission_cache import access_identity
 from aiohttp_admin2.mappers import Mapper
+from aiohttp_admin2.mappers.base import NON_FIELD_ERRORS
+from aiohttp_admin2.mappers.exceptions import ValidationError
+from aiohttp_admin2.resources.exceptions import BadParameters
 
 from aiohttp_admin2.views import filters
 from aiohttp_admin2.controllers.types import Cell
+from aiohttp_admin2.controllers.types import ListColumn
 from aiohttp_admin2.controllers.types import ListObject
+from aiohttp_admin2.controllers.types import ImportRowError
+from aiohttp_admin2.controllers.types import ImportResult
 
 if t.TYPE_CHECKING:
     from aiohttp_admin2.controllers.relations import ToManyRelation  # noqa
@@ -54,6 +68,8 @@ class Controller:
     relations_to_many: t.List["ToManyRelation"] = []
     foreign_keys_map: t.Dict[str, "ToOneRelation"] = {}
     foreign_keys_field_map: t.Dict[str, "ToOneRelation"] = {}
+    # names of `<field>_field_sort` methods by names of fields
+    custom_sort_methods: t.Dict[str, str] = {}
     many_to_many = {}
     exclude_update_fields = ['id', ]
     exclude_create_fields = ['id', ]
@@ -63,39 +79,161 @@ class Controller:
     can_update = True
     can_delete = True
     can_view = True
+    # storage to share results of the access hook between requests of the same
+    # user, the identity of the user is taken from the `access_identity`
+    permission_cache: t.Optional[PermissionCache] = None
+    # properties which the access hook change and which need to be cached
+    permission_cache_fields = [
+        'can_create',
+        'can_update',
+        'can_delete',
+        'can_view',
+    ]
 
     # settings
     order_by = 'id'
     per_page = 50
     list_filter = []
+    # fetch relations to one concurrently before build rows of the list page
+    # instead of fetch each relation when it's needed. If it's True then
+    # relations from `inline_fields` are fetched or you can specify list of
+    # names of relations
+    eager_prefetch: t.Union[bool, t.List[str]] = False
+    # strategy of the total count for the list page, if it's not specified
+    # than the strategy of the resource is used
+    count_strategy: t.Optional[CountStrategy] = None
+    # fetch only fields which are needed for the list page (`inline_fields`,
+    # fields of relations to one and `list_extra_fields`) instead of all
+    # fields of the resource
+    list_projection = False
+    # fields which are not shown on the list page but are needed to build
+    # rows (e.g. fields used in the `get_object_name` or in `*_field` methods)
+    list_extra_fields: t.List[str] = []
+    # actions which can be applied to selected instances (or to all instances
+    # which match filters) of the list page. Each action is implemented by
+    # the `<name>_bulk_action` method of the controller (e.g. `delete` and
+    # `update`)
+    bulk_actions: t.List[str] = []
+    # fields which are exported from the list page, by default all fields of
+    # the mapper are exported
+    export_fields: t.Optional[t.List[str]] = None
+    # count of instances which are fetched from the resource at once during
+    # the export
+    export_chunk_size = 500
+    # count of rows of the imported file which are validated and created by
+    # one batch
+    import_batch_size = 500
+    # max count of errors of invalid rows which are returned after the import
+    import_max_errors = 100
+
+    # metadata is computed for the instance (see `_setup_instance`)
+    _has_own_metadata = False
 
     def __init__(self):
+        cls = type(self)
+
+        # controllers are created for each request so all metadata of the
+        # class is computed only once and the instance keeps only the state
+        # of the request
+        if '_is_set_up' not in cls.__dict__:
+            cls.setup()
+
         self.prefetch_cache = defaultdict(dict)
-        foreign_keys = [key for key in self.relations_to_one if not key.hidden]
-        self.foreign_keys_map = {
+
+    @classmethod
+    def setup(cls) -> None:
+        """
+        Compute metadata of the controller class (maps of relations, getters
+        of foreign keys and custom sort methods). The admin calls this method
+        at the setup of the application, otherwise it's called at the creation
+        of the first instance of the controller.
+        """
+        if '_is_set_up' in cls.__dict__:
+            return
+
+        cls._compute_metadata(cls)
+        # plans of columns of the list page by `inline_fields`
+        cls._list_columns = {}
+        cls._is_set_up = True
+
+    @staticmethod
+    def _compute_metadata(owner: t.Any) -> None:
+        """
+        Compute metadata for the controller class or for the instance of the
+        controller.
+        """
+        is_class = isinstance(owner, type)
+        foreign_keys = [
+            key
+            for key in owner.relations_to_one
+            if not key.hidden
+        ]
+        owner.foreign_keys_map = {
             key.name: key
-            for key in self.relations_to_one
+            for key in owner.relations_to_one
         }
-        self.foreign_keys_field_map = {
+        owner.foreign_keys_field_map = {
             key.field_name: key
             for key in foreign_keys
         }
-        # todo: relation list created a lot of instances
+
         for relation_to_one in foreign_keys:
             name = f'{relation_to_one.field_name}_field'
+            getter = getattr(owner, name, None)
 
-            async def _get_foreign(obj: Instance) -> t.Any:
-                return await obj.get_relation(relation_to_one.name)
-
-            _get_foreign.is_foreignkey = True
-
-            if not hasattr(self, name):
+            # getters which are generated for a parent class are replaced
+            # because the subclass can change relations
+            if getter is None or getattr(getter, 'is_foreignkey', False):
+                getter = Controller._foreign_getter(relation_to_one.name)
                 setattr(
-                    self,
-                    f'{relation_to_one.field_name}_field',
-                    _get_foreign,
+                    owner,
+                    name,
+                    staticmethod(getter) if is_class else getter,
                 )
 
+        owner.custom_sort_methods = {
+            key[:-len('_field_sort')]: key
+            for key in dir(owner)
+            if key.endswith('_field_sort')
+        }
+
+    def _setup_instance(self) -> None:
+        """
+        The access hook (of the controller or of its view) can change
+        relations or getters of fields of the instance, in this case the
+        metadata is computed for the instance instead of the metadata of the
+        class.
+        """
+        is_redefined = any(
+            name == 'relations_to_one'
+            or name.endswith(('_field', '_field_sort'))
+            for name in vars(self)
+        )
+
+        if is_redefined:
+            self._compute_metadata(self)
+            self._has_own_metadata = True
+
+    @staticmethod
+    def _foreign_getter(
+        relation_name: str,
+    ) -> t.Callable[[Instance], t.Awaitable[t.Any]]:
+        async def _get_foreign(obj: Instance) -> t.Any:
+            return await obj.get_relation(relation_name)
+
+        _get_foreign.is_foreignkey = True
+
+        return _get_foreign
+
+    def get_custom_sort_list(self) -> t.Dict[str, t.Callable]:
+        """
+        Return custom sort methods (`<field>_field_sort`) by names of fields.
+        """
+        return {
+            name: getattr(self, method)
+            for name, method in self.custom_sort_methods.items()
+        }
+
     def get_resource(self):
         return self.resource
 
@@ -154,96 +292,356 @@ class Controller:
         """
         pass
 
+    # bulk hooks
+    async def pre_bulk_delete(
+        self,
+        pks: t.Optional[t.List[PK]],
+        filters: t.Optional[FiltersType],
+    ) -> None:
+        """
+        This hook will be call before delete of many instances by the bulk
+        action. By default it calls the `pre_delete` hook for each instance
+        if the hook is redefined.
+
+        :param pks: selected primary keys or None if all instances which
+            match filters will be deleted
+        :param filters: filters of the list page
+        """
+        if self._is_redefined('pre_delete'):
+            for pk in pks:
+                await self.pre_delete(pk)
+
+    async def post_bulk_delete(
+        self,
+        pks: t.Optional[t.List[PK]],
+        filters: t.Optional[FiltersType],
+    ) -> None:
+        """
+        This hook will be call after delete of many instances by the bulk
+        action. By default it calls the `post_delete` hook for each instance
+        if the hook is redefined.
+        """
+        if self._is_redefined('post_delete'):
+            for pk in pks:
+                await self.post_delete(pk)
+
+    async def pre_bulk_update(
+        self,
+        values: t.Dict[str, t.Any],
+        pks: t.Optional[t.List[PK]],
+        filters: t.Optional[FiltersType],
+    ) -> t.Dict[str, t.Any]:
+        """
+        This hook will be call before update of many instances by the bulk
+        action and can change values which will be set.
+
+        :param values: values of fields which will be set
+        """
+        return values
+
+    async def post_bulk_update(
+        self,
+        values: t.Dict[str, t.Any],
+        pks: t.Optional[t.List[PK]],
+        filters: t.Optional[FiltersType],
+    ) -> None:
+        """
+        This hook will be call after update of many instances by the bulk
+        action.
+        """
+        pass
+
     # access hook
     async def access_hook(self) -> None:
         """
         This method need to redefine settings (like can_create, can_update and
         etc.) and will be call before each call to resources.
+
+        If the `permission_cache` is specified than the result of this method
+        is cached for the current `access_identity`.
         """
         pass
 
+    async def _inner_access_hook(self) -> None:
+        identity = access_identity.get()
+
+        if self.permission_cache is None or identity is None:
+            await self.access_hook()
+        else:
+            key = (identity, type(self))
+            permissions = await self.permission_cache.get(key)
+
+            if permissions is None:
+                await self.access_hook()
+                permissions = {
+                    name: getattr(self, name)
+                    for name in self.permission_cache_fields
+                }
+                await self.permission_cache.set(key, permissions)
+            else:
+                for name, value in permissions.items():
+                    setattr(self, name, value)
+
+        self._setup_instance()
+
+    @classmethod
+    async def invalidate_permissions(
+        cls,
+        identity: t.Optional[t.Hashable] = None,
+    ) -> None:
+        """
+        Drop cached results of the access hook of the current controller for
+        received identity or for all identities if it's not specified.
+        """
+        if cls.permission_cache is not None:
+            await cls.permission_cache.invalidate(
+                identity=identity,
+                controller=cls,
+            )
+
+    @asynccontextmanager
+    async def atomic(self) -> t.AsyncIterator[None]:
+        """
+        All changes inside this block (including changes in `pre_*` and
+        `post_*` hooks) are applied in one transaction. Controllers of storages
+        without transactions don't do anything.
+        """
+        yield
+
     # CRUD
     async def delete(self, pk: PK):
-        await self.access_hook()
+        await self._inner_access_hook()
 
         if not self.can_delete:
             raise PermissionDenied
 
-        await self.pre_delete(pk)
-        await self.get_resource().delete(pk)
-        await self.post_delete(pk)
+        async with self.atomic():
+            await self.pre_delete(pk)
+            await self.get_resource().delete(pk)
+            clear_data_loaders(self.get_resource())
+            await self.post_delete(pk)
 
     async def update(
         self,
         pk: PK,
         data: t.Dict[str, t.Any],
     ) -> t.Union[Instance, Mapper]:
-        await self.access_hook()
+        await self._inner_access_hook()
 
         if not self.can_update:
             raise PermissionDenied
 
-        # in some cases when user can update instance but don't have access to
-        # all fields mapper will raise an error if inaccessible field is
-        # required (or pk field is hidden), to avoid it we fetch instance from
-        # db before that and merge with data which have been provided by user.
-        db_instance = await self.get_resource().get_one(pk)
-        data = {**db_instance.data.to_dict(), **data}
+        async with self.atomic():
+            # in some cases when user can update instance but don't have
+            # access to all fields mapper will raise an error if inaccessible
+            # field is required (or pk field is hidden), to avoid it we fetch
+            # instance from db before that and merge with data which have been
+            # provided by user.
+            db_instance = await self.get_resource().get_one(pk)
+            data = {**db_instance.data.to_dict(), **data}
 
-        data = await self.pre_update(data)
+            data = await self.pre_update(data)
 
-        mapper = self.mapper(data)
+            mapper = self.mapper(data)
 
-        if mapper.is_valid():
-            serialize_data = mapper.data
-            instance = Instance()
+            if mapper.is_valid():
+                serialize_data = mapper.data
+                instance = Instance()
 
-            if self.fields == '__all__':
-                instance.data = serialize_data
-            else:
-                # in this place we skip update of field which not present in
-                # fields list. This need for partial update of instance when
-                # update page don't have full list of fields
-                instance.data = {
-                    key: value for key, value in serialize_data.items()
-                    if key in self.fields
-                }
+                if self.fields == '__all__':
+                    instance.data = serialize_data
+                else:
+                    # in this place we skip update of field which not present
+                    # in fields list. This need for partial update of instance
+                    # when update page don't have full list of fields
+                    instance.data = {
+                        key: value for key, value in serialize_data.items()
+                        if key in self.fields
+                    }
 
-            instance = await self.get_resource().update(pk, instance)
-            await self.post_update(instance)
+                instance = await self.get_resource().update(pk, instance)
+                clear_data_loaders(self.get_resource())
+                await self.post_update(instance)
 
-            return instance
+                return instance
 
-        return mapper
+            return mapper
 
     async def create(
         self,
         data: t.Dict[str, t.Any],
     ) -> t.Union[Instance, Mapper]:
-        await self.access_hook()
+        await self._inner_access_hook()
 
         if not self.can_create:
             raise PermissionDenied
 
-        data = await self.pre_create(data)
+        async with self.atomic():
+            data = await self.pre_create(data)
+
+            mapper = self.mapper(data)
+
+            if mapper.is_valid(skip_primary=True):
+                serialize_data = mapper.data
+                instance = Instance()
+                instance.data = serialize_data
+
+                instance = await self.get_resource().create(instance)
+                clear_data_loaders(self.get_resource())
+
+                await self.post_create(instance)
+
+                return instance
+
+            return mapper
+
+    async def bulk_action(
+        self,
+        name: str,
+        pks: t.Optional[t.List[PK]] = None,
+        filters: t.Optional[FiltersType] = None,
+        data: t.Optional[t.Dict[str, t.Any]] = None,
+        confirm_all: bool = False,
+    ) -> int:
+        """
+        Apply the bulk action to instances with received primary keys or to
+        all instances which match received filters if primary keys are not
+        specified. Return count of affected instances.
+
+        The action is applied to all instances without filters only if the
+        `confirm_all` is True.
+
+        Raises:
+            BadParameters: if the action is unknown or received data is
+                invalid
+            PermissionDenied: if the action is not allowed
+        """
+        action = getattr(self, f'{name}_bulk_action', None)
+
+        if name not in self.bulk_actions or action is None:
+            raise BadParameters(f"Unknown bulk action `{name}`")
 
-        mapper = self.mapper(data)
+        if pks is not None and not pks:
+            raise BadParameters(
+                "Instances for the bulk action are not selected"
+            )
 
-        if mapper.is_valid(skip_primary=True):
-            serialize_data = mapper.data
-            instance = Instance()
-            instance.data = serialize_data
+        if pks is None and not filters and not confirm_all:
+            raise BadParameters(
+                "The bulk action for all instances must be confirmed"
+            )
 
-            instance = await self.get_resource().create(instance)
+        await self._inner_access_hook()
 
-            await self.post_create(instance)
+        async with self.atomic():
+            count = await action(pks, filters, data or {})
 
-            return instance
+        clear_data_loaders(self.get_resource())
 
-        return mapper
+        return count
+
+    async def delete_bulk_action(
+        self,
+        pks: t.Optional[t.List[PK]],
+        filters: t.Optional[FiltersType],
+        data: t.Dict[str, t.Any],
+    ) -> int:
+        """Delete selected instances by one query."""
+        if not self.can_delete:
+            raise PermissionDenied
+
+        # hooks of each instance need primary keys of all deleted instances
+        if pks is None and (
+            self._is_redefined('pre_delete')
+            or self._is_redefined('post_delete')
+        ):
+            pks = await self.get_bulk_pks(filters)
+            filters = None
+
+        await self.pre_bulk_delete(pks, filters)
+        count = await self.get_resource().delete_many(pks, filters=filters)
+        await self.post_bulk_delete(pks, filters)
+
+        return count
+
+    async def update_bulk_action(
+        self,
+        pks: t.Optional[t.List[PK]],
+        filters: t.Optional[FiltersType],
+        data: t.Dict[str, t.Any],
+    ) -> int:
+        """
+        Set the same values of fields for selected instances by one query.
+        Values are validated by fields of the mapper.
+        """
+        if not self.can_update:
+            raise PermissionDenied
+
+        values = await self.pre_bulk_update(
+            self.get_bulk_values(data),
+            pks,
+            filters,
+        )
+        count = await self.get_resource()\
+            .update_fields(values, pks, filters=filters)
+        await self.post_bulk_update(values, pks, filters)
+
+        return count
+
+    async def get_bulk_pks(
+        self,
+        filters: t.Optional[FiltersType],
+    ) -> t.List[PK]:
+        """Return primary keys of instances which match received filters."""
+        return [i.get_pk() async for i in self.get_resource().iterate(
+            filters=filters,
+        )]
+
+    @classmethod
+    def _is_redefined(cls, name: str) -> bool:
+        """Return True if the method is redefined by a subclass."""
+        return getattr(cls, name) is not getattr(Controller, name)
+
+    def get_bulk_values(self, data: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
+        """
+        Convert received raw values of fields to python values via fields of
+        the mapper.
+
+        Raises:
+            BadParameters: if a field can't be updated or a value is invalid
+        """
+        if not data:
+            raise BadParameters("Values for the bulk update are not specified")
+
+        mapper_fields = self.mapper(data).fields
+        values = {}
+
+        for name in data:
+            field = mapper_fields.get(name)
+
+            if (
+                field is None
+                or field.primary_key
+                or name in self.exclude_update_fields
+                or name in self.read_only_fields
+                or (self.fields != '__all__' and name not in self.fields)
+            ):
+                raise BadParameters(f"The field `{name}` can't be updated")
+
+            try:
+                field.is_valid()
+            except (ValidationError, TypeError, ValueError) as e:
+                raise BadParameters(
+                    f"The value of the `{name}` field is invalid: "
+                    f"{e.args[0] if e.args else 'Invalid'}"
+                )
+
+            values[name] = field.to_python()
+
+        return values
 
     async def get_detail(self, pk: PK):
-        await self.access_hook()
+        await self._inner_access_hook()
 
         if not self.can_view:
             raise PermissionDenied
@@ -254,55 +652,173 @@ class Controller:
 
         return data
 
-    async def prepare_instances(self, instances: t.List[Instance]):
+    async def prepare_instances(
+        self,
+        instances: t.List[Instance],
+        prefetch: t.Iterable[str] = (),
+    ):
         controller_maps = {}
 
         # relations to one
         for foreignkey_name, foreignkey in self.foreign_keys_map.items():
             controller_maps[foreignkey_name] = foreignkey.controller.builder()
 
+        batch = InstanceBatch.of([i for i in instances if i])
+
         def _get_relation(instance: Instance):
             async def get_relation(name: str) -> Instance:
                 controller = controller_maps.get(name)
                 foreign_key = self.foreign_keys_map.get(name)
-                cache = self.prefetch_cache.get(foreign_key.name)
+                cache = self.prefetch_cache[foreign_key.name]
                 relation_id = getattr(instance.data, foreign_key.field_name)
 
-                if cache:
-                    if relation_id in cache.keys():
-                        logger.debug(
-                            f"Get data from cache {foreign_key.field_name} "
-                            f"{relation_id}"
-                        )
-                        return cache.get(relation_id)
-
-                fetch_ids = [
-                    getattr(p.data, foreign_key.field_name)
-                    for p in instance.prefetch_together
-                ]
-
-                data = await controller.get_many(
-                    fetch_ids,
-                    field=foreign_key.target_field_name,
+                if relation_id is None:
+                    return None
+
+                if relation_id in cache:
+                    logger.debug(
+                        f"Get data from cache {foreign_key.field_name} "
+                        f"{relation_id}"
+                    )
+                    return cache.get(relation_id)
+
+                await instance.batch.load(
+                    foreign_key.name,
+                    lambda: self._load_relation(
+                        instance.batch,
+                        foreign_key,
+                        controller,
+                    ),
                 )
 
-                logger.debug(
-                    f"Fetch data {foreign_key.field_name} for {fetch_ids}"
-                )
-
-                self.prefetch_cache[foreign_key.name].update(data)
+                # the value has been changed after the batch was loaded
+                if relation_id not in cache:
+                    await self._load_relation(
+                        instance.batch,
+                        foreign_key,
+                        controller,
+                    )
 
-                return self.prefetch_cache[foreign_key.name].get(relation_id)
+                return cache.get(relation_id)
 
             return get_relation
 
-        for i in instances:
-            if i:
-                i.get_relation = _get_relation(i)
+        for i in batch:
+            i.set_relation_getter(_get_relation(i))
+
+        if prefetch:
+            await self.prefetch_relations(batch, prefetch)
+
+        # without the custom name instances keep names of resources which are
+        # computed only if they are needed
+        if self._is_redefined('get_object_name'):
+            for i in batch:
                 i.set_name(await self.get_object_name(i))
 
+    def _get_relation_ids(
+        self,
+        batch: InstanceBatch,
+        relation: "ToOneRelation",
+    ) -> t.List[PK]:
+        """
+        Return unique ids of relation for received batch which have not been
+        fetched yet.
+        """
+        cache = self.prefetch_cache[relation.name]
+
+        return [
+            value
+            for value in batch.get_values(relation.field_name)
+            if value not in cache
+        ]
+
+    async def _load_relation(
+        self,
+        batch: InstanceBatch,
+        relation: "ToOneRelation",
+        controller: "Controller",
+    ) -> None:
+        """
+        Fetch the relation to one for all instances of the batch by one
+        request and save it to the `prefetch_cache`.
+        """
+        ids = self._get_relation_ids(batch, relation)
+
+        if not ids:
+            return
+
+        data = await controller.get_many(
+            ids,
+            field=relation.target_field_name,
+        )
+
+        logger.debug(f"Fetch data {relation.field_name} for {ids}")
+
+        self.prefetch_cache[relation.name].update(data)
+
+    def get_list_fields(self) -> t.Optional[t.List[str]]:
+        """
+        Return names of fields which need to fetch for the list page or `None`
+        if all fields are needed.
+        """
+        if not self.list_projection:
+            return None
+
+        return list(dict.fromkeys([
+            *self.inline_fields,
+            *(relation.field_name for relation in self.relations_to_one),
+            *self.list_extra_fields,
+        ]))
+
+    def get_prefetch_relations(self) -> t.List[str]:
+        """
+        Return names of relations which need to fetch before build rows of the
+        list page.
+        """
+        if isinstance(self.eager_prefetch, (list, tuple)):
+            return list(self.eager_prefetch)
+
+        if not self.eager_prefetch:
+            return []
+
+        return [
+            relation.name
+            for relation in self.relations_to_one
+            if (
+                relation.name in self.inline_fields
+                or relation.field_name in self.inline_fields
+            )
+        ]
+
+    async def prefetch_relations(
+        self,
+        instances: t.Iterable[Instance],
+        names: t.Iterable[str],
+    ) -> None:
+        """
+        Fetch received relations to one for all instances concurrently. The
+        result is saved to the `prefetch_cache` so `get_relation` of instances
+        don't make requests to the storage.
+        """
+        batch = InstanceBatch.of([i for i in instances if i])
+
+        async def fetch(relation: "ToOneRelation") -> None:
+            await batch.load(
+                relation.name,
+                lambda: self._load_relation(
+                    batch,
+                    relation,
+                    relation.controller.builder(),
+                ),
+            )
+
+        await asyncio.gather(*[
+            fetch(self.foreign_keys_map[name])
+            for name in dict.fromkeys(names)
+        ])
+
     async def get_autocomplete_items(self, *, text: str, page: int):
-        await self.access_hook()
+        await self._inner_access_hook()
 
         if not self.can_view:
             raise PermissionDenied
@@ -354,6 +870,8 @@ class Controller:
                 return True
             elif name in ['id', 'pk']:
                 return True
+            elif self.get_resource().is_cursor_sortable(name):
+                return True
 
         return False
 
@@ -361,11 +879,11 @@ class Controller:
         self,
         url_builder,
         page: int = 1,
-        cursor: t.Optional[int] = None,
+        cursor: t.Optional[t.Union[int, str]] = None,
         order_by: t.Optional[str] = None,
         filters: t.Optional[FiltersType] = None,
     ):
-        await self.access_hook()
+        await self._inner_access_hook()
 
         if not self.can_view:
             raise PermissionDenied
@@ -376,57 +894,28 @@ class Controller:
             limit=self.per_page,
             order_by=order_by or self.order_by,
             filters=filters,
+            count_strategy=self.count_strategy,
+            fields=self.get_list_fields(),
         )
 
-        await self.prepare_instances(list_data.instances)
-
-        rows = []
-
-        for i in list_data.instances:
-            row = []
-
-            for index, field in enumerate(self.inline_fields):
-                field_method_name = "{}_field".format(field)
-                is_foreignkey = False
-                is_safe = False
+        await self.prepare_instances(
+            list_data.instances,
+            prefetch=self.get_prefetch_relations(),
+        )
 
-                if hasattr(self, field_method_name):
-                    getter = getattr(self, field_method_name)
-                    is_safe = \
-                        hasattr(getter, 'is_safe')\
-                        and getattr(getter, 'is_safe')
-                    value = await getter(i)
-                    if getattr(getter, 'is_foreignkey', False):
-                        is_foreignkey = True
-                else:
-                    value = getattr(i.data, field)
-
-                    if isinstance(value, Enum):
-                        value = value.value
-
-                url = None
-
-                if index == 0 and (self.can_update or self.can_view):
-                    url = url_builder(i, DETAIL_NAME)
-                elif is_foreignkey:
-                    foreign_key_controller = self.foreign_keys_map.get(field)\
-                        .controller.builder()
-                    if (
-                        (
-                            foreign_key_controller.can_update or
-                            foreign_key_controller.can_view
-                        ) and value
-                    ):
-                        url = url_builder(
-                            value,
-                            FOREIGNKEY_DETAIL_NAME,
-                            # todo: relation to one
-                            url_name=foreign_key_controller.url_name()
-                        )
+        instances = list_data.instances
+        rows = [[] for _ in instances]
 
-                row.append(Cell(value=value, is_safe=is_safe, url=url))
+        for index, column in enumerate(self.get_list_columns()):
+            cells = await self._get_column_cells(
+                column,
+                instances,
+                url_builder,
+                is_first=index == 0,
+            )
 
-            rows.append(row)
+            for row, cell in zip(rows, cells):
+                row.append(cell)
 
         return ListObject(
             rows=rows,
@@ -436,15 +925,262 @@ class Controller:
             active_page=list_data.active_page,
             per_page=list_data.per_page,
             next_id=list_data.next_id,
+            count_strategy=list_data.count_strategy,
+            pks=[i.get_pk() for i in list_data.instances],
         )
 
+    def get_list_columns(self) -> t.List[ListColumn]:
+        """
+        Return plans of columns of the list page. Plans are computed once for
+        each set of `inline_fields` of the controller class or for each call
+        if getters or relations are changed for the instance.
+        """
+        self._setup_instance()
+
+        if self._has_own_metadata:
+            return [
+                self._get_list_column(field)
+                for field in self.inline_fields
+            ]
+
+        fields = tuple(self.inline_fields)
+        columns = self._list_columns.get(fields)
+
+        if columns is None:
+            columns = self._list_columns[fields] = [
+                self._get_list_column(field)
+                for field in fields
+            ]
+
+        return columns
+
+    def _get_list_column(self, name: str) -> ListColumn:
+        getter_name = "{}_field".format(name)
+        getter = getattr(self, getter_name, None)
+
+        if getter is None:
+            return ListColumn(name=name)
+
+        relation = None
+
+        if getattr(getter, 'is_foreignkey', False):
+            relation = self.foreign_keys_field_map.get(name)
+
+        return ListColumn(
+            name=name,
+            getter=getter_name,
+            is_safe=bool(getattr(getter, 'is_safe', False)),
+            relation=relation,
+        )
+
+    async def _get_column_cells(
+        self,
+        column: ListColumn,
+        instances: t.List[Instance],
+        url_builder,
+        is_first: bool = False,
+    ) -> t.List[Cell]:
+        if column.relation:
+            # relations are taken from the prefetch cache or fetched for each
+            # instance if they are not prefetched (see `eager_prefetch`)
+            getter = getattr(self, column.getter)
+            values = [await getter(i) for i in instances]
+        elif column.getter:
+            # custom getters can make requests so they are awaited
+            # concurrently for all rows
+            getter = getattr(self, column.getter)
+            values = await asyncio.gather(*(getter(i) for i in instances))
+        else:
+            values = []
+
+            for i in instances:
+                value = getattr(i.data, column.name)
+
+                if isinstance(value, Enum):
+                    value = value.value
+
+                values.append(value)
+
+        is_safe = column.is_safe
+
+        if is_first and (self.can_update or self.can_view):
+            return [
+                Cell(
+                    value=value,
+                    is_safe=is_safe,
+                    url=url_builder(i, DETAIL_NAME),
+                )
+                for i, value in zip(instances, values)
+            ]
+
+        if column.relation:
+            controller = column.relation.controller.builder()
+
+            if controller.can_update or controller.can_view:
+                url_name = controller.url_name()
+
+                return [
+                    Cell(
+                        value=value,
+                        is_safe=is_safe,
+                        url=url_builder(
+                            value,
+                            FOREIGNKEY_DETAIL_NAME,
+                            # todo: relation to one
+                            url_name=url_name,
+                        ) if value else None,
+                    )
+                    for value in values
+                ]
+
+        return [
+            Cell(value=value, is_safe=is_safe, url=None)
+            for value in values
+        ]
+
+    def get_export_fields(self) -> t.Optional[t.List[str]]:
+        """
+        Return names of fields which need to export or `None` if all fields
+        of instances are needed.
+        """
+        if self.export_fields is not None:
+            return list(self.export_fields)
+
+        if self.mapper is None:
+            return None
+
+        return list(self.mapper({})._fields)
+
+    async def export(
+        self,
+        order_by: t.Optional[str] = None,
+        filters: t.Optional[FiltersType] = None,
+    ) -> t.AsyncIterator[Instance]:
+        """
+        Return iterator over all instances which match received filters. The
+        access is checked before the iteration, instances are fetched from the
+        resource by chunks of `export_chunk_size` instances.
+        """
+        await self._inner_access_hook()
+
+        if not self.can_view:
+            raise PermissionDenied
+
+        return self.get_resource().iterate(
+            order_by=order_by or self.order_by,
+            filters=filters,
+            fields=self.get_export_fields(),
+            chunk_size=self.export_chunk_size,
+        )
+
+    async def import_rows(
+        self,
+        rows: t.AsyncIterable[t.Dict[str, t.Any]],
+    ) -> ImportResult:
+        """
+        Validate received rows by the mapper and create valid rows. Rows are
+        consumed by batches of `import_batch_size` rows so the whole file is
+        not kept in memory, each batch is created by the `create_many` method
+        of the resource.
+        """
+        await self._inner_access_hook()
+
+        if not self.can_create:
+            raise PermissionDenied
+
+        started = time.monotonic()
+        total = created = invalid = 0
+        errors: t.List[ImportRowError] = []
+        batch: t.List[t.Dict[str, t.Any]] = []
+
+        async def flush() -> None:
+            nonlocal created, invalid
+
+            instances, batch_errors = await self.validate_import_batch(
+                batch,
+                first_row=total - len(batch) + 1,
+            )
+            invalid += len(batch_errors)
+            errors.extend(batch_errors[:self.import_max_errors - len(errors)])
+
+            if instances:
+                created += len(await self.import_instances(instances))
+
+            batch.clear()
+
+        async for row in rows:
+            total += 1
+            batch.append(row)
+
+            if len(batch) >= self.import_batch_size:
+                await flush()
+
+        if batch:
+            await flush()
+
+        return ImportResult(
+            total=total,
+            created=created,
+            invalid=invalid,
+            errors=errors,
+            duration=time.monotonic() - started,
+        )
+
+    async def validate_import_batch(
+        self,
+        rows: t.List[t.Dict[str, t.Any]],
+        first_row: int = 1,
+    ) -> t.Tuple[t.List[Instance], t.List[ImportRowError]]:
+        """
+        Validate rows of the imported file by the mapper and return instances
+        of valid rows together with errors of invalid rows.
+        """
+        result = self.mapper.validate_many(
+            [await self.pre_create(row) for row in rows],
+            skip_primary=True,
+        )
+        instances = []
+
+        for data in result.data:
+            if data is not None:
+                instance = Instance()
+                instance.data = data
+                instances.append(instance)
+
+        errors = []
+
+        for index, row_errors in result.errors.items():
+            error = row_errors.pop(NON_FIELD_ERRORS, [None])[0]
+            errors.append(ImportRowError(
+                row=first_row + index,
+                fields=row_errors,
+                error=error,
+            ))
+
+        return instances, errors
+
+    async def import_instances(
+        self,
+        instances: t.List[Instance],
+    ) -> t.List[Instance]:
+        """Create valid instances of one batch of the imported file."""
+        async with self.atomic():
+            created = await self.get_resource().create_many(instances)
+
+            for instance in created:
+                await self.post_create(instance)
+
+        clear_data_loaders(self.get_resource())
+
+        return created
+
     async def get_many(self, pks: t.List[PK], field: str = None):
-        await self.access_hook()
+        await self._inner_access_hook()
 
         if not self.can_view:
             raise PermissionDenied
 
-        data = await self.get_resource().get_many(pks, field=field)
+        data = await self.get_resource().load_many(pks, field=field)
         await self.prepare_instances(data.values())
 
         return data
@@ -458,13 +1194,19 @@ class Controller:
 
     @classmethod
     def builder(cls):
-        ctr_map = controllers_map.get() or {}
+        ctr_map = controllers_map.get()
+
+        if ctr_map is None:
+            ctr_map = {}
+            controllers_map.set(ctr_map)
+
         controller = ctr_map.get(cls)
 
         if not controller:
+            # the map is shared between concurrent access hooks of the same
+            # request so we need to update it in place
             controller = cls()
             ctr_map[cls] = controller
-            controllers_map.set(ctr_map)
 
         return controller
 
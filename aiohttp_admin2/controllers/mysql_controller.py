@@ -8,12 +8,13 @@ class MySQLController(PostgresController):
     resource = MySqlResource
 
     def get_resource(self) -> MySqlResource:
-        return self.resource(
+        resource = self.resource(
             self.connection_injector.connection,
             self.table,
-            custom_sort_list={
-                key.replace('_field_sort', ''): getattr(self, key)
-                for key in dir(self)
-                if key.endswith('_field_sort')
-            },
+            custom_sort_list=self.get_custom_sort_list(),
         )
+        # the injector is set after the creation of the resource because
+        # custom resources can redefine `__init__` without this argument
+        resource.connection_injector = self.connection_injector
+
+        return resource
@@ -0,0 +1,129 @@
+import time
+import typing as t
+from collections import OrderedDict
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from contextvars import ContextVar
+
+if t.TYPE_CHECKING:
+    from aiohttp_admin2.controllers.controller import Controller  # noqa
+
+
+__all__ = [
+    'PermissionCache',
+    'MemoryPermissionCache',
+    'access_identity',
+]
+
+
+# this context var need to specify identity of the current user (e.g. id of
+# the user or of his role) for the permission cache. Usually it set inside
+# the middleware after authentication
+AccessIdentity = ContextVar[t.Optional[t.Hashable]]
+access_identity: AccessIdentity = ContextVar('access_identity', default=None)
+
+PermissionKey = t.Tuple[t.Hashable, t.Type['Controller']]
+Permissions = t.Dict[str, t.Any]
+
+
+class PermissionCache(ABC):
+    """
+    This class describe interface of storage for results of the
+    `Controller.access_hook` method. Results are stored for each pair of user
+    identity and controller class.
+    """
+
+    @abstractmethod
+    async def get(self, key: PermissionKey) -> t.Optional[Permissions]:
+        """
+        Return permissions for received key or `None` if they are absent or
+        expired.
+        """
+
+    @abstractmethod
+    async def set(self, key: PermissionKey, permissions: Permissions) -> None:
+        """Save permissions for received key."""
+
+    @abstractmethod
+    async def invalidate(
+        self,
+        identity: t.Optional[t.Hashable] = None,
+        controller: t.Optional[t.Type['Controller']] = None,
+    ) -> None:
+        """
+        Drop saved permissions. If the identity or the controller is not
+        specified than permissions are dropped for all identities or for all
+        controllers respectively.
+        """
+
+
+class MemoryPermissionCache(PermissionCache):
+    """
+    The simple in-memory permission cache. Each record is stored no more than
+    `ttl` seconds and no more than `max_size` records are stored (the least
+    recently used records are dropped).
+
+    >>> permission_cache = MemoryPermissionCache(ttl=60, max_size=10000)
+    >>>
+    >>> class BookController(PostgresController):
+    >>>     permission_cache = permission_cache
+    >>>
+    >>> # drop permissions of a user after change of his role
+    >>> await permission_cache.invalidate(identity=user.id)
+    """
+
+    def __init__(self, ttl: float = 60, max_size: int = 10000) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        # records are ordered from the least recently used one
+        self._storage: t.Dict[PermissionKey, t.Tuple[float, Permissions]] = \
+            OrderedDict()
+
+    async def get(self, key: PermissionKey) -> t.Optional[Permissions]:
+        record = self._storage.get(key)
+
+        if record is None:
+            return None
+
+        expired_at, permissions = record
+
+        if expired_at <= time.monotonic():
+            self._storage.pop(key, None)
+            return None
+
+        self._storage.move_to_end(key)
+
+        return permissions
+
+    async def set(self, key: PermissionKey, permissions: Permissions) -> None:
+        now = time.monotonic()
+        self._storage[key] = (now + self.ttl, permissions)
+        self._storage.move_to_end(key)
+
+        # drop expired records of users which are not active anymore, they
+        # are at the beginning of the storage
+        while self._storage:
+            old_key, (expired_at, _) = next(iter(self._storage.items()))
+
+            if expired_at > now and len(self._storage) <= self.max_size:
+                break
+
+            del self._storage[old_key]
+
+    async def invalidate(
+        self,
+        identity: t.Optional[t.Hashable] = None,
+        controller: t.Optional[t.Type['Controller']] = None,
+    ) -> None:
+        for key in list(self._storage):
+            key_identity, key_controller = key
+
+            if identity is not None and key_identity != identity:
+                continue
+
+            if controller is not None and key_controller is not controller:
+                continue
+
+            self._storage.pop(key, None)
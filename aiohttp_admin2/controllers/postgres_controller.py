@@ -1,3 +1,5 @@
+import typing as t
+
 import sqlalchemy as sa
 
 from aiohttp_admin2.controllers.controller import Controller
@@ -29,13 +31,17 @@ class PostgresController(Controller):
 
             cls.mapper = Mapper
 
+    def atomic(self) -> t.AsyncContextManager[None]:
+        return self.connection_injector.pin(transaction=True)
+
     def get_resource(self) -> PostgresResource:
-        return self.resource(
+        resource = self.resource(
             self.connection_injector.connection,
             self.table,
-            custom_sort_list={
-                key.replace('_field_sort', ''): getattr(self, key)
-                for key in dir(self)
-                if key.endswith('_field_sort')
-            },
+            custom_sort_list=self.get_custom_sort_list(),
         )
+        # the injector is set after the creation of the resource because
+        # custom resources can redefine `__init__` without this argument
+        resource.connection_injector = self.connection_injector
+
+        return resource
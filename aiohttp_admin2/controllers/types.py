@@ -1,6 +1,18 @@
 import typing as t
 
-__all__ = ["Cell", "ListObject", ]
+from aiohttp_admin2.resources.types import CountStrategy
+from aiohttp_admin2.resources.types import PK
+
+if t.TYPE_CHECKING:
+    from aiohttp_admin2.controllers.relations import ToOneRelation  # noqa
+
+__all__ = [
+    "Cell",
+    "ListColumn",
+    "ListObject",
+    "ImportRowError",
+    "ImportResult",
+]
 
 
 class Cell(t.NamedTuple):
@@ -10,6 +22,17 @@ class Cell(t.NamedTuple):
     is_safe: bool = False
 
 
+class ListColumn(t.NamedTuple):
+    """Plan to render cells of the column of the list page"""
+    name: str
+    # name of the `<name>_field` method of the controller or `None` if the
+    # value is taken from the instance
+    getter: t.Optional[str] = None
+    is_safe: bool = False
+    # relation to one if the value of the column is a foreign key
+    relation: t.Optional["ToOneRelation"] = None
+
+
 class ListObject(t.NamedTuple):
     rows: t.List[t.List[Cell]]
     has_next: bool
@@ -17,4 +40,32 @@ class ListObject(t.NamedTuple):
     count: t.Optional[int]
     active_page: t.Optional[int]
     per_page: int
-    next_id: t.Optional[int]
+    next_id: t.Optional[t.Union[int, str]]
+    count_strategy: CountStrategy = CountStrategy.EXACT
+    # primary keys of instances of rows
+    pks: t.Optional[t.List[PK]] = None
+
+
+class ImportRowError(t.NamedTuple):
+    """Errors of the invalid row of the imported file"""
+    # number of the row in the file (the header is not counted)
+    row: int
+    fields: t.Dict[str, t.List[str]]
+    error: t.Optional[str] = None
+
+
+class ImportResult(t.NamedTuple):
+    total: int
+    created: int
+    invalid: int
+    # only first `import_max_errors` errors of the controller are kept
+    errors: t.List[ImportRowError]
+    # duration of the import in seconds
+    duration: float
+
+    @property
+    def rows_per_second(self) -> float:
+        if not self.duration:
+            return float(self.total)
+
+        return self.total / self.duration
@@ -5,7 +5,19 @@ from aiohttp_admin2.mappers.exceptions import ValidationError
 from aiohttp_admin2.mappers.exceptions import MapperError
 
 
-__all__ = ['Mapper', ]
+__all__ = ['Mapper', 'BatchValidation', 'NON_FIELD_ERRORS', ]
+
+
+# the key of errors of the `validation` method in the map of errors
+NON_FIELD_ERRORS = '__all__'
+
+
+class BatchValidation(t.NamedTuple):
+    """Result of the validation of many rows by the mapper"""
+    # serialized data of each row or `None` if the row is invalid
+    data: t.List[t.Optional[t.Dict[str, t.Any]]]
+    # map of indexes of invalid rows to errors of their fields
+    errors: t.Dict[int, t.Dict[str, t.List[str]]]
 
 
 class MapperMeta(type):
@@ -46,7 +58,8 @@ class Mapper(metaclass=MapperMeta):
         self.with_errors = False
         self.error: t.Optional[str] = None
         self._data = data
-        self._fields = self._fields or {}
+        # bound fields are never shared between mappers
+        self._fields = {}
         self._fields_after_validation = []
         for field in self._fields_cls:
             new_field = field(data.get(field.name))
@@ -109,8 +122,6 @@ class Mapper(metaclass=MapperMeta):
         If we set `skip_primary` to `True` then a mapper will not to check the
         primary key field.
         """
-        is_valid = True
-
         if self._pass_validation:
             # if we'll call is_valid method more than once with wrong data
             # than errors will duplicate
@@ -119,19 +130,41 @@ class Mapper(metaclass=MapperMeta):
                 "the mapper object"
             )
 
-        for f in self.fields.values():
+        validators = self._get_validators(skip_primary)
+        self._fields_after_validation = [f for f, _ in validators]
+        is_valid = self._validate(validators)
+
+        self.with_errors = not is_valid
+        self._pass_validation = True
 
-            if skip_primary and f.primary_key:
-                continue
+        return is_valid
 
-            self._fields_after_validation.append(f)
+    def _get_validators(
+        self,
+        skip_primary: bool = False,
+    ) -> t.List[t.Tuple[AbstractField, t.Optional[t.Callable]]]:
+        """
+        Return fields which need to validate together with their custom
+        validators (the `validation_<name>` methods).
+        """
+        return [
+            (f, getattr(self, f'validation_{f.name}', None))
+            for f in self.fields.values()
+            if not (skip_primary and f.primary_key)
+        ]
+
+    def _validate(
+        self,
+        validators: t.List[t.Tuple[AbstractField, t.Optional[t.Callable]]],
+    ) -> bool:
+        is_valid = True
 
+        for f, validator in validators:
             f.apply_default_if_need()
             try:
                 f.is_valid()
-                validator_name = f'validation_{f.name}'
-                if hasattr(self, validator_name):
-                    getattr(self, validator_name)(f.to_python())
+                if validator is not None:
+                    validator(f.to_python())
             except (ValidationError, TypeError) as e:
                 is_valid = False
                 if len(e.args):
@@ -149,10 +182,70 @@ class Mapper(metaclass=MapperMeta):
                 if not self.error:
                     self.error = 'Invalid'
 
-        self.with_errors = not is_valid
-        self._pass_validation = True
-
         return is_valid
 
+    @property
+    def errors(self) -> t.Dict[str, t.List[str]]:
+        """
+        Return errors of fields, the error of the `validation` method is
+        returned by the `NON_FIELD_ERRORS` key.
+        """
+        errors = {
+            name: list(field.errors)
+            for name, field in self.fields.items()
+            if field.errors
+        }
+
+        if self.error:
+            errors[NON_FIELD_ERRORS] = [self.error]
+
+        return errors
+
+    @classmethod
+    def validate_many(
+        cls,
+        rows: t.Iterable[t.Dict[str, t.Any]],
+        skip_primary: bool = False,
+    ) -> BatchValidation:
+        """
+        Validate many rows in the same way as the `is_valid` method but
+        without creation of a mapper and its fields for each row. Fields of
+        one mapper are bound to values of each row in turn, so converters and
+        validators are reused for all rows.
+
+        >>> result = BookMapper.validate_many([
+        >>>     {"title": "first", "pages": "10"},
+        >>>     {"title": "second", "pages": "many"},
+        >>> ])
+        >>> result.data
+        [{'title': 'first', 'pages': 10}, None]
+        >>> result.errors
+        {1: {'pages': ['Incorrect value for Int field. many']}}
+        """
+        mapper = cls({})
+        validators = mapper._get_validators(skip_primary)
+        mapper._fields_after_validation = [f for f, _ in validators]
+        fields = list(mapper.fields.values())
+        data = []
+        errors = {}
+
+        for index, row in enumerate(rows):
+            mapper._data = row
+            mapper.error = None
+
+            for f in fields:
+                f.set_value(row.get(f.name))
+
+            if mapper._validate(validators):
+                data.append({
+                    f.name: f.to_python()
+                    for f in mapper._fields_after_validation
+                })
+            else:
+                data.append(None)
+                errors[index] = mapper.errors
+
+        return BatchValidation(data=data, errors=errors)
+
     def __repr__(self):
         return f'{self.__class__.__name__}()'
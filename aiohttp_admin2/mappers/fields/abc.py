@@ -9,7 +9,40 @@ __all__ = ['AbstractField', ]
 
 
 class AbstractField(ABC):
+    """
+    Fields which are declared in the mapper class are templates. The mapper
+    binds a template to a value via the call of the template which returns a
+    shallow copy of it, so settings and validators of the template are shared
+    between all bound fields and are not computed again for each mapper.
+    """
+    __slots__ = (
+        'name',
+        'default',
+        '_value',
+        'errors',
+        'required',
+        'validators',
+        'kwargs',
+        'primary_key',
+    )
+
     type_name: str = 'string'
+    # names of slots of subclasses which are copied to bound fields
+    _extra_slots: t.Tuple[str, ...] = ()
+    # instances of subclasses without `__slots__` have the `__dict__`
+    _with_dict: bool = False
+
+    def __init_subclass__(cls, **kwargs: t.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        classes = cls.__mro__[:cls.__mro__.index(AbstractField)]
+        cls._extra_slots = tuple(
+            name
+            for klass in reversed(classes)
+            for name in klass.__dict__.get('__slots__', ())
+            if name not in ('__dict__', '__weakref__')
+        )
+        cls._with_dict = \
+            any('__slots__' not in klass.__dict__ for klass in classes)
 
     def __init__(
         self,
@@ -21,11 +54,14 @@ class AbstractField(ABC):
         primary_key: bool = False,
         **kwargs: t.Any,
     ) -> None:
+        self.name: t.Optional[str] = None
         self.default: t.Optional[str] = default
         self._value: t.Optional[str] = value
         self.errors: t.List[t.Optional[str]] = []
         self.required = required
-        self.validators = validators or []
+        # the list of received validators is copied so default validators are
+        # not added to the list which is shared with other fields
+        self.validators = list(validators or [])
         self.kwargs = kwargs
         self.primary_key = primary_key
         self.init_default_validators()
@@ -107,13 +143,32 @@ class AbstractField(ABC):
         return True
 
     def __call__(self, value: t.Any) -> "AbstractField":
-        return self.__class__(
-            required=self.required,
-            validators=self.validators,
-            default=self.default,
-            primary_key=self.primary_key,
-            value=value
-        )
+        """Return a copy of the current field bound to received value."""
+        field = object.__new__(self.__class__)
+        field.name = self.name
+        field.default = self.default
+        field._value = value
+        field.errors = []
+        field.required = self.required
+        field.validators = self.validators
+        field.kwargs = self.kwargs
+        field.primary_key = self.primary_key
+
+        for name in self._extra_slots:
+            setattr(field, name, getattr(self, name))
+
+        if self._with_dict:
+            field.__dict__.update(self.__dict__)
+
+        return field
+
+    def set_value(self, value: t.Any) -> None:
+        """
+        Bind the current field to the new value in place and drop errors of
+        the previous value. It allows to validate many values by one field.
+        """
+        self._value = value
+        self.errors.clear()
 
     def __repr__(self):
         return \
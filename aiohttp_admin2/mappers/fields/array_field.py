@@ -20,6 +20,8 @@ class ArrayField(AbstractField):
     you need to specify `field_cls` which describe type of elements inside an
     array.
     """
+    __slots__ = ('field_cls', 'field', )
+
     type_name: str = 'array'
 
     def __init__(
@@ -74,16 +76,6 @@ class ArrayField(AbstractField):
                 return self._value.split(',')
         return self._value
 
-    def __call__(self, value: t.Any) -> "AbstractField":
-        return self.__class__(
-            field_cls=self.field_cls,
-            required=self.required,
-            validators=self.validators,
-            default=self.default,
-            primary_key=self.primary_key,
-            value=value
-        )
-
     def __repr__(self):
         return \
             f"{self.__class__.__name__}(name={self.type_name}," \
@@ -17,6 +17,8 @@ class BooleanField(AbstractField):
     this fields convert any value which is not contains in `false_values` list
     to `True` and to `False` in other case.
     """
+    __slots__ = ()
+
     type_name: str = 'boolean'
     false_values = ['0', 'false', 'f', '', 'none']
 
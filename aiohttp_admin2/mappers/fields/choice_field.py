@@ -35,8 +35,12 @@ class ChoicesField(AbstractField):
     you need to specify `field_cls` which describe type of field. By default
     it's a `StringField`.
     """
+    __slots__ = ('field_cls', 'field', 'choices', '_empty_value', )
+
     type_name: str = 'choice'
-    empty_value: str = '-- empty --'
+    # the label of the empty option if the `empty_value` param is not
+    # specified
+    default_empty_value: str = '-- empty --'
     field: AbstractField
 
     def __init__(
@@ -51,12 +55,18 @@ class ChoicesField(AbstractField):
         self.field_cls = field_cls
         # todo: if field_cls is object
         self.field = field_cls(**kwargs)
-        self.empty_value = \
-            self.empty_value if empty_value is None else empty_value
+        self._empty_value = empty_value
         self.choices = choices
         self.default = kwargs.get('default')
         self._choice_validation(choices)
 
+    @property
+    def empty_value(self) -> str:
+        if self._empty_value is None:
+            return self.default_empty_value
+
+        return self._empty_value
+
     def to_python(self) -> t.Optional[bool]:
         value = self.field.to_python()
 
@@ -97,18 +107,21 @@ class ChoicesField(AbstractField):
                 f"received {choices}."
             )
 
+    def set_value(self, value: t.Any) -> None:
+        if hasattr(value, 'name'):
+            # handle enum case
+            value = value.name
+
+        super().set_value(value)
+        self.field.set_value(value)
+
     def __call__(self, value: t.Any) -> AbstractField:
 
         if hasattr(value, 'name'):
             # handle enum case
             value = value.name
 
-        return self.__class__(
-            required=self.required,
-            validators=self.validators,
-            value=value,
-            default=self.default,
-            field_cls=self.field_cls,
-            choices=self.choices,
-            primary_key=self.primary_key,
-        )
+        field = super().__call__(value)
+        field.field = self.field(value)
+
+        return field
@@ -19,6 +19,8 @@ class DateTimeField(AbstractField):
     >>> class Mapper(Mapper):
     >>>     field = fields.DateTimeField()
     """
+    __slots__ = ()
+
     type_name: str = 'datetime'
 
     def to_python(self) -> datetime:
@@ -41,6 +43,8 @@ class DateField(AbstractField):
     >>> class Mapper(Mapper):
     >>>     field = fields.DateField()
     """
+    __slots__ = ()
+
     type_name: str = 'date'
 
     def to_python(self) -> date:
@@ -10,6 +10,8 @@ class FloatField(AbstractField):
     """
     Simple representation of float type.
     """
+    __slots__ = ()
+
     type_name: str = 'float'
 
     def to_python(self) -> t.Optional[float]:
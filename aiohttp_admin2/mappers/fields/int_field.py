@@ -10,6 +10,8 @@ class IntField(AbstractField):
     """
     Simple representation of float type.
     """
+    __slots__ = ()
+
     type_name: str = 'int'
 
     def to_python(self) -> t.Optional[int]:
@@ -28,6 +30,8 @@ class SmallIntField(IntField):
     Simple representation of float type but with additional validation related
     with long of integer (only for int from MIN_INT to MAX_INT).
     """
+    __slots__ = ()
+
     type_name: str = 'small_int'
     MAX_INT = 32_767
     MIN_INT = -32_768
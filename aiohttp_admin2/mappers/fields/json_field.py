@@ -8,6 +8,8 @@ __all__ = ["JsonField", ]
 
 
 class JsonField(AbstractField):
+    __slots__ = ()
+
     type_name: str = 'json'
 
     def to_python(self) -> t.Optional[t.Dict[str, t.Any]]:
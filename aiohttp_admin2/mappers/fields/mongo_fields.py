@@ -10,6 +10,8 @@ class ObjectIdField(AbstractField):
     """
     Represent type of id in mongo db.
     """
+    __slots__ = ()
+
     type_name: str = 'string'
 
     def to_python(self) -> str:
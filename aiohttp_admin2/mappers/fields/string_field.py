@@ -9,6 +9,8 @@ class StringField(AbstractField):
     """
     This class represent simple string type.
     """
+    __slots__ = ()
+
     type_name: str = 'string'
 
     def to_python(self) -> t.Optional[str]:
@@ -20,4 +22,6 @@ class LongStringField(StringField):
     This class represent simple string type but have different representation
     in the admin interface (more space for text).
     """
+    __slots__ = ()
+
     type_name: str = 'string_long'
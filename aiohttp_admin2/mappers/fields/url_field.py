@@ -17,6 +17,8 @@ class UrlField(StringField):
     This class is wrapper on `StringField` that can validate correct url
     address.
     """
+    __slots__ = ()
+
     type_name: str = 'url'
 
     URL_REGEXP = re.compile(
@@ -46,6 +48,8 @@ class UrlFileField(UrlField):
     This class just need to change visual representation in admin interface of
     field which contains url to the file.
     """
+    __slots__ = ()
+
     type_name: str = 'url_file'
 
     def to_python(self) -> t.Optional[str]:
@@ -60,6 +64,8 @@ class UrlImageField(UrlField):
     This class just need to change visual representation in admin interface of
     field which contains url to the image.
     """
+    __slots__ = ()
+
     type_name: str = 'url_file_image'
 
     def to_python(self) -> t.Optional[str]:
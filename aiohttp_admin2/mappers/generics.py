@@ -1,20 +1,80 @@
+import typing as t
+import weakref
+
 import sqlalchemy as sa
 import umongo
 
 from marshmallow import EXCLUDE
+from marshmallow import Schema
 from marshmallow.exceptions import ValidationError as MarshmallowValidationErr
 from aiohttp_admin2.mappers.base import Mapper
 from aiohttp_admin2.mappers import fields
 from aiohttp_admin2.mappers.fields import mongo_fields
 from aiohttp_admin2.mappers.exceptions import ValidationError
+from aiohttp_admin2.mappers.fields.abc import AbstractField
 
 
 __all__ = [
     "PostgresMapperGeneric",
     "MongoMapperGeneric",
+    "get_marshmallow_schema",
 ]
 
 
+FieldsMap = t.Dict[str, AbstractField]
+
+# fields generated for tables and documents. A mapper is generated for each
+# controller so fields of the same table are generated only once, generated
+# fields are templates which are never changed so mappers can share them.
+_generated_fields: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_marshmallow_schemas: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def get_marshmallow_schema(table: umongo.Document) -> Schema:
+    """
+    Return the marshmallow schema of the umongo document. The schema is
+    created only once for each document.
+    """
+    schema = _marshmallow_schemas.get(table)
+
+    if schema is None:
+        schema = table.schema.as_marshmallow_schema()()
+        _marshmallow_schemas[table] = schema
+
+    return schema
+
+
+def get_generated_fields(mapper_cls: t.Any, table: t.Any) -> FieldsMap:
+    """
+    Return fields which are generated by the generic mapper for received
+    table. Fields are generated once for each table, each map of types and
+    each implementation of the `generate_fields` method. A redefined method
+    can depend on any attribute of the class so its fields are cached for
+    the class.
+    """
+    generate_fields = mapper_cls.generate_fields.__func__
+    key = (
+        generate_fields,
+        tuple(mapper_cls.FIELDS_MAPPER.items()),
+        mapper_cls.DEFAULT_FIELD,
+    )
+
+    if generate_fields not in (
+        PostgresMapperGeneric.generate_fields.__func__,
+        MongoMapperGeneric.generate_fields.__func__,
+    ):
+        key = (*key, mapper_cls)
+
+    fields_by_types = _generated_fields.setdefault(table, {})
+    generated = fields_by_types.get(key)
+
+    if generated is None:
+        generated = mapper_cls.generate_fields(table)
+        fields_by_types[key] = generated
+
+    return generated
+
+
 class PostgresMapperGeneric(Mapper):
     """
     This class need for generate Mapper from sqlAlchemy's model.
@@ -40,7 +100,16 @@ class PostgresMapperGeneric(Mapper):
         super().__init_subclass__()
         cls._fields = {}
 
-        existing_fields = [field.name for field in cls._fields_cls]
+        existing_fields = {field.name for field in cls._fields_cls}
+
+        for name, field in get_generated_fields(cls, table).items():
+            if name not in existing_fields:
+                cls._fields[name] = field
+                cls._fields_cls.append(field)
+
+    @classmethod
+    def generate_fields(cls, table: sa.Table) -> FieldsMap:
+        generated = {}
 
         for name, column in table.columns.items():
             field_cls = \
@@ -70,9 +139,9 @@ class PostgresMapperGeneric(Mapper):
                 field = field_cls(**field_kwargs)
 
             field.name = name
-            if name not in existing_fields:
-                cls._fields[name] = field
-                cls._fields_cls.append(field)
+            generated[name] = field
+
+        return generated
 
 
 class MongoMapperGeneric(Mapper):
@@ -95,15 +164,24 @@ class MongoMapperGeneric(Mapper):
         cls._fields = {}
         cls.table = table
 
-        existing_fields = [field.name for field in cls._fields_cls]
+        existing_fields = {field.name for field in cls._fields_cls}
+
+        for name, field in get_generated_fields(cls, table).items():
+            if name not in existing_fields:
+                cls._fields_cls.append(field)
+                cls._fields[name] = field
+
+    @classmethod
+    def generate_fields(cls, table: umongo.Document) -> FieldsMap:
+        generated = {}
 
         for name, column in table.schema.fields.items():
             field = \
                 cls.FIELDS_MAPPER.get(type(column), cls.DEFAULT_FIELD)()
             field.name = name
-            if name not in existing_fields:
-                cls._fields_cls.append(field)
-                cls._fields[name] = field
+            generated[name] = field
+
+        return generated
 
     def validation(self):
         """
@@ -120,7 +198,7 @@ class MongoMapperGeneric(Mapper):
             # mapper may have additional fields which are not specify in the
             # schema so we need to skip validation of fields which are not
             # exist in the schema
-            self.table.schema.as_marshmallow_schema()().load(
+            get_marshmallow_schema(self.table).load(
                 self.raw_data,
                 unknown=EXCLUDE,
             )
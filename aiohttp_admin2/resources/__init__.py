@@ -5,3 +5,4 @@ from aiohttp_admin2.resources.mongo_resource.mongo_resource import MongoResource
 from aiohttp_admin2.resources.mysql_resource.mysql_resource import MySqlResource
 from aiohttp_admin2.resources.dict_resource.dict_resource import DictResource
 from aiohttp_admin2.resources.abc import Instance
+from aiohttp_admin2.resources.abc import InstanceBatch
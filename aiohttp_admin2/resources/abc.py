@@ -1,19 +1,26 @@
+import asyncio
+import time
 import typing as t
+from enum import Enum
 from abc import (
     ABC,
     abstractmethod,
 )
 
+from aiohttp_admin2.resources.data_loader import DataLoader
 from aiohttp_admin2.resources.exceptions import (
     FilterException,
     BadParameters,
+    InstanceDoesNotExist,
 )
 from aiohttp_admin2.exceptions import AdminException
 
 
 __all__ = [
     'AbstractResource',
+    'Data',
     'Instance',
+    'InstanceBatch',
     'InstanceMapper',
     'Paginator',
     'ABCFilter',
@@ -21,6 +28,7 @@ __all__ = [
     'FilterTuple',
     'FiltersType',
     'FilterMultiTuple',
+    'CountStrategy',
 ]
 
 
@@ -42,6 +50,15 @@ class ABCFilter(ABC):
 
     @property
     def query(self) -> t.Any:
+        self.check_is_valid()
+
+        return self.apply()
+
+    def check_is_valid(self) -> None:
+        """
+        Call the `validate` method and raise `FilterException` if the filter
+        is invalid.
+        """
         try:
             self.validate()
         except Exception as e:
@@ -52,8 +69,6 @@ class ABCFilter(ABC):
 
             raise FilterException(msg)
 
-        return self.apply()
-
 
 class FilterTuple(t.NamedTuple):
     column_name: str
@@ -70,56 +85,299 @@ class FilterMultiTuple(t.NamedTuple):
 FiltersType = t.List[FilterTuple]
 
 
+class CountStrategy(str, Enum):
+    """Ways to get a total count of instances for the list page."""
+    # count of all instances which match filters
+    EXACT = 'exact'
+    # fast approximate count from statistics of a storage
+    ESTIMATED = 'estimated'
+    # exact count but no more than `count_cap`
+    CAPPED = 'capped'
+    # exact count which is cached for `count_cache_ttl` seconds
+    CACHED = 'cached'
+    # the count is not calculated (e.g. to iterate over instances), it can't
+    # be used for the list page with the pagination bar
+    NONE = 'none'
+
+
+# storage for counts of the `CountStrategy.CACHED` strategy, it's shared
+# between all resources because they can be created for each request
+_counts_cache: t.Dict[t.Hashable, t.Tuple[float, int]] = {}
+
+
 class Data:
+    """
+    Fields of the instance. Fields of the row of the storage are not copied:
+    the received dict is used as `__dict__` of the object and other rows
+    (e.g. rows of the driver) are wrapped. Fields which are received from
+    the storage but are not fields of the instance (e.g. the total count of
+    the list page) are specified by `exclude`.
+
+    Changed fields of the wrapped row are kept separately till the row is
+    converted to the dict.
+
+    >>> data = Data({"id": 1, "name": "Bob"})
+    >>> data.name == data['name']
+    True
+    """
+    __slots__ = ('__dict__', '_row', '_exclude', '_source')
+
+    def __init__(
+        self,
+        row: t.Mapping[str, t.Any],
+        exclude: t.Collection[str] = (),
+    ) -> None:
+        if type(row) is dict and not exclude:
+            self.__dict__ = row
+            self._row = None
+        else:
+            self._row = row
+
+        self._exclude = exclude
+        # the received row is kept after the conversion to the dict
+        self._source = row
+
+    def __getattr__(self, name: str) -> t.Any:
+        # it's called only if the field is not in the `__dict__`
+        row = self._row
+
+        if row is not None and name not in self._exclude:
+            try:
+                return row[name]
+            except KeyError:
+                pass
+
+        raise AttributeError(name)
+
+    def __getitem__(self, name: str) -> t.Any:
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.__dict__ or (
+            self._row is not None
+            and name not in self._exclude
+            and name in self._row
+        )
+
+    def __reduce__(self) -> t.Tuple[t.Any, ...]:
+        # the copy uses the same row
+        if self._row is None or self.__dict__:
+            return Data, (self.to_dict(), )
+
+        return Data, (self._row, self._exclude)
+
+    def __repr__(self) -> str:
+        return f'Data({self._fields()!r})'
+
+    def _fields(self) -> t.Dict[str, t.Any]:
+        if self._row is None:
+            return self.__dict__
+
+        return {
+            **{
+                key: value
+                for key, value in self._row.items()
+                if key not in self._exclude
+            },
+            **self.__dict__,
+        }
+
+    def to_row(self) -> t.Mapping[str, t.Any]:
+        """
+        Return the row which is received from the storage (e.g. the row of
+        the driver even after the conversion to the dict).
+        """
+        return self._source
+
+    def to_dict(self) -> t.Dict[str, t.Any]:
+        """
+        Return fields as the dict. The dict is shared with the object so
+        changes of the dict change fields of the instance.
+        """
+        if self._row is not None:
+            self.__dict__ = self._fields()
+            self._row = None
+            self._exclude = ()
 
-    def to_dict(self):
         return self.__dict__
 
 
 class Instance:
     """Object from represent all data connected with instance."""
+    __slots__ = (
+        '_data',
+        '_name',
+        '_name_getter',
+        '_batch',
+        '_relation_getter',
+    )
+
     pk: PK
-    _name: str = None
-    _prefetch_together: t.List["Instance"] = []
-    _data = None
 
     def __init__(self, name: str = None) -> None:
+        self._data = None
         self._name = name
+        # function which returns the name of the instance, the name is
+        # computed only when it's needed
+        self._name_getter: t.Optional[t.Callable[["Instance"], str]] = None
+        self._batch: t.Optional["InstanceBatch"] = None
+        self._relation_getter: t.Optional[
+            t.Callable[[str], t.Awaitable[t.Optional["Instance"]]]
+        ] = None
 
     @property
-    def data(self) -> t.Optional[object]:
+    def data(self) -> t.Optional[Data]:
         return self._data
 
     @data.setter
-    def data(self, data: t.Dict[str, t.Any]) -> None:
-        obj = Data()
-        obj.__dict__ = data
-        self._data = obj
+    def data(self, data: t.Union[Data, t.Mapping[str, t.Any]]) -> None:
+        self._data = data if isinstance(data, Data) else Data(data)
 
     def __repr__(self) -> str:
+        if self._name is None and self._name_getter is not None:
+            self._name = self._name_getter(self)
+
         return self._name or str(self.data)
 
     def set_name(self, name: str) -> None:
         self._name = name
 
+    def set_name_getter(self, getter: t.Callable[["Instance"], str]) -> None:
+        """Set the function which computes the name on the first use."""
+        self._name = None
+        self._name_getter = getter
+
+    def copy(self) -> "Instance":
+        """
+        Return the new instance with the same fields. Names, relations and
+        the batch which are set by controllers are not copied.
+        """
+        instance = Instance(self._name)
+        instance._data = self._data
+        instance._name_getter = self._name_getter
+
+        return instance
+
     def get_pk(self) -> PK:
-        if hasattr(self.data, 'pk'):
-            return self.data.pk
+        fields = self._data
+
+        if fields is not None:
+            if 'pk' in fields:
+                return fields['pk']
 
-        if hasattr(self.data, 'id'):
-            return self.data.id
+            if 'id' in fields:
+                return fields['id']
 
         raise AdminException("Instance must have id")
 
+    @property
+    def batch(self) -> t.Optional["InstanceBatch"]:
+        """The batch of instances which have been fetched together."""
+        return self._batch
+
     @property
     def prefetch_together(self) -> t.List["Instance"]:
-        if self._prefetch_together:
-            return self._prefetch_together
+        if self._batch is not None:
+            return self._batch.instances
 
         return [self]
 
+    def set_relation_getter(
+        self,
+        getter: t.Callable[[str], t.Awaitable[t.Optional["Instance"]]],
+    ) -> None:
+        """Set the function which returns related instances by names."""
+        self._relation_getter = getter
+
     def get_relation(self, name: str) -> t.Optional["Instance"]:
-        return None
+        if self._relation_getter is None:
+            return None
+
+        return self._relation_getter(name)
+
+
+class InstanceBatch:
+    """
+    Instances which have been fetched by one query. Relations of all
+    instances of the batch are fetched together by one query for each
+    relation.
+
+    >>> batch = InstanceBatch(instances)
+    >>> batch.get_values('author_id')
+    [1, 2]
+    >>> await batch.load('author', fetch_authors)
+    """
+    __slots__ = ('instances', '_loads')
+
+    def __init__(self, instances: t.Iterable[Instance] = ()) -> None:
+        self.instances: t.List[Instance] = []
+        self._loads: t.Dict[str, asyncio.Future] = {}
+
+        for instance in instances:
+            self.append(instance)
+
+    def __iter__(self) -> t.Iterator[Instance]:
+        return iter(self.instances)
+
+    def __len__(self) -> int:
+        return len(self.instances)
+
+    def append(self, instance: Instance) -> None:
+        instance._batch = self
+        self.instances.append(instance)
+
+    @classmethod
+    def of(cls, instances: t.List[Instance]) -> "InstanceBatch":
+        """
+        Return the batch which contains all received instances. If instances
+        are from different batches then they are moved to a new batch.
+        """
+        batch = instances[0].batch if instances else None
+
+        if batch is None or any(i.batch is not batch for i in instances):
+            batch = cls(instances)
+
+        return batch
+
+    def get_column(self, field: str) -> t.List[t.Any]:
+        """Return values of received field of all instances."""
+        return [getattr(i.data, field, None) for i in self.instances]
+
+    def get_values(self, field: str) -> t.List[t.Any]:
+        """Return unique values of received field without `None`."""
+        return [
+            value
+            for value in dict.fromkeys(self.get_column(field))
+            if value is not None
+        ]
+
+    async def load(
+        self,
+        key: str,
+        loader: t.Callable[[], t.Awaitable[None]],
+    ) -> None:
+        """
+        Call received loader only once for the key (e.g. the name of the
+        relation). Concurrent calls wait for the same call of the loader and
+        the failed call is repeated by the next one.
+        """
+        future = self._loads.get(key)
+
+        if future is None:
+            future = self._loads[key] = asyncio.ensure_future(loader())
+
+        try:
+            # a cancellation of the current call must not cancel the loader
+            # which is shared with other calls
+            await asyncio.shield(future)
+        except Exception:
+            if future.done() and self._loads.get(key) is future:
+                del self._loads[key]
+
+            raise
 
 
 class Paginator(t.NamedTuple):
@@ -127,10 +385,11 @@ class Paginator(t.NamedTuple):
     instances: t.List[Instance]
     has_next: bool
     has_prev: bool
-    next_id: t.Optional[int]
+    next_id: t.Optional[t.Union[PK, str]]
     count: t.Optional[int]
     active_page: t.Optional[int]
     per_page: int
+    count_strategy: CountStrategy = CountStrategy.EXACT
 
 
 InstanceMapper = t.Dict[PK, t.Optional[Instance]]
@@ -145,6 +404,13 @@ class AbstractResource(ABC):
     engine: t.Any = None
     name: str
 
+    # settings of the total count for the list page
+    count_strategy: CountStrategy = CountStrategy.EXACT
+    count_cap: int = 10000
+    count_cache_ttl: float = 60
+    # default count of instances which are fetched at once by `iterate`
+    iterate_chunk_size: int = 500
+
     @abstractmethod
     async def get_one(self, pk: PK) -> Instance:
         """
@@ -172,15 +438,34 @@ class AbstractResource(ABC):
             Instance.
         """
 
+    async def load_many(
+        self,
+        pks: t.List[PK],
+        field: str = None,
+    ) -> InstanceMapper:
+        """
+        The same as `get_many` but inside a request of the admin concurrent
+        calls are coalesced into one call of `get_many` and the result is
+        cached till the end of the request.
+        """
+        loader = DataLoader.get(self, field)
+
+        if loader is None:
+            return await self.get_many(pks, field=field)
+
+        return await loader.load_many(pks)
+
     @abstractmethod
     async def get_list(
         self,
         *,
         limit: int,
         page: int = 1,
-        cursor: t.Optional[int] = None,
+        cursor: t.Optional[t.Union[int, str]] = None,
         order_by: t.Optional[str] = None,
         filters: t.Optional[FiltersType] = None,
+        count_strategy: t.Optional[CountStrategy] = None,
+        fields: t.Optional[t.List[str]] = None,
     ) -> Paginator:
         """
         Get list of instances. This method will use for show list of instances
@@ -189,7 +474,73 @@ class AbstractResource(ABC):
             - pagination
             - filtering
             - sorting
+
+        The cursor is a primary key of the last instance from the previous
+        page or an opaque string from the `Paginator.next_id` for resources
+        which support cursor pagination with sorting by other fields.
+
+        The total count is calculated according to the `count_strategy` or to
+        the `count_strategy` of the resource if it is not specified.
+
+        If `fields` is specified then instances contain only these fields and
+        the primary key (unknown fields are ignored).
+        """
+
+    def is_cursor_sortable(self, name: str) -> bool:
+        """
+        Return True if the cursor pagination is available together with
+        sorting by received field (besides the primary key).
+        """
+        return False
+
+    async def iterate(
+        self,
+        *,
+        order_by: t.Optional[str] = None,
+        filters: t.Optional[FiltersType] = None,
+        fields: t.Optional[t.List[str]] = None,
+        chunk_size: t.Optional[int] = None,
+    ) -> t.AsyncIterator[Instance]:
+        """
+        Iterate over all instances which match received filters. Instances are
+        fetched by chunks so memory usage doesn't depend on count of
+        instances. This method mainly will use for export of data.
+
+        The default implementation walks through pages of the `get_list`
+        method (via the cursor if it's possible), resources can redefine it to
+        use server side cursors of a storage.
         """
+        chunk_size = chunk_size or self.iterate_chunk_size
+        with_cursor = (
+            order_by is None
+            or self.is_cursor_sortable(order_by.lstrip('-'))
+        )
+        page = 1
+        cursor = None
+
+        while True:
+            data = await self.get_list(
+                limit=chunk_size,
+                page=page,
+                cursor=cursor,
+                order_by=order_by,
+                filters=filters,
+                # pages are fetched one by one till the last one so the
+                # total count is not needed
+                count_strategy=CountStrategy.NONE,
+                fields=fields,
+            )
+
+            for instance in data.instances:
+                yield instance
+
+            if not data.has_next:
+                return
+
+            if with_cursor:
+                cursor = data.next_id
+            else:
+                page += 1
 
     @abstractmethod
     async def delete(self, pk: PK) -> None:
@@ -213,20 +564,212 @@ class AbstractResource(ABC):
             InstanceDoesNotExist: If instance does not exists
         """
 
+    async def create_many(
+        self,
+        instances: t.List[Instance],
+    ) -> t.List[Instance]:
+        """
+        Create received instances and return created instances in the same
+        order.
+
+        The default implementation create instances one by one, resources
+        redefine it to create all instances by a few queries.
+        """
+        return [await self.create(instance) for instance in instances]
+
+    async def update_many(self, instances: InstanceMapper) -> InstanceMapper:
+        """
+        Update instances from received map of primary keys to instances and
+        return map of updated instances. Instances which does not exist are
+        skipped.
+
+        The default implementation update instances one by one, resources
+        redefine it to update all instances by a few queries.
+        """
+        updated = {}
+
+        for pk, instance in instances.items():
+            try:
+                updated[pk] = await self.update(pk, instance)
+            except InstanceDoesNotExist:
+                continue
+
+        return updated
+
+    async def _get_selected_pks(
+        self,
+        pks: t.Optional[t.List[PK]] = None,
+        filters: t.Optional[FiltersType] = None,
+    ) -> t.List[PK]:
+        if pks is not None and not filters:
+            return list(pks)
+
+        selected = [i.get_pk() async for i in self.iterate(filters=filters)]
+
+        if pks is None:
+            return selected
+
+        pks = set(pks)
+
+        return [pk for pk in selected if pk in pks]
+
+    async def delete_many(
+        self,
+        pks: t.Optional[t.List[PK]] = None,
+        *,
+        filters: t.Optional[FiltersType] = None,
+    ) -> int:
+        """
+        Delete all instances with received primary keys which match received
+        filters (if primary keys are not specified then all instances which
+        match filters are deleted) and return count of deleted instances.
+
+        The default implementation delete instances one by one, resources
+        redefine it to delete all instances by one query.
+        """
+        count = 0
+
+        for pk in await self._get_selected_pks(pks, filters):
+            try:
+                await self.delete(pk)
+            except InstanceDoesNotExist:
+                continue
+
+            count += 1
+
+        return count
+
+    async def update_fields(
+        self,
+        values: t.Dict[str, t.Any],
+        pks: t.Optional[t.List[PK]] = None,
+        *,
+        filters: t.Optional[FiltersType] = None,
+    ) -> int:
+        """
+        Set received values of fields for all instances which are selected in
+        the same way as in the `delete_many` method and return count of
+        updated instances.
+        """
+        count = 0
+
+        for pk in await self._get_selected_pks(pks, filters):
+            try:
+                instance = await self.get_one(pk)
+            except InstanceDoesNotExist:
+                continue
+
+            instance.data = {**instance.data.to_dict(), **values}
+            await self.update(pk, instance)
+            count += 1
+
+        return count
+
+    async def get_count(self, filters: t.Optional[FiltersType] = None) -> int:
+        """
+        Return count of all instances which match received filters.
+        """
+        raise NotImplementedError
+
+    async def get_estimated_count(
+        self,
+        filters: t.Optional[FiltersType] = None,
+    ) -> int:
+        """
+        Return approximate count of instances which match received filters.
+        Resources which can't estimate count return the exact one.
+        """
+        return await self.get_count(filters)
+
+    async def get_capped_count(
+        self,
+        filters: t.Optional[FiltersType] = None,
+        cap: int = 10000,
+    ) -> int:
+        """
+        Return count of instances which match received filters. The storage
+        can stop counting after `cap + 1` instances so the result greater than
+        `cap` means that there are more than `cap` instances.
+        """
+        return await self.get_count(filters)
+
+    @property
+    def cache_key(self) -> t.Hashable:
+        """Key to share cached data between resources of the same storage."""
+        return type(self), self.name, id(self.engine)
+
+    async def _get_count(
+        self,
+        filters: t.Optional[FiltersType] = None,
+        count_strategy: t.Optional[CountStrategy] = None,
+    ) -> t.Tuple[t.Optional[int], CountStrategy]:
+        """
+        Return total count according to received strategy and the strategy
+        which describe how the count have been got.
+        """
+        strategy = CountStrategy(count_strategy or self.count_strategy)
+
+        if strategy is CountStrategy.NONE:
+            return None, strategy
+
+        if strategy is CountStrategy.ESTIMATED:
+            return await self.get_estimated_count(filters), strategy
+
+        if strategy is CountStrategy.CAPPED:
+            count = await self.get_capped_count(filters, self.count_cap)
+
+            if count > self.count_cap:
+                return self.count_cap, strategy
+
+            return count, CountStrategy.EXACT
+
+        if strategy is CountStrategy.CACHED:
+            key = (
+                self.cache_key,
+                tuple(sorted(repr(tuple(f)) for f in filters or [])),
+            )
+            now = time.monotonic()
+            expired_at, count = _counts_cache.get(key, (0, None))
+
+            if expired_at <= now:
+                count = await self.get_count(filters)
+
+                # drop expired counts to not store them forever
+                for cache_key, (cache_expired_at, _) in \
+                        list(_counts_cache.items()):
+                    if cache_expired_at <= now:
+                        del _counts_cache[cache_key]
+
+                _counts_cache[key] = (now + self.count_cache_ttl, count)
+
+            return count, strategy
+
+        return await self.get_count(filters), CountStrategy.EXACT
+
     def create_paginator(
         self,
         *,
         instances: t.List[Instance],
         limit: int,
         offset: t.Optional[int] = None,
-        cursor: t.Optional[int] = None,
+        cursor: t.Optional[t.Union[int, str]] = None,
         count: t.Optional[int] = None,
+        next_id: t.Optional[t.Union[PK, str]] = None,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
     ) -> Paginator:
         has_next = len(instances) > limit
-        next_id = None
 
-        if has_next:
-            last_instance = instances[-1]
+        if (
+            count is not None
+            and offset is not None
+            and count_strategy is not CountStrategy.EXACT
+        ):
+            # approximate count can't be less than count of shown instances
+            count = max(count, offset + len(instances[0:limit]))
+
+        if has_next and next_id is None:
+            # the next page starts right after the last shown instance
+            last_instance = instances[limit - 1]
             next_id = last_instance.get_pk()
 
         return Paginator(
@@ -237,6 +780,7 @@ class AbstractResource(ABC):
             per_page=limit,
             count=count,
             next_id=next_id,
+            count_strategy=count_strategy,
         )
 
     def _validate_list_params(
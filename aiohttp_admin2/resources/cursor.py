@@ -0,0 +1,125 @@
+import base64
+import binascii
+import datetime
+import decimal
+import enum
+import json
+import typing as t
+import uuid
+
+from aiohttp_admin2.resources.exceptions import ClientException
+
+
+__all__ = [
+    'encode_cursor',
+    'decode_cursor',
+    'is_cursor_type',
+    'INVALID_CURSOR_MESSAGE',
+]
+
+
+INVALID_CURSOR_MESSAGE = "Received cursor is invalid"
+
+# json can't store all types of values which can be used for sorting so we
+# save a type tag together with each value
+_encoders: t.Dict[t.Type, t.Tuple[str, t.Callable[[t.Any], t.Any]]] = {
+    bool: ('b', lambda v: v),
+    int: ('i', lambda v: v),
+    float: ('f', lambda v: v),
+    str: ('s', lambda v: v),
+    decimal.Decimal: ('dec', str),
+    datetime.datetime: ('dt', lambda v: v.isoformat()),
+    datetime.date: ('d', lambda v: v.isoformat()),
+    datetime.time: ('t', lambda v: v.isoformat()),
+    uuid.UUID: ('u', str),
+    # enums are compared by names of members (e.g. the `sa.Enum` type of
+    # sqlalchemy accepts names of members)
+    enum.Enum: ('e', lambda v: v.name),
+}
+
+_decoders: t.Dict[str, t.Callable[[t.Any], t.Any]] = {
+    'b': bool,
+    'i': int,
+    'f': float,
+    's': str,
+    'dec': decimal.Decimal,
+    'dt': datetime.datetime.fromisoformat,
+    'd': datetime.date.fromisoformat,
+    't': datetime.time.fromisoformat,
+    'u': uuid.UUID,
+    'e': str,
+}
+
+
+def is_cursor_type(python_type: t.Type) -> bool:
+    """
+    Return True if values of received type can be stored in the cursor.
+    """
+    return issubclass(python_type, tuple(_encoders))
+
+
+def _encode_value(value: t.Any) -> t.List[t.Any]:
+    if value is None:
+        return ['n', None]
+
+    tag, encoder = _encoders.get(type(value), (None, None))
+
+    if tag is None:
+        # subclasses like enums based on `str` or `int`
+        for cls, (cls_tag, cls_encoder) in _encoders.items():
+            if isinstance(value, cls):
+                tag, encoder = cls_tag, cls_encoder
+                break
+        else:
+            raise ClientException(
+                f"Values of {type(value).__name__} type can't be used for "
+                f"the cursor pagination."
+            )
+
+    return [tag, encoder(value)]
+
+
+def _decode_value(value: t.List[t.Any]) -> t.Any:
+    tag, raw = value
+
+    if tag == 'n':
+        return None
+
+    return _decoders[tag](raw)
+
+
+def encode_cursor(value: t.Any, pk: t.Any) -> str:
+    """
+    Convert the value of the sort column and the primary key of the last
+    instance on the page to an opaque string which can be safely used in url.
+
+    >>> encode_cursor(datetime.date(2020, 1, 1), 10)
+    'W1siZCIsICIyMDIwLTAxLTAxIl0sIFsiaSIsIDEwXV0'
+    """
+    data = json.dumps([_encode_value(value), _encode_value(pk)])
+
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> t.Tuple[t.Any, t.Any]:
+    """
+    Convert the cursor created by the `encode_cursor` function back to the
+    value of the sort column and the primary key.
+
+    Raises:
+        ClientException: if received cursor is invalid.
+    """
+    try:
+        padding = '=' * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(cursor + padding))
+        value, pk = data
+
+        return _decode_value(value), _decode_value(pk)
+    except (
+        binascii.Error,
+        UnicodeDecodeError,
+        KeyError,
+        TypeError,
+        ValueError,
+    ):
+        raise ClientException(INVALID_CURSOR_MESSAGE)
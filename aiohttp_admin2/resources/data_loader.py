@@ -0,0 +1,155 @@
+import asyncio
+import typing as t
+from contextvars import ContextVar
+
+if t.TYPE_CHECKING:
+    from aiohttp_admin2.resources.abc import AbstractResource  # noqa
+    from aiohttp_admin2.resources.abc import InstanceMapper  # noqa
+    from aiohttp_admin2.resources.abc import PK  # noqa
+
+
+__all__ = ['DataLoader', 'data_loaders', 'clear_data_loaders', ]
+
+
+LoaderKey = t.Tuple[t.Hashable, t.Optional[str]]
+
+# this context map to share data loaders between all controllers of the
+# current request, the admin set an empty map at the start of each request
+DataLoadersMap = ContextVar[t.Optional[t.Dict[LoaderKey, 'DataLoader']]]
+data_loaders: DataLoadersMap = ContextVar('data_loaders', default=None)
+
+
+class DataLoader:
+    """
+    This class coalesces all `get_many` calls of the resource for the same
+    field which are made in the same tick of the event loop into one call and
+    caches the result till the end of the request.
+
+    >>> loader = DataLoader(genres_resource, field=None)
+    >>> first, second = await asyncio.gather(
+    >>>     loader.load_many([1, 2]),
+    >>>     loader.load_many([2, 3]),
+    >>> )
+
+    In the example above the resource receive only one call of the
+    `get_many` method with ids `[1, 2, 3]`.
+
+    Each call receives own instances which share fields with cached
+    instances, so controllers can set names and relations of instances
+    without affecting each other.
+    """
+
+    def __init__(
+        self,
+        resource: 'AbstractResource',
+        field: t.Optional[str] = None,
+    ) -> None:
+        self.resource = resource
+        self.field = field
+        self._cache: t.Dict['PK', asyncio.Future] = {}
+        self._queue: t.List['PK'] = []
+
+    async def load_many(self, pks: t.Iterable['PK']) -> 'InstanceMapper':
+        """
+        Return instances for received ids. Ids which have not been requested
+        before are fetched by one batch together with ids of other concurrent
+        calls.
+        """
+        loop = asyncio.get_running_loop()
+        pks = list(pks)
+
+        for pk in pks:
+            if pk not in self._cache:
+                self._cache[pk] = loop.create_future()
+
+                if not self._queue:
+                    loop.call_soon(self._dispatch)
+
+                self._queue.append(pk)
+
+        futures = [self._cache[pk] for pk in pks]
+
+        # a cancellation of the current call must not cancel futures which
+        # are shared with other calls
+        values = await asyncio.shield(asyncio.gather(*futures))
+
+        return {
+            pk: None if value is None else value.copy()
+            for pk, value in zip(pks, values)
+        }
+
+    def clear(self) -> None:
+        """Drop all cached instances (e.g. after the data has been changed)."""
+        self._cache = {
+            pk: future
+            for pk, future in self._cache.items()
+            if not future.done()
+        }
+
+    def _dispatch(self) -> None:
+        pks, self._queue = self._queue, []
+        futures = {pk: self._cache[pk] for pk in pks}
+
+        asyncio.ensure_future(self._fetch(futures))
+
+    async def _fetch(self, futures: t.Dict['PK', asyncio.Future]) -> None:
+        try:
+            data = await self.resource.get_many(
+                list(futures),
+                field=self.field,
+            )
+        except BaseException as e:
+            for pk, future in futures.items():
+                # the next call will try to fetch these ids again
+                if self._cache.get(pk) is future:
+                    del self._cache[pk]
+
+                if future.done():
+                    continue
+
+                if isinstance(e, Exception):
+                    future.set_exception(e)
+                else:
+                    future.cancel()
+
+            if not isinstance(e, Exception):
+                raise
+
+            return
+
+        for pk, future in futures.items():
+            if not future.done():
+                future.set_result(data.get(pk))
+
+    @classmethod
+    def get(
+        cls,
+        resource: 'AbstractResource',
+        field: t.Optional[str] = None,
+    ) -> t.Optional['DataLoader']:
+        """
+        Return the data loader of the current request for received resource
+        and field or `None` if the code is executed outside of a request.
+        """
+        loaders = data_loaders.get()
+
+        if loaders is None:
+            return None
+
+        key = (resource.cache_key, field)
+        loader = loaders.get(key)
+
+        if loader is None:
+            loader = loaders[key] = cls(resource, field)
+
+        return loader
+
+
+def clear_data_loaders(resource: 'AbstractResource') -> None:
+    """
+    Drop cached instances of received resource from all data loaders of the
+    current request.
+    """
+    for (key, _), loader in (data_loaders.get() or {}).items():
+        if key == resource.cache_key:
+            loader.clear()
@@ -1,3 +1,5 @@
+import heapq
+import operator
 import typing as t
 
 from aiohttp_admin2.resources.abc import (
@@ -5,6 +7,7 @@ from aiohttp_admin2.resources.abc import (
     Instance,
     InstanceMapper,
     Paginator,
+    CountStrategy,
 )
 from aiohttp_admin2.resources.exceptions import (
     ClientException,
@@ -14,6 +17,7 @@ from aiohttp_admin2.resources.exceptions import (
 )
 from aiohttp_admin2.resources.types import (
     PK,
+    FilterTuple,
     FiltersType,
 )
 from aiohttp_admin2.resources.dict_resource.filters import (
@@ -21,12 +25,22 @@ from aiohttp_admin2.resources.dict_resource.filters import (
     DictBaseFilter,
     default_filter_mapper,
 )
+from aiohttp_admin2.resources.dict_resource.indexes import DictIndex
 from aiohttp_admin2.resources.exceptions import FilterException
 
 
 __all__ = ['DictResource', ]
 
 
+# arguments of the range of the sorted index for filters
+RANGE_FILTERS = {
+    'gt': lambda value: dict(lower=value, include_lower=False),
+    'gte': lambda value: dict(lower=value),
+    'lt': lambda value: dict(upper=value, include_upper=False),
+    'lte': lambda value: dict(upper=value),
+}
+
+
 class DictResource(AbstractResource):
     """
     Dict client use dictionary as a storage. This class mainly use for test
@@ -38,14 +52,41 @@ class DictResource(AbstractResource):
         >>> my_dict_client = DictResource(storage)
         >>> user = my_dict_client.get_one(1)
 
+    Fields from `indexes` are indexed by hash and sorted indexes, so `eq`,
+    `in` and range filters, ordering and pagination by these fields don't
+    scan all rows. The index of `id` is added to any indexes. Indexed storage
+    must be changed only via the resource.
+
+        >>> my_dict_client = DictResource(storage, indexes=['name'])
+
     """
     _pk: int
     engine: t.Dict[PK, t.Any]
-
-    def __init__(self, engine: t.Optional[t.Dict[PK, t.Any]] = None):
+    indexes: t.Dict[str, DictIndex]
+    # max count of rows (the offset plus the limit) which are selected by the
+    # partial sort on the heap instead of the full sort of all matched rows.
+    # Rows with the same value of the sort field can be returned in different
+    # order by these sorts
+    partial_sort_limit = 1000
+
+    def __init__(
+        self,
+        engine: t.Optional[t.Dict[PK, t.Any]] = None,
+        indexes: t.Optional[t.List[str]] = None,
+    ):
         self.engine = engine or {}
         self._pk = 1
         self.name = engine.__class__.__name__.lower()
+        self.indexes = {}
+
+        if indexes:
+            self.indexes = {
+                field: DictIndex(field)
+                for field in ['id', *indexes]
+            }
+
+            for index in self.indexes.values():
+                index.build(self.engine.items())
 
     async def get_one(self, pk: PK) -> Instance:
         instance = self.engine.get(pk)
@@ -55,12 +96,31 @@ class DictResource(AbstractResource):
 
         return self._row_to_instance(instance)
 
-    async def get_many(self, pks: t.List[PK]) -> InstanceMapper:
-        relations = {
-            pk: self._row_to_instance(self.engine.get(pk))
-            for pk in pks
-            if pk in self.engine
-        }
+    async def get_many(
+        self,
+        pks: t.List[PK],
+        field: str = None,
+    ) -> InstanceMapper:
+        if field and field in self.indexes:
+            index = self.indexes[field]
+            relations = {}
+
+            for key in set(pks):
+                for pk in index.eq(key):
+                    relations[key] = self._row_to_instance(self.engine[pk])
+        elif field:
+            keys = set(pks)
+            relations = {
+                row.get(field): self._row_to_instance(row)
+                for row in self.engine.values()
+                if row.get(field) in keys
+            }
+        else:
+            relations = {
+                pk: self._row_to_instance(self.engine.get(pk))
+                for pk in pks
+                if pk in self.engine
+            }
 
         return {
             _id: relations.get(_id, None)
@@ -74,10 +134,11 @@ class DictResource(AbstractResource):
         cursor: t.Optional[int] = None,
         order_by: t.Optional[str] = None,
         filters: t.Optional[FiltersType] = None,
+        count_strategy: t.Optional[CountStrategy] = None,
+        fields: t.Optional[t.List[str]] = None,
     ) -> Paginator:
         self._validate_list_params(page=page, cursor=cursor, limit=limit)
 
-        query = self.apply_filters(filters=filters, query=self.engine.copy())
         offset = (page - 1) * limit
 
         is_desc = True
@@ -89,71 +150,286 @@ class DictResource(AbstractResource):
             else:
                 is_desc = False
             if self.engine:
-                if order not in list(self.engine.values())[0].keys():
+                if (
+                    order not in self.indexes
+                    and order not in next(iter(self.engine.values()))
+                ):
                     raise BadParameters(f'Field {order} does not exist.')
                 if cursor and order != 'id':
                     raise ClientException(CURSOR_PAGINATION_ERROR_MESSAGE)
 
-        if is_desc:
-            objects_list = sorted(
-                query.values(),
-                key=lambda x: x[order],
-                reverse=True,
+        index = self.indexes.get(order)
+
+        if index is not None and index.is_sortable:
+            return await self._get_indexed_list(
+                index,
+                is_desc=is_desc,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+                filters=filters,
+                count_strategy=count_strategy,
+                fields=fields,
             )
+
+        page_start = 0 if cursor is not None else offset
+        top = page_start + limit + 1
+        is_partial_sort = top <= self.partial_sort_limit
+
+        if cursor is not None:
+            filters = [
+                *(filters or []),
+                FilterTuple('id', cursor, 'lt' if is_desc else 'gt'),
+            ]
+
+        # values of the sort field usually grow with the order of rows of
+        # the storage (e.g. ids) so for the descending order the heap receives
+        # the best rows first and rejects other ones without changes
+        rows = self._filter_rows(
+            filters,
+            self.engine,
+            reverse=is_partial_sort and is_desc,
+        )
+        # rows with the same value are ordered by pk so the partial and the
+        # full sort return the same pages
+        if order == 'id':
+            key = operator.itemgetter('id')
+        else:
+            key = operator.itemgetter(order, 'id')
+
+        if is_partial_sort:
+            select = heapq.nlargest if is_desc else heapq.nsmallest
+            rows = select(top, rows, key=key)
         else:
-            objects_list = sorted(
-                query.values(),
-                key=lambda x: x[order],
+            rows = sorted(rows, key=key, reverse=is_desc)[:top]
+
+        # instances are created only for rows of the page
+        instances = [
+            self._row_to_instance(self._project(row, fields))
+            for row in rows[page_start:]
+        ]
+
+        if cursor is not None:
+            return self.create_paginator(
+                instances=instances,
+                limit=limit,
+                cursor=cursor,
             )
 
+        count, count_strategy = await self._get_count(filters, count_strategy)
+
+        return self.create_paginator(
+            instances=instances,
+            limit=limit,
+            offset=offset,
+            count=count,
+            count_strategy=count_strategy,
+        )
+
+    async def _get_indexed_list(
+        self,
+        index: DictIndex,
+        *,
+        is_desc: bool,
+        limit: int,
+        offset: int,
+        cursor: t.Optional[int],
+        filters: t.Optional[FiltersType],
+        count_strategy: t.Optional[CountStrategy],
+        fields: t.Optional[t.List[str]],
+    ) -> Paginator:
+        """
+        Return the page of rows ordered by the indexed field. Only rows of
+        the page are read from the storage.
+        """
+        pks, start, stop = self._select_by_indexes(filters, index)
+
         if cursor is not None:
             if is_desc:
-                instances = [
-                    self._row_to_instance(i)
-                    for i in objects_list
-                    if i['id'] < cursor
-                ]
-
-                return self.create_paginator(
-                    instances=instances[:limit + 1],
-                    limit=limit,
-                    cursor=cursor,
-                )
-
-            instances = [
-                self._row_to_instance(i)
-                for i in objects_list
-                if i['id'] > cursor
-            ]
+                stop = min(stop, index.bounds(
+                    upper=cursor,
+                    include_upper=False,
+                )[1])
+            else:
+                start = max(start, index.bounds(
+                    lower=cursor,
+                    include_lower=False,
+                )[0])
+
+        if pks is None:
+            positions = range(start, stop)
+        else:
+            positions = sorted(
+                position
+                for position in map(index.position, pks)
+                if start <= position < stop
+            )
+
+        if is_desc:
+            positions = positions[::-1]
+
+        page_start = 0 if cursor is not None else offset
+        rows = [
+            self._project(self.engine[index.pk_at(position)], fields)
+            for position in positions[page_start:page_start + limit + 1]
+        ]
+        instances = [self._row_to_instance(row) for row in rows]
 
+        if cursor is not None:
             return self.create_paginator(
-                instances=instances[:limit + 1],
+                instances=instances,
                 limit=limit,
                 cursor=cursor,
             )
 
-        instances = [
-            self._row_to_instance(i)
-            for i in objects_list
-        ]
+        count, count_strategy = await self._get_count(filters, count_strategy)
 
         return self.create_paginator(
-            instances=instances[offset:offset + limit + 1],
+            instances=instances,
             limit=limit,
             offset=offset,
-            count=len(instances),
+            count=count,
+            count_strategy=count_strategy,
         )
 
+    def _select_by_indexes(
+        self,
+        filters: t.Optional[FiltersType],
+        order_index: t.Optional[DictIndex] = None,
+    ) -> t.Tuple[t.Optional[t.Set[PK]], int, int]:
+        """
+        Return pks of rows which match received filters (`None` if all rows
+        match) and bounds of the sorted order index. Filters of indexed
+        fields are applied by indexes and other filters are applied only to
+        rows selected by indexes.
+        """
+        pks = None
+        start, stop = 0, len(order_index) if order_index else 0
+        other_filters = []
+
+        for f in filters or []:
+            index = self.indexes.get(f.column_name)
+
+            if index is None or not self._is_index_filter(f):
+                other_filters.append(f)
+                continue
+
+            if f.filter in RANGE_FILTERS:
+                bounds = RANGE_FILTERS[f.filter](f.value)
+
+                if index is order_index:
+                    first, last = index.bounds(**bounds)
+                    start, stop = max(start, first), min(stop, last)
+                    continue
+
+                selected = set(index.range(**bounds))
+            elif f.filter == 'in':
+                selected = set().union(*(index.eq(v) for v in f.value))
+            else:
+                selected = set(index.eq(f.value))
+
+            pks = selected if pks is None else pks & selected
+
+        if other_filters:
+            query = self.engine if pks is None else {
+                pk: self.engine[pk] for pk in pks
+            }
+            pks = set(self.apply_filters(filters=other_filters, query=query))
+
+        return pks, start, stop
+
+    @staticmethod
+    def _is_index_filter(f) -> bool:
+        if f.value is None:
+            return False
+
+        if f.filter in RANGE_FILTERS:
+            return True
+
+        if f.filter == 'in':
+            return isinstance(f.value, (list, tuple, set, frozenset)) \
+                and all(isinstance(v, t.Hashable) for v in f.value)
+
+        return f.filter == 'eq' and isinstance(f.value, t.Hashable)
+
+    @staticmethod
+    def _project(
+        row: t.Dict[str, t.Any],
+        fields: t.Optional[t.List[str]],
+    ) -> t.Dict[str, t.Any]:
+        if fields is None:
+            return row
+
+        names = {*fields, 'id'}
+
+        return {key: value for key, value in row.items() if key in names}
+
+    async def get_count(self, filters: t.Optional[FiltersType] = None) -> int:
+        if self.indexes:
+            pks, _, _ = self._select_by_indexes(filters)
+
+            return len(self.engine) if pks is None else len(pks)
+
+        rows = self._filter_rows(filters, self.engine)
+
+        return len(list(rows))
+
+    async def get_capped_count(
+        self,
+        filters: t.Optional[FiltersType] = None,
+        cap: int = 10000,
+    ) -> int:
+        return min(await self.get_count(filters), cap + 1)
+
     async def delete(self, pk: PK) -> None:
         if pk not in self.engine:
             raise InstanceDoesNotExist
 
-        del self.engine[pk]
+        self._delete_row(pk)
+
+    def _select_rows(
+        self,
+        pks: t.Optional[t.List[PK]] = None,
+        filters: t.Optional[FiltersType] = None,
+    ) -> DictQuery:
+        if pks is None:
+            query = self.engine.copy()
+        else:
+            query = {pk: self.engine[pk] for pk in pks if pk in self.engine}
+
+        return self.apply_filters(filters=filters, query=query)
+
+    async def delete_many(
+        self,
+        pks: t.Optional[t.List[PK]] = None,
+        *,
+        filters: t.Optional[FiltersType] = None,
+    ) -> int:
+        selected = self._select_rows(pks, filters)
+
+        for pk in selected:
+            self._delete_row(pk)
+
+        return len(selected)
+
+    async def update_fields(
+        self,
+        values: t.Dict[str, t.Any],
+        pks: t.Optional[t.List[PK]] = None,
+        *,
+        filters: t.Optional[FiltersType] = None,
+    ) -> int:
+        selected = self._select_rows(pks, filters)
+
+        for pk, row in selected.items():
+            self._set_row(pk, {**row, **values})
+
+        return len(selected)
 
     async def create(self, instance: Instance) -> Instance:
         pk = self._get_pk()
         instance.data.id = pk
-        self.engine[pk] = {"id": pk, **instance.data.__dict__}
+        self._set_row(pk, {"id": pk, **instance.data.to_dict()})
 
         return instance
 
@@ -161,12 +437,49 @@ class DictResource(AbstractResource):
         if pk not in self.engine:
             raise InstanceDoesNotExist
 
-        self.engine[pk] = instance.data
+        self._set_row(pk, {"id": pk, **instance.data.to_dict()})
+
+        return self._row_to_instance(self.engine[pk])
+
+    async def create_many(
+        self,
+        instances: t.List[Instance],
+    ) -> t.List[Instance]:
+        for instance in instances:
+            pk = self._get_pk()
+            instance.data.id = pk
+            self._set_row(pk, {"id": pk, **instance.data.to_dict()})
 
-        return self._row_to_instance({
-            "id": pk,
-            **instance.data.__dict__
-        })
+        return instances
+
+    async def update_many(self, instances: InstanceMapper) -> InstanceMapper:
+        updated = {}
+
+        for pk, instance in instances.items():
+            if pk in self.engine:
+                self._set_row(pk, {"id": pk, **instance.data.to_dict()})
+                updated[pk] = self._row_to_instance(self.engine[pk])
+
+        return updated
+
+    def _set_row(self, pk: PK, row: t.Dict[str, t.Any]) -> None:
+        if self.indexes and pk in self.engine:
+            self._unindex_row(pk)
+
+        self.engine[pk] = row
+        self._index_row(pk, row)
+
+    def _delete_row(self, pk: PK) -> None:
+        del self.engine[pk]
+        self._unindex_row(pk)
+
+    def _index_row(self, pk: PK, row: t.Dict[str, t.Any]) -> None:
+        for index in self.indexes.values():
+            index.add(pk, row)
+
+    def _unindex_row(self, pk: PK) -> None:
+        for index in self.indexes.values():
+            index.remove(pk)
 
     def _get_pk(self) -> PK:
         """Return a unique pk for new instance."""
@@ -185,6 +498,64 @@ class DictResource(AbstractResource):
 
         return instance
 
+    def _get_filter_class(self, f) -> t.Type[DictBaseFilter]:
+        filter_type_cls = f.filter
+
+        if not (
+            isinstance(filter_type_cls, type)
+            and issubclass(filter_type_cls, DictBaseFilter)
+        ):
+            filter_type_cls = default_filter_mapper.get(filter_type_cls)
+
+            if not filter_type_cls:
+                raise FilterException(f"unknown filter type {f.filter}")
+
+        return filter_type_cls
+
+    def _filter_rows(
+        self,
+        filters: t.Optional[FiltersType],
+        query: DictQuery,
+        *,
+        reverse: bool = False,
+    ) -> t.Iterable[t.Dict[str, t.Any]]:
+        """
+        Return iterator over rows of the query which match received filters.
+        Each row is checked by all filters in one pass without copies of the
+        storage, filters without the `compare` function (or with own `apply`
+        method) are applied to the query by the `apply` method.
+        """
+        filter_objects = []
+        other_filters = []
+
+        for i in filters or []:
+            filter_type_cls = self._get_filter_class(i)
+
+            if not filter_type_cls.can_filter_rows():
+                other_filters.append(i)
+                continue
+
+            filter_obj = filter_type_cls(
+                column=i.column_name,
+                value=i.value,
+                query=query,
+            )
+            filter_obj.check_is_valid()
+            filter_objects.append(filter_obj)
+
+        if other_filters:
+            query = self.apply_filters(filters=other_filters, query=query)
+
+        rows = query.values()
+
+        if reverse:
+            rows = reversed(list(rows))
+
+        for filter_obj in filter_objects:
+            rows = filter_obj.filter_rows(rows)
+
+        return rows
+
     def apply_filters(
         self,
         *,
@@ -198,16 +569,7 @@ class DictResource(AbstractResource):
             return query
 
         for i in filters:
-            filter_type_cls = i.filter
-
-            if not isinstance(filters, DictBaseFilter):
-                filter_type_cls = default_filter_mapper.get(filter_type_cls)
-
-                if not filter_type_cls:
-                    raise FilterException(
-                        f"unknown filter type {i.filter}")
-
-            query = filter_type_cls(
+            query = self._get_filter_class(i)(
                 column=i.column_name,
                 value=i.value,
                 query=query,
@@ -1,3 +1,4 @@
+import operator
 import typing as t
 
 from aiohttp_admin2.resources.abc import ABCFilter
@@ -23,6 +24,10 @@ DictQuery = t.Dict[int, t.Any]
 
 
 class DictBaseFilter(ABCFilter):
+    # function which receive the value of the row and the value of the filter
+    # and return `True` if the row matches the filter
+    compare: t.Optional[t.Callable[[t.Any, t.Any], bool]] = None
+
     def __init__(
         self,
         *,
@@ -34,6 +39,26 @@ class DictBaseFilter(ABCFilter):
         self.column = column
         self._query = query
 
+    def apply(self) -> DictQuery:
+        return self._update_query(self.compare)
+
+    @classmethod
+    def can_filter_rows(cls) -> bool:
+        """
+        Return `True` if rows can be checked by the `compare` function. The
+        filter which redefines the `apply` method is applied only by it.
+        """
+        return cls.compare is not None and cls.apply is DictBaseFilter.apply
+
+    def filter_rows(
+        self,
+        rows: t.Iterable[t.Dict[str, t.Any]],
+    ) -> t.Iterator[t.Dict[str, t.Any]]:
+        """Return iterator over received rows which match the filter."""
+        compare, column, value = self.compare, self.column, self.value
+
+        return (row for row in rows if compare(row[column], value))
+
     def _update_query(self, predict):
         return {
             key: value
@@ -45,64 +70,61 @@ class DictBaseFilter(ABCFilter):
 class GT(DictBaseFilter):
     """Greater filter."""
 
-    def apply(self) -> DictQuery:
-        return self._update_query(lambda a, b: a > b)
+    compare = staticmethod(operator.gt)
 
 
 class GTE(DictBaseFilter):
     """Greater or equal filter."""
 
-    def apply(self) -> DictQuery:
-        return self._update_query(lambda a, b: a >= b)
+    compare = staticmethod(operator.ge)
 
 
 class LT(DictBaseFilter):
     """Less filter."""
 
-    def apply(self) -> DictQuery:
-        return self._update_query(lambda a, b: a < b)
+    compare = staticmethod(operator.lt)
 
 
 class LTE(DictBaseFilter):
     """Less or equal filter."""
 
-    def apply(self) -> DictQuery:
-        return self._update_query(lambda a, b: a <= b)
+    compare = staticmethod(operator.le)
 
 
 class EQ(DictBaseFilter):
     """Equal filter."""
 
-    def apply(self) -> DictQuery:
-        return self._update_query(lambda a, b: a == b)
+    compare = staticmethod(operator.eq)
 
 
 class NE(DictBaseFilter):
     """No equal filter."""
 
-    def apply(self) -> DictQuery:
-        return self._update_query(lambda a, b: a != b)
+    compare = staticmethod(operator.ne)
 
 
 class IN(DictBaseFilter):
     """In array filter."""
 
-    def apply(self) -> DictQuery:
-        return self._update_query(lambda a, b: a in b)
+    @staticmethod
+    def compare(value: t.Any, filter_value: t.Any) -> bool:
+        return value in filter_value
 
 
 class NIN(DictBaseFilter):
     """Not in array filter."""
 
-    def apply(self) -> DictQuery:
-        return self._update_query(lambda a, b: a not in b)
+    @staticmethod
+    def compare(value: t.Any, filter_value: t.Any) -> bool:
+        return value not in filter_value
 
 
 class Like(DictBaseFilter):
     """Like filter."""
 
-    def apply(self) -> DictQuery:
-        return self._update_query(lambda a, b: b in a)
+    @staticmethod
+    def compare(value: t.Any, filter_value: t.Any) -> bool:
+        return filter_value in value
 
 
 default_filter_mapper = {
@@ -0,0 +1,130 @@
+import bisect
+import typing as t
+
+from aiohttp_admin2.resources.types import PK
+
+
+__all__ = ['DictIndex', ]
+
+
+class DictIndex:
+    """
+    Hash and sorted index of one field of rows of the dict resource. Rows
+    with the same value are ordered by pk in the sorted index. Values of the
+    field must be hashable and comparable with each other, rows with `None`
+    value are kept only in the hash index.
+
+    >>> index = DictIndex('name')
+    >>> index.add(1, {"id": 1, "name": "Bob"})
+    >>> index.add(2, {"id": 2, "name": "Alice"})
+    >>> index.eq('Bob')
+    {1}
+    >>> index.range(lower='B')
+    [1]
+    """
+
+    def __init__(self, field: str) -> None:
+        self.field = field
+        self._hash: t.Dict[t.Any, t.Set[PK]] = {}
+        # indexed values by pks, rows can be changed in place so values are
+        # kept to remove rows from the index
+        self._by_pk: t.Dict[PK, t.Any] = {}
+        # pairs of the value and the pk and the separate list of values to
+        # search by the value without the pk
+        self._items: t.List[t.Tuple[t.Any, PK]] = []
+        self._values: t.List[t.Any] = []
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def is_sortable(self) -> bool:
+        """Return `True` if all rows are in the sorted index."""
+        return None not in self._hash
+
+    def build(self, rows: t.Iterable[t.Tuple[PK, t.Dict[str, t.Any]]]) -> None:
+        """Fill the empty index by received pairs of pks and rows at once."""
+        for pk, row in rows:
+            value = row.get(self.field)
+            self._by_pk[pk] = value
+            self._hash.setdefault(value, set()).add(pk)
+
+        self._items = sorted(
+            (value, pk)
+            for pk, value in self._by_pk.items()
+            if value is not None
+        )
+        self._values = [value for value, _ in self._items]
+
+    def add(self, pk: PK, row: t.Dict[str, t.Any]) -> None:
+        value = row.get(self.field)
+        self._by_pk[pk] = value
+        self._hash.setdefault(value, set()).add(pk)
+
+        if value is None:
+            return
+
+        position = bisect.bisect_left(self._items, (value, pk))
+        self._items.insert(position, (value, pk))
+        self._values.insert(position, value)
+
+    def remove(self, pk: PK) -> None:
+        value = self._by_pk.pop(pk)
+        pks = self._hash[value]
+        pks.discard(pk)
+
+        if not pks:
+            del self._hash[value]
+
+        if value is not None:
+            position = self.position(pk, value)
+            del self._items[position]
+            del self._values[position]
+
+    def position(self, pk: PK, value: t.Any = None) -> int:
+        """Return the position of the row in the sorted index."""
+        if value is None:
+            value = self._by_pk[pk]
+
+        return bisect.bisect_left(self._items, (value, pk))
+
+    def pk_at(self, position: int) -> PK:
+        """Return the pk of the row at received position of the index."""
+        return self._items[position][1]
+
+    def eq(self, value: t.Any) -> t.Set[PK]:
+        """Return pks of rows with received value."""
+        return self._hash.get(value, set())
+
+    def bounds(
+        self,
+        lower: t.Any = None,
+        upper: t.Any = None,
+        include_lower: bool = True,
+        include_upper: bool = True,
+    ) -> t.Tuple[int, int]:
+        """
+        Return positions of the first and after the last item of the sorted
+        index between received values.
+        """
+        start, stop = 0, len(self._values)
+
+        if lower is not None:
+            if include_lower:
+                start = bisect.bisect_left(self._values, lower)
+            else:
+                start = bisect.bisect_right(self._values, lower)
+
+        if upper is not None:
+            if include_upper:
+                stop = bisect.bisect_right(self._values, upper)
+            else:
+                stop = bisect.bisect_left(self._values, upper)
+
+        return start, max(start, stop)
+
+    def range(self, **kwargs: t.Any) -> t.List[PK]:
+        """Return pks of rows between received values in ascending order."""
+        start, stop = self.bounds(**kwargs)
+
+        return [pk for _, pk in self._items[start:stop]]
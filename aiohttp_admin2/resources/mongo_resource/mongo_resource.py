@@ -1,13 +1,17 @@
+import asyncio
 import typing as t
 
 from umongo.document import MetaDocumentImplementation
 from umongo.document import DocumentImplementation
+from umongo.frameworks.tools import cook_find_filter
 from bson.objectid import ObjectId
+from pymongo import UpdateOne
 
 from aiohttp_admin2.resources.abc import AbstractResource
 from aiohttp_admin2.resources.abc import Instance
 from aiohttp_admin2.resources.abc import InstanceMapper
 from aiohttp_admin2.resources.abc import Paginator
+from aiohttp_admin2.resources.abc import CountStrategy
 from aiohttp_admin2.resources.types import PK
 from aiohttp_admin2.resources.mongo_resource.filters import MongoQuery
 from aiohttp_admin2.resources.mongo_resource.filters import MongoBaseFilter
@@ -41,15 +45,26 @@ class MongoResource(AbstractResource):
 
         return self._row_to_instance(data)
 
-    async def get_many(self, pks: t.List[PK]) -> InstanceMapper:
-        data = await self.table\
-            .find({"_id": {"$in": [ObjectId(pk) for pk in pks]}})\
-            .to_list(length=len(pks))
+    async def get_many(
+        self,
+        pks: t.List[PK],
+        field: str = None,
+    ) -> InstanceMapper:
+        if field and field not in ('id', '_id'):
+            data = await self.table\
+                .find({field: {"$in": list(pks)}})\
+                .to_list(length=None)
 
-        relations = {
-            str(r["id"]): self._row_to_instance(r)
-            for r in data
-        }
+            relations = {r[field]: self._row_to_instance(r) for r in data}
+        else:
+            data = await self.table\
+                .find({"_id": {"$in": [ObjectId(pk) for pk in pks]}})\
+                .to_list(length=len(pks))
+
+            relations = {
+                str(r["id"]): self._row_to_instance(r)
+                for r in data
+            }
 
         return {
             _id: relations.get(_id, None)
@@ -64,10 +79,13 @@ class MongoResource(AbstractResource):
         cursor=None,
         order_by: t.Optional[str] = None,
         filters: t.Optional[FiltersType] = None,
+        count_strategy: t.Optional[CountStrategy] = None,
+        fields: t.Optional[t.List[str]] = None,
     ) -> Paginator:
         self._validate_list_params(page=page, cursor=cursor, limit=limit)
         sort = self.get_order(order_by)
         offset = (page - 1) * limit
+        projection = self.get_projection(fields)
 
         if cursor:
             if sort[0][0] not in ('id', '_id'):
@@ -82,7 +100,7 @@ class MongoResource(AbstractResource):
                 query = self.apply_filters(filters=filters, query=query)
 
             data = await self.table\
-                .find(query)\
+                .find(query, projection)\
                 .limit(limit + 1)\
                 .sort(sort)\
                 .to_list(length=limit + 1)
@@ -93,12 +111,17 @@ class MongoResource(AbstractResource):
             if filters:
                 query = self.apply_filters(filters=filters, query=query)
 
-            data = await self.table \
-                .find(query)\
-                .skip(offset)\
-                .limit(limit + 1)\
-                .sort(sort)\
-                .to_list(length=limit + 1)
+            # the page and the count don't depend on each other so we fetch
+            # them concurrently
+            data, (count, count_strategy) = await asyncio.gather(
+                self.table
+                .find(query, projection)
+                .skip(offset)
+                .limit(limit + 1)
+                .sort(sort)
+                .to_list(length=limit + 1),
+                self._get_count(filters, count_strategy),
+            )
 
         data = [self._row_to_instance(i) for i in data]
 
@@ -109,20 +132,137 @@ class MongoResource(AbstractResource):
                 cursor=cursor,
             )
         else:
-            count: int = await self.table.count_documents(query)
             return self.create_paginator(
                 instances=data,
                 limit=limit,
                 offset=offset,
                 count=count,
+                count_strategy=count_strategy,
             )
 
+    async def iterate(
+        self,
+        *,
+        order_by: t.Optional[str] = None,
+        filters: t.Optional[FiltersType] = None,
+        fields: t.Optional[t.List[str]] = None,
+        chunk_size: t.Optional[int] = None,
+    ) -> t.AsyncIterator[Instance]:
+        query = {}
+
+        if filters:
+            query = self.apply_filters(filters=filters, query=query)
+
+        # settings of the cursor change the wrapped cursor in place
+        cursor = self.table.find(query, self.get_projection(fields))
+        cursor.sort(self.get_order(order_by))
+        cursor.batch_size(chunk_size or self.iterate_chunk_size)
+
+        async for row in cursor:
+            yield self._row_to_instance(row)
+
+    def get_projection(
+        self,
+        fields: t.Optional[t.List[str]] = None,
+    ) -> t.Optional[t.Dict[str, bool]]:
+        """
+        Convert received names of fields to the projection of the mongo query
+        (names of fields in a document can be different).
+        """
+        if fields is None:
+            return None
+
+        projection = {'_id': True}
+        schema_fields = self.table.schema.fields
+
+        for name in fields:
+            field = schema_fields.get(name)
+
+            if field is not None:
+                projection[field.attribute or name] = True
+
+        return projection
+
+    def _get_count_query(
+        self,
+        filters: t.Optional[FiltersType] = None,
+    ) -> MongoQuery:
+        if filters:
+            return self.apply_filters(filters=filters, query={})
+
+        return {}
+
+    async def get_count(self, filters: t.Optional[FiltersType] = None) -> int:
+        return await self.table.count_documents(self._get_count_query(filters))
+
+    async def get_estimated_count(
+        self,
+        filters: t.Optional[FiltersType] = None,
+    ) -> int:
+        if filters:
+            return await self.get_count(filters)
+
+        # use metadata of the collection instead of scan of all documents
+        return await self.table.collection.estimated_document_count()
+
+    async def get_capped_count(
+        self,
+        filters: t.Optional[FiltersType] = None,
+        cap: int = 10000,
+    ) -> int:
+        return await self.table.count_documents(
+            self._get_count_query(filters),
+            limit=cap + 1,
+        )
+
     async def delete(self, pk: PK) -> None:
         res = await self.table.collection.delete_one({"_id": ObjectId(pk)})
 
         if not res.deleted_count:
             raise InstanceDoesNotExist
 
+    def _get_selection_query(
+        self,
+        pks: t.Optional[t.List[PK]] = None,
+        filters: t.Optional[FiltersType] = None,
+    ) -> MongoQuery:
+        query = {}
+
+        if pks is not None:
+            query = {"_id": {"$in": [ObjectId(pk) for pk in pks]}}
+
+        if filters:
+            query = self.apply_filters(filters=filters, query=query)
+
+        # queries to the collection don't replace names of fields
+        return cook_find_filter(self.table, query)
+
+    async def delete_many(
+        self,
+        pks: t.Optional[t.List[PK]] = None,
+        *,
+        filters: t.Optional[FiltersType] = None,
+    ) -> int:
+        res = await self.table.collection.delete_many(
+            self._get_selection_query(pks, filters),
+        )
+
+        return res.deleted_count
+
+    async def update_fields(
+        self,
+        values: t.Dict[str, t.Any],
+        pks: t.Optional[t.List[PK]] = None,
+        *,
+        filters: t.Optional[FiltersType] = None,
+    ) -> int:
+        res = await self.table.collection.update_many(
+            self._get_selection_query(pks, filters),
+            {"$set": values},
+        )
+
+        return res.matched_count
+
     async def create(self, instance: Instance) -> Instance:
         res = await self.table(**instance.data.to_dict()).commit()
 
@@ -140,6 +280,52 @@ class MongoResource(AbstractResource):
 
         return await self.get_one(pk)
 
+    async def create_many(
+        self,
+        instances: t.List[Instance],
+    ) -> t.List[Instance]:
+        """
+        Create all instances by one `insert_many` query. Documents are
+        validated in the same way as in the `commit` method, but hooks of
+        documents are not called.
+        """
+        if not instances:
+            return []
+
+        payloads = []
+
+        for instance in instances:
+            document = self.table(**instance.data.to_dict())
+            document.required_validate()
+            await document.io_validate()
+            payloads.append(document.to_mongo())
+
+        res = await self.table.collection.insert_many(payloads)
+        pks = [str(pk) for pk in res.inserted_ids]
+        created = await self.get_many(pks)
+
+        return [created[pk] for pk in pks]
+
+    async def update_many(self, instances: InstanceMapper) -> InstanceMapper:
+        """Update all instances by one `bulk_write` query."""
+        operations = []
+
+        for pk, instance in instances.items():
+            data = instance.data.to_dict()
+            data.pop('id', None)
+
+            if data:
+                operations.append(
+                    UpdateOne({"_id": ObjectId(pk)}, {"$set": data}),
+                )
+
+        if operations:
+            await self.table.collection.bulk_write(operations, ordered=False)
+
+        updated = await self.get_many(list(instances))
+
+        return {pk: i for pk, i in updated.items() if i is not None}
+
     def get_order(self, order_by: str) -> SortType:
         """
         Return received order or default order if order_by was not provide.
@@ -1,9 +1,14 @@
+import typing as t
+
+import sqlalchemy as sa
 from sqlalchemy.dialects import mysql
 
 from aiohttp_admin2.resources.postgres_resource.postgres_resource import \
     PostgresResource
 from aiohttp_admin2.resources.abc import Instance
+from aiohttp_admin2.resources.abc import InstanceMapper
 from aiohttp_admin2.resources.types import PK
+from aiohttp_admin2.resources.types import FiltersType
 
 
 __all__ = ['MySqlResource', ]
@@ -12,22 +17,62 @@ __all__ = ['MySqlResource', ]
 class MySqlResource(PostgresResource):
 
     _dialect = mysql.dialect()
+    # MySQL consider NULL values as smaller than any other values
+    null_is_largest = False
+    # aiomysql doesn't support server side cursors for sa connections
+    server_side_cursor = False
+
+    def _to_sql(self, query) -> str:
+        if isinstance(query, str):
+            return query
+
+        # fixed problem with post compile in aio-mysql
+        return str(
+            query.compile(
+                compile_kwargs={"literal_binds": True},
+                dialect=self._dialect,
+            )
+        )
 
     async def _execute(self, conn, query):
-        if not isinstance(query, str):
-            # fixed problem with post compile in aio-mysql
-            query = str(
-                query.compile(
-                    compile_kwargs={"literal_binds": True},
-                    dialect=self._dialect,
+        return await conn.execute(self._to_sql(query))
+
+    async def get_estimated_count(
+        self,
+        filters: t.Optional[FiltersType] = None,
+    ) -> int:
+        async with self._acquire(readonly=True) as conn:
+            if filters:
+                # use estimation of rows from plan of the query
+                query = self._get_count_select(self._primary_key, filters)
+                cursor = await self._execute(
+                    conn,
+                    f'EXPLAIN {self._to_sql(query)}',
                 )
+                plan = await cursor.fetchone()
+                # percentage of rows which will be filtered by condition
+                filtered = plan.get('filtered') or 100
+
+                return int((plan['rows'] or 0) * filtered / 100)
+
+            # use statistic of the table which is updated by analyze
+            count = await self._execute_scalar(
+                conn,
+                sa.text(
+                    'SELECT table_rows FROM information_schema.tables '
+                    'WHERE table_schema = DATABASE() AND table_name = :name'
+                ).bindparams(name=self.table.name),
             )
 
-        return await conn.execute(query)
+        # table has not been analyzed yet
+        if not count:
+            return await self.get_count(filters)
+
+        return count
 
     async def create(self, instance: Instance) -> Instance:
         data = instance.data.to_dict()
-        async with self.engine.acquire() as conn:
+        async with self._acquire() as conn:
             query = self.table\
                 .insert()\
                 .values([data])
@@ -41,13 +86,13 @@ class MySqlResource(PostgresResource):
             cursor = await conn.execute(query)
             data = await cursor.fetchone()
 
-            await conn.execute('commit;')
+            await self._commit(conn)
 
             return self._row_to_instance(data)
 
     async def update(self, pk: PK, instance: Instance) -> Instance:
         data = instance.data.to_dict()
-        async with self.engine.acquire() as conn:
+        async with self._acquire() as conn:
             query = self.table\
                 .update()\
                 .where(self._primary_key == pk)\
@@ -62,6 +107,70 @@ class MySqlResource(PostgresResource):
             cursor = await conn.execute(query)
             data = await cursor.fetchone()
 
-            await conn.execute('commit;')
+            await self._commit(conn)
 
             return self._row_to_instance(data)
+
+    async def _select_many(self, conn, pks: t.List[PK]) -> InstanceMapper:
+        query = self.table\
+            .select()\
+            .where(self._primary_key.in_(pks))
+
+        cursor = await self._execute(conn, query)
+
+        return {
+            row[self._primary_key.name]: self._row_to_instance(row)
+            for row in await cursor.fetchall()
+        }
+
+    async def create_many(
+        self,
+        instances: t.List[Instance],
+    ) -> t.List[Instance]:
+        rows = [instance.data.to_dict() for instance in instances]
+        pk_name = self._primary_key.name
+        pks: t.List[t.Optional[PK]] = [None] * len(rows)
+
+        async with self._acquire() as conn:
+            for indexes, chunk in self._split_rows(rows):
+                if pk_name in chunk[0]:
+                    query = self.table.insert().values(chunk)
+                    await self._execute(conn, query)
+                    chunk_pks = [row[pk_name] for row in chunk]
+                else:
+                    # ids of a multi-row insert are not consecutive in the
+                    # interleaved lock mode (the default of mysql 8) or with
+                    # the `auto_increment_increment` larger than 1 so rows
+                    # without ids are inserted one by one in the transaction
+                    chunk_pks = []
+
+                    for row in chunk:
+                        query = self.table.insert().values(row)
+                        result = await self._execute(conn, query)
+                        chunk_pks.append(result.lastrowid)
+
+                for index, pk in zip(indexes, chunk_pks):
+                    pks[index] = pk
+
+            created = await self._select_many(conn, pks)
+            await self._commit(conn)
+
+        return [created.get(pk) for pk in pks]
+
+    async def update_many(self, instances: InstanceMapper) -> InstanceMapper:
+        pks = list(instances)
+
+        async with self._acquire() as conn:
+            for start in range(0, len(pks), self.bulk_chunk_size):
+                query = self._get_update_many_query({
+                    pk: instances[pk].data.to_dict()
+                    for pk in pks[start:start + self.bulk_chunk_size]
+                })
+
+                if query is not None:
+                    await self._execute(conn, query)
+
+            updated = await self._select_many(conn, pks)
+            await self._commit(conn)
+
+        return {pk: updated[pk] for pk in pks if pk in updated}
@@ -1,23 +1,34 @@
+import asyncio
+import json
 import typing as t
 import logging
+import uuid
 
 import sqlalchemy as sa
 from sqlalchemy import func
 from sqlalchemy.engine.row import RowProxy
+from sqlalchemy.sql import operators
 from sqlalchemy.sql.elements import UnaryExpression
 from aiopg.sa import Engine
 
+from aiohttp_admin2.connection_injectors import ConnectionInjector
 from aiohttp_admin2.resources.abc import AbstractResource
+from aiohttp_admin2.resources.abc import Data
 from aiohttp_admin2.resources.abc import Instance
+from aiohttp_admin2.resources.abc import InstanceBatch
 from aiohttp_admin2.resources.abc import InstanceMapper
 from aiohttp_admin2.resources.abc import Paginator
 from aiohttp_admin2.resources.abc import FilterMultiTuple
+from aiohttp_admin2.resources.abc import CountStrategy
+from aiohttp_admin2.resources.exceptions import ClientException
 from aiohttp_admin2.resources.exceptions import InstanceDoesNotExist
 from aiohttp_admin2.resources.exceptions import FilterException
-from aiohttp_admin2.resources.exceptions import CURSOR_PAGINATION_ERROR_MESSAGE
-from aiohttp_admin2.resources.exceptions import ClientException
+from aiohttp_admin2.resources.cursor import encode_cursor
+from aiohttp_admin2.resources.cursor import decode_cursor
+from aiohttp_admin2.resources.cursor import is_cursor_type
 from aiohttp_admin2.resources.types import PK
 from aiohttp_admin2.resources.postgres_resource.utils import to_column
+from aiohttp_admin2.resources.postgres_resource.utils import PrefixedQuery
 from aiohttp_admin2.resources.types import FiltersType
 from aiohttp_admin2.resources.postgres_resource.filters import SQLAlchemyBaseFilter  # noqa
 from aiohttp_admin2.resources.postgres_resource.filters import default_filter_mapper  # noqa
@@ -28,6 +39,13 @@ __all__ = ['PostgresResource', 'SortType', ]
 
 SortType = t.Union[sa.Column, UnaryExpression]
 logger = logging.getLogger('aiohttp_admin.resource')
+# label of the column with value of the sort expression which need for
+# creation of the cursor
+CURSOR_VALUE_LABEL = '_cursor_value'
+# label of the column with the total count which is calculated by the window
+# function
+COUNT_LABEL = '_total_count'
+SERVICE_LABELS = frozenset([CURSOR_VALUE_LABEL, COUNT_LABEL])
 
 
 class PostgresResource(AbstractResource):
@@ -37,6 +55,18 @@ class PostgresResource(AbstractResource):
     name: str
     custom_sort_list: t.Dict[str, t.Callable] = {}
     filter_map = default_filter_mapper
+    # PostgreSQL consider NULL values as larger than any other values
+    null_is_largest: bool = True
+    # get the exact count via the window function together with the page
+    # instead of the separate query. It's faster for small tables but for
+    # large tables the database has to scan all rows which match filters
+    count_with_window: bool = False
+    # use the server side cursor in the `iterate` method instead of the
+    # pagination by chunks
+    server_side_cursor: bool = True
+    # max count of rows in one query of the `create_many` and the
+    # `update_many` methods
+    bulk_chunk_size: int = 1000
 
     # todo: *
     def __init__(
@@ -44,15 +74,35 @@ class PostgresResource(AbstractResource):
         engine: Engine,
         table: sa.Table,
         custom_sort_list: t.Dict[str, t.Callable] = None,
+        connection_injector: t.Optional[ConnectionInjector] = None,
     ) -> None:
         self.engine = engine
         self.table = table
         self.name = table.name.lower()
         self.custom_sort_list = custom_sort_list or {}
+        self.connection_injector = connection_injector
+        # the bound method is shared by all instances of the resource
+        self._name_getter = self._get_instance_name
+
+    def _acquire(self, readonly: bool = False) -> t.AsyncContextManager:
+        """
+        Acquire connection via the connection injector if it's specified. The
+        injector can share one connection between queries of the request and
+        execute read-only queries on replicas.
+        """
+        if self.connection_injector is not None:
+            return self.connection_injector.acquire(readonly=readonly)
+
+        return self.engine.acquire()
 
     async def _execute(self, conn, query):
         return await conn.execute(query)
 
+    async def _commit(self, conn) -> None:
+        # inside the unit of work changes are committed once at the end
+        if not conn.in_transaction:
+            await self._execute(conn, 'commit;')
+
     async def _execute_scalar(self, conn, query):
         res = await self._execute(conn, query)
         return await res.scalar()
@@ -64,7 +114,7 @@ class PostgresResource(AbstractResource):
         return self.table.select()
 
     async def get_one(self, pk: PK) -> Instance:
-        async with self.engine.acquire() as conn:
+        async with self._acquire(readonly=True) as conn:
             query = self.get_one_select()\
                 .where(self._primary_key == pk)
 
@@ -83,23 +133,23 @@ class PostgresResource(AbstractResource):
         field: str = None,
     ) -> InstanceMapper:
         column = sa.column(field) if field else self._primary_key
-        async with self.engine.acquire() as conn:
+        async with self._acquire(readonly=True) as conn:
             query = self.table.select().where(column.in_(pks))
             cursor = await self._execute(conn, query)
 
             relations = {}
-            relations_list = []
+            batch = InstanceBatch()
             multiple_instances_per_key = False
 
             for r in await cursor.fetchall():
-                instance = self._row_to_instance(r, relations_list)
+                instance = self._row_to_instance(r)
 
                 if field:
-                    pk = getattr(instance, field)
+                    pk = getattr(instance.data, field)
                 else:
                     pk = instance.get_pk()
 
-                relations_list.append(instance)
+                batch.append(instance)
 
                 if relations.get(pk):
                     multiple_instances_per_key = True
@@ -125,84 +175,348 @@ class PostgresResource(AbstractResource):
         *,
         limit: int = 50,
         page: int = 1,
-        cursor: t.Optional[int] = None,
+        cursor: t.Optional[t.Union[int, str]] = None,
         order_by: t.Optional[str] = None,
         filters: t.Optional[FiltersType] = None,
+        count_strategy: t.Optional[CountStrategy] = None,
+        fields: t.Optional[t.List[str]] = None,
     ) -> Paginator:
         self._validate_list_params(page=page, cursor=cursor, limit=limit)
 
         offset = (page - 1) * limit
 
         id_orders = f"{self._primary_key.name}", f"-{self._primary_key.name}"
+        # for sorting by other columns we use keyset pagination where cursor
+        # contain value of the sort column and primary key of the last row
+        is_keyset = order_by is not None and order_by not in id_orders
+        order = self.get_order(order_by)
+        count_strategy = CountStrategy(count_strategy or self.count_strategy)
+        with_window_count = (
+            cursor is None
+            and self.count_with_window
+            and count_strategy is CountStrategy.EXACT
+        )
+
+        query = self.get_list_select()
+
+        if fields is not None:
+            query = self.apply_projection(query, fields)
+
+        query = query.limit(limit + 1)
+
+        if is_keyset:
+            column, is_desc = self._split_order(order)
+            query = query\
+                .add_columns(column.label(CURSOR_VALUE_LABEL))\
+                .order_by(
+                    order,
+                    sa.desc(self._primary_key)
+                    if is_desc else self._primary_key,
+                )
 
-        if order_by not in id_orders and cursor:
-            raise ClientException(CURSOR_PAGINATION_ERROR_MESSAGE)
-
-        async with self.engine.acquire() as conn:
-            query = self.get_list_select()\
-                .limit(limit + 1)
+            if cursor is not None:
+                query = query.where(self._get_keyset_condition(
+                    column,
+                    is_desc,
+                    *decode_cursor(cursor),
+                ))
+        else:
+            query = query.order_by(order)
 
             if cursor is not None:
                 if order_by == id_orders[0]:
                     query = query.where(self._primary_key > cursor)
                 else:
                     query = query.where(self._primary_key < cursor)
+
+        if cursor is None:
+            query = query.offset(offset)
+
+        if with_window_count:
+            # total count is calculated before limit so we get it together
+            # with the page in the single query
+            query = query.add_columns(func.count().over().label(COUNT_LABEL))
+
+        if filters:
+            query = self.apply_filters(query=query, filters=filters)
+
+        count = None
+
+        if cursor is None and not with_window_count:
+            # the page and the count don't depend on each other so we fetch
+            # them concurrently via different connections
+            rows, (count, count_strategy) = await asyncio.gather(
+                self._fetch_all(query),
+                self._get_count(filters, count_strategy),
+            )
+        else:
+            rows = await self._fetch_all(query)
+
+        if with_window_count:
+            if rows:
+                count = rows[0][COUNT_LABEL]
+            elif offset:
+                # the page is out of range so we need to count separately
+                count = await self.get_count(filters)
             else:
-                query = query.offset(offset)
+                count = 0
 
-            if filters:
-                query = self.apply_filters(query=query, filters=filters)
+        # rows of the page share the batch to fetch their relations together
+        res = InstanceBatch(self._row_to_instance(r) for r in rows).instances
 
-            cursor_query = await self\
-                ._execute(conn, query.order_by(self.get_order(order_by)))
+        next_id = None
 
-            res = []
+        if is_keyset and len(rows) > limit:
+            last_row = rows[limit - 1]
 
-            for r in await cursor_query.fetchall():
-                res.append(self._row_to_instance(r, res))
+            try:
+                next_id = encode_cursor(
+                    last_row[CURSOR_VALUE_LABEL],
+                    last_row[self._primary_key.name],
+                )
+            except ClientException:
+                # values of custom sorts can have types which can't be stored
+                # in the cursor, the offset pagination works without it
+                next_id = None
+
+        if cursor is None:
+            return self.create_paginator(
+                instances=res,
+                limit=limit,
+                offset=offset,
+                count=count,
+                next_id=next_id,
+                count_strategy=count_strategy,
+            )
+        else:
+            return self.create_paginator(
+                instances=res,
+                limit=limit,
+                cursor=cursor,
+                next_id=next_id,
+            )
+
+    def apply_projection(
+        self,
+        query: sa.sql.Select,
+        fields: t.List[str],
+    ) -> sa.sql.Select:
+        """
+        Leave in the query only columns with received names and the primary
+        key, so large columns which aren't needed are not fetched.
+        """
+        names = {*fields, self._primary_key.name}
 
-            if cursor is None:
-                if filters:
-                    count: int = await self._execute_scalar(
-                        conn,
-                        self.apply_filters(
-                            query=sa.select([func.count(self._primary_key)]),
-                            filters=filters,
-                        )
-                    )
-                else:
-                    count: int = await self._execute_scalar(
-                        conn,
-                        sa.select([func.count(self._primary_key)])
+        return query.with_only_columns([
+            column
+            for column in query.selected_columns
+            if column.name in names
+        ])
+
+    async def iterate(
+        self,
+        *,
+        order_by: t.Optional[str] = None,
+        filters: t.Optional[FiltersType] = None,
+        fields: t.Optional[t.List[str]] = None,
+        chunk_size: t.Optional[int] = None,
+    ) -> t.AsyncIterator[Instance]:
+        if not self.server_side_cursor:
+            async for instance in super().iterate(
+                order_by=order_by,
+                filters=filters,
+                fields=fields,
+                chunk_size=chunk_size,
+            ):
+                yield instance
+
+            return
+
+        chunk_size = chunk_size or self.iterate_chunk_size
+        query = self.get_list_select()
+
+        if fields is not None:
+            query = self.apply_projection(query, fields)
+
+        order = self.get_order(order_by)
+        _, is_desc = self._split_order(order)
+        query = query.order_by(
+            order,
+            sa.desc(self._primary_key) if is_desc else self._primary_key,
+        )
+
+        if filters:
+            query = self.apply_filters(query=query, filters=filters)
+
+        name = f'admin_cursor_{uuid.uuid4().hex}'
+
+        async with self._acquire(readonly=True) as conn:
+            # server side cursors live only inside a transaction
+            transaction = None if conn.in_transaction else await conn.begin()
+
+            try:
+                await conn.execute(PrefixedQuery(
+                    f'DECLARE {name} NO SCROLL CURSOR FOR',
+                    query,
+                ))
+
+                while True:
+                    cursor = await conn.execute(
+                        f'FETCH FORWARD {int(chunk_size)} FROM {name}'
                     )
-                return self.create_paginator(
-                    instances=res,
-                    limit=limit,
-                    offset=offset,
-                    count=count,
-                )
-            else:
-                return self.create_paginator(
-                    instances=res,
-                    limit=limit,
-                    cursor=cursor,
+                    rows = await cursor.fetchall()
+
+                    for r in rows:
+                        yield self._row_to_instance(r)
+
+                    if len(rows) < chunk_size:
+                        break
+
+                await conn.execute(f'CLOSE {name}')
+            finally:
+                # the cursor only read data so we have nothing to commit
+                if transaction is not None:
+                    await transaction.rollback()
+
+    async def _fetch_all(self, query: sa.sql.Select) -> t.List[RowProxy]:
+        async with self._acquire(readonly=True) as conn:
+            cursor = await self._execute(conn, query)
+
+            return await cursor.fetchall()
+
+    def _get_count_select(
+        self,
+        column: sa.sql.ColumnElement,
+        filters: t.Optional[FiltersType] = None,
+    ) -> sa.sql.Select:
+        """
+        Return query which select received column for all rows which match
+        received filters.
+        """
+        query = sa.select([column])
+
+        if filters:
+            query = self.apply_filters(query=query, filters=filters)
+
+        return query
+
+    async def get_count(self, filters: t.Optional[FiltersType] = None) -> int:
+        query = self._get_count_select(
+            func.count(self._primary_key),
+            filters,
+        )
+
+        async with self._acquire(readonly=True) as conn:
+            return await self._execute_scalar(conn, query)
+
+    async def get_estimated_count(
+        self,
+        filters: t.Optional[FiltersType] = None,
+    ) -> int:
+        async with self._acquire(readonly=True) as conn:
+            if filters:
+                # use estimation of rows from plan of the query
+                query = self._get_count_select(self._primary_key, filters)
+                cursor = await conn.execute(
+                    PrefixedQuery('EXPLAIN (FORMAT JSON)', query),
                 )
+                plan = await cursor.scalar()
+
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+
+                return int(plan[0]['Plan']['Plan Rows'])
+
+            # use statistic of the table which is updated by analyze
+            count = await self._execute_scalar(
+                conn,
+                sa.text(
+                    'SELECT reltuples::bigint FROM pg_class '
+                    'WHERE oid = CAST(:name AS regclass)'
+                ).bindparams(name=self.table.fullname),
+            )
+
+        # table has not been analyzed yet
+        if not count or count < 0:
+            return await self.get_count(filters)
+
+        return count
+
+    async def get_capped_count(
+        self,
+        filters: t.Optional[FiltersType] = None,
+        cap: int = 10000,
+    ) -> int:
+        subquery = self._get_count_select(self._primary_key, filters)\
+            .limit(cap + 1)\
+            .alias()
+        query = sa.select([func.count()]).select_from(subquery)
+
+        async with self._acquire(readonly=True) as conn:
+            return await self._execute_scalar(conn, query)
 
     async def delete(self, pk: PK) -> None:
-        async with self.engine.acquire() as conn:
+        async with self._acquire() as conn:
             query = self.table\
                 .delete()\
                 .where(self._primary_key == pk)
 
             cursor = await self._execute(conn, query)
-            await self._execute(conn, 'commit;')
+            await self._commit(conn)
 
             if not cursor.rowcount:
                 raise InstanceDoesNotExist
 
+    def _apply_selection(
+        self,
+        query: t.Union[sa.sql.Delete, sa.sql.Update],
+        pks: t.Optional[t.List[PK]] = None,
+        filters: t.Optional[FiltersType] = None,
+    ) -> t.Union[sa.sql.Delete, sa.sql.Update]:
+        if pks is not None:
+            query = query.where(self._primary_key.in_(pks))
+
+        if filters:
+            query = self.apply_filters(query=query, filters=filters)
+
+        return query
+
+    async def delete_many(
+        self,
+        pks: t.Optional[t.List[PK]] = None,
+        *,
+        filters: t.Optional[FiltersType] = None,
+    ) -> int:
+        query = self._apply_selection(self.table.delete(), pks, filters)
+
+        async with self._acquire() as conn:
+            cursor = await self._execute(conn, query)
+            await self._commit(conn)
+
+            return cursor.rowcount
+
+    async def update_fields(
+        self,
+        values: t.Dict[str, t.Any],
+        pks: t.Optional[t.List[PK]] = None,
+        *,
+        filters: t.Optional[FiltersType] = None,
+    ) -> int:
+        query = self._apply_selection(
+            self.table.update().values(**values),
+            pks,
+            filters,
+        )
+
+        async with self._acquire() as conn:
+            cursor = await self._execute(conn, query)
+            await self._commit(conn)
+
+            return cursor.rowcount
+
     async def create(self, instance: Instance) -> Instance:
         data = instance.data.to_dict()
-        async with self.engine.acquire() as conn:
+        async with self._acquire() as conn:
             query = self.table\
                 .insert()\
                 .values([data])\
@@ -216,7 +530,7 @@ class PostgresResource(AbstractResource):
     async def update(self, pk: PK, instance: Instance) -> Instance:
         data = instance.data.to_dict()
 
-        async with self.engine.acquire() as conn:
+        async with self._acquire() as conn:
             query = self.table\
                 .update()\
                 .where(self._primary_key == pk)\
@@ -228,6 +542,113 @@ class PostgresResource(AbstractResource):
 
             return self._row_to_instance(data)
 
+    def _split_rows(
+        self,
+        rows: t.List[t.Dict[str, t.Any]],
+    ) -> t.Iterator[t.Tuple[t.List[int], t.List[t.Dict[str, t.Any]]]]:
+        """
+        Split rows to chunks of rows with the same columns (rows of one
+        multi-row insert must have the same columns). Each chunk is returned
+        together with indexes of its rows in the received list.
+        """
+        groups: t.Dict[t.Tuple[str, ...], t.List[int]] = {}
+
+        for index, row in enumerate(rows):
+            groups.setdefault(tuple(sorted(row)), []).append(index)
+
+        for indexes in groups.values():
+            for start in range(0, len(indexes), self.bulk_chunk_size):
+                chunk = indexes[start:start + self.bulk_chunk_size]
+
+                yield chunk, [rows[index] for index in chunk]
+
+    def _get_update_many_query(
+        self,
+        rows: t.Dict[PK, t.Dict[str, t.Any]],
+    ) -> t.Optional[sa.sql.Update]:
+        """
+        Return one update query for all received rows where each column is
+        set via `CASE pk WHEN ... THEN ... ELSE column END` or `None` if there
+        are no columns to update.
+        """
+        pk = self._primary_key
+        whens: t.Dict[str, list] = {}
+
+        for key, row in rows.items():
+            for name, value in row.items():
+                if name == pk.name:
+                    continue
+
+                column = self.table.c[name]
+                whens.setdefault(name, [])\
+                    .append((pk == key, sa.literal(value, column.type)))
+
+        if not whens:
+            return None
+
+        return self.table\
+            .update()\
+            .where(pk.in_(list(rows)))\
+            .values({
+                name: sa.case(*conditions, else_=self.table.c[name])
+                for name, conditions in whens.items()
+            })
+
+    async def create_many(
+        self,
+        instances: t.List[Instance],
+    ) -> t.List[Instance]:
+        rows = [instance.data.to_dict() for instance in instances]
+        created: t.List[t.Optional[Instance]] = [None] * len(rows)
+
+        async with self._acquire() as conn:
+            for indexes, chunk in self._split_rows(rows):
+                query = self.table\
+                    .insert()\
+                    .values(chunk)\
+                    .returning(*self.table.c)
+
+                cursor = await self._execute(conn, query)
+
+                # postgres returns inserted rows in order of values
+                for index, row in zip(indexes, await cursor.fetchall()):
+                    created[index] = self._row_to_instance(row)
+
+            await self._commit(conn)
+
+        return created
+
+    async def update_many(self, instances: InstanceMapper) -> InstanceMapper:
+        rows = {pk: i.data.to_dict() for pk, i in instances.items()}
+        pks = list(rows)
+        updated = {}
+
+        async with self._acquire() as conn:
+            for start in range(0, len(pks), self.bulk_chunk_size):
+                chunk = pks[start:start + self.bulk_chunk_size]
+                query = self._get_update_many_query(
+                    {pk: rows[pk] for pk in chunk},
+                )
+
+                if query is None:
+                    # there is nothing to update so only existed rows are
+                    # returned
+                    query = self.table\
+                        .select()\
+                        .where(self._primary_key.in_(chunk))
+                else:
+                    query = query.returning(*self.table.c)
+
+                cursor = await self._execute(conn, query)
+
+                for row in await cursor.fetchall():
+                    updated[row[self._primary_key.name]] = \
+                        self._row_to_instance(row)
+
+            await self._commit(conn)
+
+        return {pk: updated[pk] for pk in pks if pk in updated}
+
     @property
     def _primary_key(self) -> sa.Column:
         """
@@ -253,6 +674,76 @@ class PostgresResource(AbstractResource):
 
         return sa.desc(self._primary_key)
 
+    def is_cursor_sortable(self, name: str) -> bool:
+        if name in self.custom_sort_list:
+            return True
+
+        column = self.table.c.get(name)
+
+        if column is None:
+            return False
+
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            return False
+
+        # values of the column are stored in the cursor
+        return is_cursor_type(python_type)
+
+    @staticmethod
+    def _split_order(order: SortType) -> t.Tuple[sa.sql.ColumnElement, bool]:
+        """
+        Return the sort expression without direction and flag which mean that
+        the order is descending.
+        """
+        if isinstance(order, UnaryExpression):
+            if order.modifier is operators.desc_op:
+                return order.element, True
+
+            if order.modifier is operators.asc_op:
+                return order.element, False
+
+        return order, False
+
+    def _get_keyset_condition(
+        self,
+        column: sa.sql.ColumnElement,
+        is_desc: bool,
+        value: t.Any,
+        pk: PK,
+    ) -> sa.sql.ColumnElement:
+        """
+        Return condition to select rows which are placed after the row with
+        received value of the sort column and primary key.
+        """
+        pk_column = self._primary_key
+        # NULL values aren't comparable so we need to handle them separately
+        nulls_at_end = self.null_is_largest != is_desc
+
+        if value is None:
+            condition = sa.and_(
+                column.is_(None),
+                pk_column < pk if is_desc else pk_column > pk,
+            )
+
+            if nulls_at_end:
+                return condition
+
+            return sa.or_(condition, column.isnot(None))
+
+        row = sa.tuple_(column, pk_column)
+        row_value = sa.tuple_(
+            sa.literal(value, type_=column.type),
+            sa.literal(pk, type_=pk_column.type),
+        )
+        condition = row < row_value if is_desc else row > row_value
+
+        if nulls_at_end and getattr(column, 'nullable', True):
+            return sa.or_(condition, column.is_(None))
+
+        return condition
+
     def apply_filters(
         self,
         *,
@@ -296,18 +787,18 @@ class PostgresResource(AbstractResource):
     def object_name(self, row: RowProxy) -> str:
         return f'<{self.name} id={row.id}>'
 
+    def _get_instance_name(self, instance: Instance) -> str:
+        return self.object_name(instance.data.to_row())
+
     def _row_to_instance(
         self,
         row: RowProxy,
-        prefetch_together: t.List[Instance] = None,
     ) -> Instance:
         instance = Instance()
-        instance.data = dict(row)
-        instance.set_name(self.object_name(row))
-
-        if prefetch_together is None:
-            instance._prefetch_together = [instance]
-
-        instance._prefetch_together = prefetch_together
+        # fields are read from the row of the driver without copy, service
+        # columns of the list page are hidden
+        instance.data = Data(row, SERVICE_LABELS)
+        # the name is formatted only if it's needed
+        instance.set_name_getter(self._name_getter)
 
         return instance
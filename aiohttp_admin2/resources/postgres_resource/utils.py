@@ -1,9 +1,12 @@
 import sqlalchemy as sa
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement
+from sqlalchemy.sql.expression import Executable
 
 from aiohttp_admin2.resources.exceptions import ClientException
 
 
-__all__ = ["to_column", ]
+__all__ = ["to_column", "PrefixedQuery", ]
 
 
 def to_column(column_name: str, table: sa.Table) -> sa.Column:
@@ -21,3 +24,20 @@ def to_column(column_name: str, table: sa.Table) -> sa.Column:
         )
 
     return res
+
+
+class PrefixedQuery(Executable, ClauseElement):
+    """
+    The query with the raw sql prefix (e.g. `EXPLAIN` or `DECLARE ... FOR`)
+    which is executed via sqlalchemy, so values of parameters are processed
+    by types of columns (e.g. enums and json).
+    """
+
+    def __init__(self, prefix: str, query: sa.sql.Select) -> None:
+        self.prefix = prefix
+        self.query = query
+
+
+@compiles(PrefixedQuery)
+def _compile_prefixed_query(element, compiler, **kwargs):
+    return f'{element.prefix} {compiler.process(element.query, **kwargs)}'
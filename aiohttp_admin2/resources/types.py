@@ -4,6 +4,8 @@ from aiohttp_admin2.resources.abc import (
     FiltersType,
     FilterMultiTuple,
     Instance,
+    InstanceBatch,
+    CountStrategy,
 )
 
 
@@ -12,5 +14,7 @@ __all__ = [
     "FilterTuple",
     "FiltersType",
     "Instance",
+    "InstanceBatch",
     "FilterMultiTuple",
+    "CountStrategy",
 ]
@@ -12,6 +12,7 @@ import aiohttp_jinja2
 
 from aiohttp_admin2.views.aiohttp.utils import get_field_value
 from aiohttp_admin2.views.aiohttp.views.base import global_list_view
+from aiohttp_admin2.views.aiohttp.views.registry import access_hooks_limit
 from aiohttp_admin2.views import DashboardView
 from aiohttp_admin2.views import BaseAdminView
 
@@ -34,6 +35,9 @@ class Admin:
     admin_url = '/admin/'
     dashboard_class = DashboardView
     logout_path: t.Optional[str] = '/logout'
+    # the max number of access hooks which will be run concurrently per
+    # request
+    access_hooks_limit: int = 10
 
     def __init__(
         self,
@@ -123,6 +127,7 @@ class Admin:
                 tabs.append(tab_view)
 
         global_list_view.set([*self._views, *tabs])
+        access_hooks_limit.set(self.access_hooks_limit)
 
     def setup_admin_application(
         self,
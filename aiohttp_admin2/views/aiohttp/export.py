@@ -0,0 +1,118 @@
+import csv
+import io
+import json
+import typing as t
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from enum import Enum
+
+from aiohttp_admin2.resources.types import Instance
+
+
+__all__ = [
+    'Exporter',
+    'CsvExporter',
+    'JsonLinesExporter',
+    'EXPORT_FORMATS',
+]
+
+
+class Exporter(ABC):
+    """
+    This class convert instances to lines of the exported file. If fields are
+    not specified then fields of the first instance are used.
+    """
+    content_type: str
+    extension: str
+
+    def __init__(self, fields: t.Optional[t.List[str]] = None) -> None:
+        self.fields = fields
+        self._is_started = False
+
+    def start(self) -> str:
+        """Return the beginning of the file (e.g. the header)."""
+        return ''
+
+    @abstractmethod
+    def convert(self, instance: Instance) -> str:
+        """Return the line of the file for received instance."""
+
+    def write(self, instance: Instance) -> str:
+        """Return the line for received instance (with the beginning)."""
+        if self.fields is None:
+            self.fields = list(instance.data.to_dict())
+
+        return self._begin() + self.convert(instance)
+
+    def finish(self) -> str:
+        """
+        Return the end of the file (e.g. the header of the empty file if
+        fields are known).
+        """
+        if self.fields is None:
+            return ''
+
+        return self._begin()
+
+    def _begin(self) -> str:
+        if self._is_started:
+            return ''
+
+        self._is_started = True
+
+        return self.start()
+
+    def get_values(self, instance: Instance) -> t.List[t.Any]:
+        values = []
+
+        for field in self.fields:
+            value = getattr(instance.data, field, None)
+
+            if isinstance(value, Enum):
+                value = value.value
+
+            values.append(value)
+
+        return values
+
+
+class CsvExporter(Exporter):
+    content_type = 'text/csv'
+    extension = 'csv'
+
+    def __init__(self, fields: t.Optional[t.List[str]] = None) -> None:
+        super().__init__(fields)
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+
+    def _write_row(self, row: t.List[t.Any]) -> str:
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self._writer.writerow(row)
+
+        return self._buffer.getvalue()
+
+    def start(self) -> str:
+        return self._write_row(self.fields)
+
+    def convert(self, instance: Instance) -> str:
+        return self._write_row(self.get_values(instance))
+
+
+class JsonLinesExporter(Exporter):
+    content_type = 'application/x-ndjson'
+    extension = 'jsonl'
+
+    def convert(self, instance: Instance) -> str:
+        data = dict(zip(self.fields, self.get_values(instance)))
+
+        return json.dumps(data, default=str) + '\n'
+
+
+# available formats of the export, the key is a value of the `format` param
+EXPORT_FORMATS: t.Dict[str, t.Type[Exporter]] = {
+    'csv': CsvExporter,
+    'jsonl': JsonLinesExporter,
+}
@@ -0,0 +1,117 @@
+import codecs
+import csv
+import json
+import typing as t
+from abc import (
+    ABC,
+    abstractmethod,
+)
+
+
+__all__ = [
+    'Importer',
+    'CsvImporter',
+    'JsonLinesImporter',
+    'IMPORT_FORMATS',
+]
+
+
+Row = t.Dict[str, t.Any]
+
+
+class Importer(ABC):
+    """
+    This class convert chunks of the imported file to rows. Chunks can be
+    split in any place so the incomplete line is kept till the next chunk.
+
+    >>> importer = CsvImporter()
+    >>> list(importer.feed(b'id,name\\n1,Bo'))
+    []
+    >>> list(importer.feed(b'b\\n', final=True))
+    [{'id': '1', 'name': 'Bob'}]
+    """
+
+    def __init__(self, encoding: str = 'utf-8-sig') -> None:
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._tail = ''
+
+    def feed(self, chunk: bytes, final: bool = False) -> t.Iterator[Row]:
+        """
+        Return iterator over rows which are completed by received chunk. Rows
+        before an invalid line are returned before the error is raised.
+        """
+        lines = (self._tail + self._decoder.decode(chunk, final)).split('\n')
+        self._tail = '' if final else lines.pop()
+
+        for number, line in enumerate(lines):
+            is_last = final and number == len(lines) - 1
+            row = self.parse_line(line if is_last else line + '\n')
+
+            if row is not None:
+                yield row
+
+    @abstractmethod
+    def parse_line(self, line: str) -> t.Optional[Row]:
+        """
+        Return the row for received line or `None` if the line doesn't
+        contain a row (e.g. it's the header or the row is not completed yet).
+
+        Raises:
+            ValueError: if the line is invalid
+        """
+
+
+class CsvImporter(Importer):
+    extension = 'csv'
+
+    def __init__(self, encoding: str = 'utf-8-sig') -> None:
+        super().__init__(encoding)
+        self.fields: t.Optional[t.List[str]] = None
+        self._record = ''
+
+    def parse_line(self, line: str) -> t.Optional[Row]:
+        self._record += line
+
+        # the quoted value contains the line break so the record continues
+        # on the next line
+        if self._record.count('"') % 2:
+            return None
+
+        record, self._record = self._record, ''
+
+        if not record.strip():
+            return None
+
+        try:
+            values = next(csv.reader([record]))
+        except csv.Error as e:
+            raise ValueError(str(e))
+
+        if self.fields is None:
+            self.fields = values
+
+            return None
+
+        return dict(zip(self.fields, values))
+
+
+class JsonLinesImporter(Importer):
+    extension = 'jsonl'
+
+    def parse_line(self, line: str) -> t.Optional[Row]:
+        if not line.strip():
+            return None
+
+        row = json.loads(line)
+
+        if not isinstance(row, dict):
+            raise ValueError('Each line of the file must be a json object')
+
+        return row
+
+
+# available formats of the import, the key is an extension of the file
+IMPORT_FORMATS: t.Dict[str, t.Type[Importer]] = {
+    'csv': CsvImporter,
+    'jsonl': JsonLinesImporter,
+}
@@ -11,7 +11,7 @@ class QueryParams(t.NamedTuple):
     # todo: description
     """
     page: t.Optional[int]
-    cursor: t.Optional[int]
+    cursor: t.Optional[t.Union[int, str]]
     order_by: t.Optional[str]
 
 
@@ -28,9 +28,13 @@ def get_params_from_request(req: web.Request) -> QueryParams:
     if sort and sort_dir == 'desc':
         sort = f'-{sort}'
 
+    # cursor is a primary key or an opaque string for the keyset pagination
+    if cursor and cursor.isdigit():
+        cursor = int(cursor)
+
     return QueryParams(
         page=page,
-        cursor=int(cursor) if cursor else None,
+        cursor=cursor or None,
         order_by=sort,
     )
 
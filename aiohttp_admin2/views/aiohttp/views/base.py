@@ -20,7 +20,11 @@ from aiohttp_admin2.views.aiohttp.exceptions import CanNotCreateUnfrozenView
 from aiohttp_admin2.views.aiohttp.exceptions import UseHandlerWithoutAccess
 from aiohttp_admin2.views.aiohttp.exceptions import NotRegisterView
 from aiohttp_admin2.controllers.controller import controllers_map
+from aiohttp_admin2.resources.data_loader import data_loaders
 from aiohttp_admin2.controllers.exceptions import PermissionDenied
+from aiohttp_admin2.views.aiohttp.views.registry import ViewsRegistry
+from aiohttp_admin2.views.aiohttp.views.registry import views_registry
+from aiohttp_admin2.views.aiohttp.views.registry import global_views_instance
 
 if t.TYPE_CHECKING:
     from aiohttp_admin2.views.aiohttp.views.tab_base_view import TabBaseView # noqa
@@ -63,12 +67,6 @@ DEFAULT_FILTER_MAP = {
 ViewsMap = ContextVar[t.List[t.Type['BaseAdminView']]]
 global_list_view: ViewsMap = ContextVar('global_list_view', default=None)
 
-ViewsInstanceMap = ContextVar[t.List['BaseAdminView']]
-global_views_instance: ViewsInstanceMap = ContextVar(
-    'views_instance_map',
-    default=None,
-)
-
 
 class BaseAdminView:
     """
@@ -151,9 +149,12 @@ class BaseAdminView:
     # Set to True if we don't want to give access to current views
     has_access: bool = True
 
-    def get_nav_groups(self) -> t.Dict[str, t.List[t.Type['BaseAdminView']]]:
+    async def get_nav_groups(
+        self,
+    ) -> t.Dict[str, t.List[t.Type['BaseAdminView']]]:
         nav_groups = defaultdict(list)
-        views = global_views_instance.get() or []
+        registry = views_registry.get()
+        views = await registry.resolve_all() if registry else []
 
         for view in views:
             if not view.is_hide_view and view.has_access:
@@ -173,7 +174,7 @@ class BaseAdminView:
             "url_query": req.rel_url.query,
             "url_path": req.rel_url.path,
             "message": req.rel_url.query.get('message'),
-            "nav_groups": self.get_nav_groups(),
+            "nav_groups": await self.get_nav_groups(),
         }
 
     @classmethod
@@ -192,20 +193,33 @@ class BaseAdminView:
         """
         cls._raise_if_frozen()
         cls._tabs = cls._tabs or []
-        for attr_name in dir(cls):
-            attr = getattr(cls, attr_name)
-            route_info = get_route(attr)
-            if route_info:
-                url_info = cls.get_url(attr)
-
-                app.add_routes([
-                    web.route(
-                        method=route_info.method,
-                        path=url_info.url,
-                        handler=cls._handler_builder(attr),
-                        name=url_info.name
-                    )
-                ])
+        handlers = [
+            getattr(cls, attr_name)
+            for attr_name in dir(cls)
+            if get_route(getattr(cls, attr_name))
+        ]
+        handlers = [
+            handler
+            for handler in handlers
+            if cls.is_route_enabled(handler)
+        ]
+
+        # routes are matched in order of registration so static routes (e.g.
+        # `/create/`) are registered before routes with variable parts (e.g.
+        # `/{pk}/`) which can match the same url
+        handlers.sort(key=lambda handler: '{' in get_route(handler).url)
+
+        for handler in handlers:
+            url_info = cls.get_url(handler)
+
+            app.add_routes([
+                web.route(
+                    method=get_route(handler).method,
+                    path=url_info.url,
+                    handler=cls._handler_builder(handler),
+                    name=url_info.name
+                )
+            ])
 
         if hasattr(cls, 'controller'):
             for relation in cls.controller.relations_to_many:
@@ -222,6 +236,14 @@ class BaseAdminView:
 
         cls._is_frozen = True
 
+    @classmethod
+    def is_route_enabled(cls, handler) -> bool:
+        """
+        Return False if the route of received handler must not be registered
+        (e.g. the feature of the route is disabled by settings of the view).
+        """
+        return True
+
     @classmethod
     def get_url(cls, handler) -> UrlInfo:
         """
@@ -250,29 +272,23 @@ class BaseAdminView:
         """
         The each request have to generate new views for correction work of
         permission access and the current method implement this requirement.
+
+        Only the current view is created eagerly, all other views will be
+        created by the registry of views when somebody need them.
         """
         async def handler(request: web.Request) -> web.Response:
             cls._raise_if_unfrozen()
             controllers_map.set({})
-            views = global_list_view.get() or []
-            views_instance = []
-            current_view = None
-
-            for view in views:
-                view_instance = view(request)
-                await view_instance._inner_access_hook()
-                views_instance.append(view_instance)
-
-                if view is cls:
-                    current_view = view_instance
+            data_loaders.set({})
+            registry = ViewsRegistry(request, global_list_view.get() or [])
+            views_registry.set(registry)
 
-            if not current_view:
+            if cls not in registry:
                 raise NotRegisterView
 
+            current_view = await registry.get(cls)
             current_view._raise_if_no_checked_access()
 
-            global_views_instance.set(views_instance)
-
             if not current_view.has_access:
                 raise PermissionDenied
 
@@ -285,6 +301,29 @@ class BaseAdminView:
         This method need to redefine settings for each request.
         """
 
+    async def check_permission(
+        self,
+        key: t.Hashable,
+        fn: t.Callable[[], t.Awaitable[t.Any]],
+    ) -> t.Any:
+        """
+        This method need to share results of identical permission lookups
+        between access hooks of different views. The received function will
+        be called only once per request for each unique key.
+
+        >>> async def access_hook(self) -> None:
+        >>>     self.has_access = await self.check_permission(
+        >>>         ('books', 'view'),
+        >>>         lambda: rbac_client.can(self.request, 'books', 'view'),
+        >>>     )
+        """
+        registry = views_registry.get()
+
+        if registry:
+            return await registry.lookup(key, fn)
+
+        return await fn()
+
     async def _inner_access_hook(self) -> None:
         self._is_checked_access = True
         await self.access_hook()
@@ -298,6 +337,7 @@ class BaseControllerView(BaseAdminView):
     template_detail_edit_name = 'aiohttp_admin/layouts/detail_edit_page.html'
     template_detail_create_name = 'aiohttp_admin/layouts/create_page.html'
     template_delete_name = 'aiohttp_admin/layouts/delete_page.html'
+    template_import_name = 'aiohttp_admin/layouts/import_page.html'
 
     infinite_scroll = False
     fields_widgets = {}
@@ -420,20 +460,34 @@ class BaseControllerView(BaseAdminView):
     def get_controller(self) -> Controller:
         return self._controller
 
+    async def prepare_related_views(self) -> None:
+        """
+        Access settings of related controllers are defined by access hooks of
+        their views so we need to check access of these views before use
+        related controllers (e.g. for generate links to related instances).
+        """
+        registry = views_registry.get()
+
+        if registry:
+            await registry.resolve_by_controllers(
+                relation.controller
+                for relation in self.get_controller().relations_to_one
+            )
+
     @classmethod
     def setup(
         cls,
         app: web.Application,
     ) -> None:
         super().setup(app)
-        controller = cls.controller.builder()
+        cls.controller.setup()
 
         # autocomplete
         autocomplete_routes = []
-        for name, relation in controller.foreign_keys_field_map.items():
-            def autocomplete_wrapper(inner_controller):
+        for name, relation in cls.controller.foreign_keys_field_map.items():
+            def autocomplete_wrapper(controller_cls):
                 async def autocomplete(req):
-                    res = await inner_controller\
+                    res = await controller_cls.builder()\
                         .get_autocomplete_items(
                             text=req.rel_url.query.get('q'),
                             page=int(req.rel_url.query.get('page', 1)),
@@ -445,7 +499,7 @@ class BaseControllerView(BaseAdminView):
 
             autocomplete_routes.append(web.get(
                 cls.get_autocomplete_url(name),
-                autocomplete_wrapper(relation.controller.builder()),
+                autocomplete_wrapper(relation.controller),
                 name=cls.get_autocomplete_url_name(name)
             ))
 
@@ -1,4 +1,5 @@
 import typing as t
+import zlib
 
 import aiohttp_jinja2
 from aiohttp import web
@@ -9,9 +10,15 @@ from aiohttp_admin2.controllers.relations import ToManyRelation
 from aiohttp_admin2.resources.types import Instance
 from aiohttp_admin2.controllers.controller import DETAIL_NAME
 from aiohttp_admin2.controllers.controller import FOREIGNKEY_DETAIL_NAME
+from aiohttp_admin2.controllers.exceptions import PermissionDenied
+from aiohttp_admin2.controllers.types import ImportResult
 from aiohttp_admin2.views.aiohttp.views.utils import route
 from aiohttp_admin2.mappers import Mapper
-from aiohttp_admin2.views.aiohttp.views.base import global_views_instance
+from aiohttp_admin2.resources.exceptions import BadParameters
+from aiohttp_admin2.views.aiohttp.views.base import global_list_view
+from aiohttp_admin2.views.aiohttp.views.registry import views_registry
+from aiohttp_admin2.views.aiohttp.export import Exporter
+from aiohttp_admin2.views.aiohttp.importer import Importer
 
 __all__ = ['ControllerView', ]
 
@@ -21,6 +28,24 @@ class ControllerView(BaseControllerView):
     This class need for represent a pages based on controller for admin
     interface.
     """
+    # available formats of the export of the list page, the export is
+    # disabled by default (e.g. use `EXPORT_FORMATS` to enable all formats)
+    export_formats: t.Dict[str, t.Type[Exporter]] = {}
+    # available formats of the import, the key is an extension of the file.
+    # The import is disabled by default (e.g. use `IMPORT_FORMATS` to enable
+    # all formats) and is available only if the controller can create
+    # instances
+    import_formats: t.Dict[str, t.Type[Importer]] = {}
+
+    @classmethod
+    def is_route_enabled(cls, handler) -> bool:
+        if handler is cls.export_list:
+            return bool(cls.export_formats)
+
+        if handler in (cls.get_bulk_import, cls.post_bulk_import):
+            return bool(cls.import_formats)
+
+        return super().is_route_enabled(handler)
 
     @classmethod
     def get_index_url_name(cls):
@@ -30,20 +55,19 @@ class ControllerView(BaseControllerView):
     def get_index_url(cls):
         return str(cls.index_url or f'/{cls.get_index_url_name()}/')
 
-    def get_detail_url(self):
-        return self.get_url(self.get_detail).name
+    @classmethod
+    def get_detail_url(cls):
+        return cls.get_url(cls.get_detail).name
 
     @classmethod
     def get_name(cls):
         """This method return the pretty name of the current views"""
         return str(cls.name or cls.controller.get_name())
 
-    def tabs_list(self):
-        views = global_views_instance.get() or []
-        return [
-            v for v in views
-            if v.__class__ in self._tabs and v.get_controller().can_view
-        ]
+    async def tabs_list(self):
+        registry = views_registry.get()
+        views = await registry.resolve(self._tabs) if registry else []
+        return [v for v in views if v.get_controller().can_view]
 
     @route(r'/')
     async def get_list(self, req: web.Request) -> web.Response:
@@ -57,9 +81,9 @@ class ControllerView(BaseControllerView):
         )
 
         url_name_maps = {
-            i.get_controller().url_name(): i.get_detail_url()
-            for i in global_views_instance.get() or []
-            if hasattr(i, 'controller')
+            v.controller.url_name(): v.get_detail_url()
+            for v in global_list_view.get() or []
+            if hasattr(v, 'controller')
         }
 
         def url_builder(obj: Instance, url_type: str, **kwargs) -> str:
@@ -79,6 +103,8 @@ class ControllerView(BaseControllerView):
 
             return ''
 
+        await self.prepare_related_views()
+
         data = await controller.get_list(
             **params._asdict(),
             filters=filters,
@@ -104,11 +130,242 @@ class ControllerView(BaseControllerView):
                     req.app.router[self.get_url(self.get_create).name]
                     .url_for()
                 ),
+                "export_url": str(
+                    req.app.router[self.get_url(self.export_list).name]
+                    .url_for()
+                    .with_query(req.rel_url.query)
+                ) if self.export_formats else None,
+                "import_url": str(
+                    req.app.router[self.get_url(self.get_bulk_import).name]
+                    .url_for()
+                ) if self.import_formats else None,
+                "bulk_action_url": str(
+                    req.app.router[self.get_url(self.bulk_action).name]
+                    .url_for()
+                    .with_query(req.rel_url.query)
+                ),
                 "media": self.get_extra_media_list(),
                 "view_filters": self.get_filters(req.rel_url.query),
             }
         )
 
+    @route(r'/bulk/', method='POST')
+    async def bulk_action(self, req: web.Request) -> None:
+        """
+        Apply the bulk action to selected instances. If the `select_all` param
+        is specified then the action is applied to all instances which match
+        filters of the list page (without filters the `confirm_all` param is
+        required). Values for the action are received from params with the
+        `value_` prefix.
+        """
+        controller = self.get_controller()
+        form = await req.post()
+        name = form.get('action')
+        pks = None
+        filters = None
+
+        if form.get('select_all'):
+            filters = self.get_list_filters(
+                req,
+                controller,
+                self.default_filter_map,
+            )
+        else:
+            pks = [
+                int(pk) if pk.isdigit() else pk
+                for pk in form.getall('pk', [])
+            ]
+
+        data = {
+            key[len('value_'):]: value
+            for key, value in form.items()
+            if key.startswith('value_')
+        }
+
+        try:
+            count = await controller.bulk_action(
+                name,
+                pks=pks,
+                filters=filters,
+                data=data,
+                confirm_all=bool(form.get('confirm_all')),
+            )
+            message = f'The {name} action has been applied to {count} ' \
+                f'instances of {self.get_name()}'
+        except BadParameters as e:
+            message = str(e)
+
+        query = {
+            key: value
+            for key, value in req.rel_url.query.items()
+            if key != 'message'
+        }
+
+        raise web.HTTPFound(
+            req.app.router[self.get_index_url_name()]
+            .url_for()
+            .with_query({**query, 'message': message})
+        )
+
+    @route(r'/export/')
+    async def export_list(self, req: web.Request) -> web.StreamResponse:
+        """
+        Stream all instances of the list page (with the same filters and
+        ordering) as a file. The format is specified by the `format` param
+        (`csv` by default) and the file is compressed if the `gzip` param is
+        specified.
+        """
+        params = self.get_params_from_request(req)
+        controller = self.get_controller()
+        export_format = req.rel_url.query.get('format', 'csv')
+        exporter_cls = self.export_formats.get(export_format)
+
+        if exporter_cls is None:
+            raise web.HTTPBadRequest(
+                text=f"The export format `{export_format}` is not supported"
+            )
+
+        filters = self.get_list_filters(
+            req,
+            controller,
+            self.default_filter_map,
+        )
+        instances = await controller.export(
+            order_by=params.order_by,
+            filters=filters,
+        )
+        exporter = exporter_cls(controller.get_export_fields())
+
+        filename = f'{self.get_index_url_name()}.{exporter.extension}'
+        content_type = exporter.content_type
+        compressor = None
+
+        if req.rel_url.query.get('gzip'):
+            filename += '.gz'
+            content_type = 'application/gzip'
+            compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+
+        response = web.StreamResponse(headers={
+            'Content-Type': content_type,
+            'Content-Disposition': f'attachment; filename="{filename}"',
+        })
+        await response.prepare(req)
+
+        async def write(lines: t.List[str]) -> None:
+            data = ''.join(lines).encode()
+
+            if compressor is not None:
+                data = compressor.compress(data)
+
+            if data:
+                await response.write(data)
+
+        lines = []
+
+        async for instance in instances:
+            lines.append(exporter.write(instance))
+
+            if len(lines) >= controller.export_chunk_size:
+                await write(lines)
+                lines = []
+
+        lines.append(exporter.finish())
+        await write(lines)
+
+        if compressor is not None:
+            await response.write(compressor.flush())
+
+        await response.write_eof()
+
+        return response
+
+    @route(r'/import/')
+    async def get_bulk_import(
+        self,
+        req: web.Request,
+        result: t.Optional[ImportResult] = None,
+        error: t.Optional[str] = None,
+    ) -> web.Response:
+        controller = self.get_controller()
+
+        if not controller.can_create:
+            raise PermissionDenied
+
+        return aiohttp_jinja2.render_template(
+            self.template_import_name,
+            req,
+            {
+                **await self.get_context(req),
+                "controller": controller,
+                "title": f"Import {self.get_name()}",
+                "import_url": str(
+                    req.app.router[self.get_url(self.post_bulk_import).name]
+                    .url_for()
+                ),
+                "import_formats": list(self.import_formats),
+                "result": result,
+                "error": error,
+            }
+        )
+
+    @route(r'/import/', method='POST')
+    async def post_bulk_import(self, req: web.Request) -> web.Response:
+        """
+        Import instances from the uploaded file. The file is read by chunks
+        and each row is passed to the controller right after it has been
+        parsed, so the whole file is never loaded into memory. The format of
+        the file is specified by its extension.
+        """
+        controller = self.get_controller()
+
+        if not controller.can_create:
+            raise PermissionDenied
+
+        reader = await req.multipart()
+        field = await reader.next()
+
+        while field is not None and field.name != 'file':
+            field = await reader.next()
+
+        if field is None or not field.filename:
+            return await self.get_bulk_import(req, error='Select a file')
+
+        extension = field.filename.rsplit('.', 1)[-1].lower()
+        importer_cls = self.import_formats.get(extension)
+
+        if importer_cls is None:
+            return await self.get_bulk_import(
+                req,
+                error=f'The import format `{extension}` is not supported',
+            )
+
+        importer = importer_cls()
+        errors = []
+
+        async def rows() -> t.AsyncIterator[t.Dict[str, t.Any]]:
+            is_final = False
+
+            while not is_final:
+                chunk = await field.read_chunk()
+                is_final = not chunk
+
+                try:
+                    for row in importer.feed(chunk, final=is_final):
+                        yield row
+                except ValueError as e:
+                    # rows before the invalid line are imported
+                    errors.append(f'The file is invalid: {e}')
+
+                    return
+
+        result = await controller.import_rows(rows())
+
+        return await self.get_bulk_import(
+            req,
+            result=result,
+            error=errors[0] if errors else None,
+        )
+
     @route(r'/{pk:\w+}/')
     async def get_detail(
         self,
@@ -150,7 +407,7 @@ class ControllerView(BaseControllerView):
                 "fields": controller.fields,
                 "exclude_fields": self.controller.exclude_update_fields,
                 "is_common": True,
-                "tabs": self.tabs_list(),
+                "tabs": await self.tabs_list(),
                 "pk": pk,
             }
         )
@@ -8,7 +8,7 @@ from aiohttp_admin2.mappers import Mapper
 from aiohttp_admin2.resources.types import FilterTuple
 from aiohttp_admin2.resources.types import Instance
 from aiohttp_admin2.views.aiohttp.views.base import BaseControllerView
-from aiohttp_admin2.views.aiohttp.views.base import global_views_instance
+from aiohttp_admin2.views.aiohttp.views.base import global_list_view
 from aiohttp_admin2.views.aiohttp.views.tab_base_view import TabBaseView
 from aiohttp_admin2.views.aiohttp.views.utils import route
 
@@ -22,11 +22,14 @@ class ManyToManyTabView(TabBaseView, BaseControllerView):
     # we need to drop `get` method from the BaseControllerView class
     get = None
 
-    def get_detail_url(self):
-        return self.get_url(self.get_detail).name
+    @classmethod
+    def get_detail_url(cls):
+        return cls.get_url(cls.get_detail).name
 
     async def access_hook(self) -> None:
         await super().access_hook()
+        # access of relations controllers is defined in their views
+        await self.prepare_related_views()
         relations = self.get_controller().relations_to_one
         controller = self.get_controller()
 
@@ -127,9 +130,9 @@ class ManyToManyTabView(TabBaseView, BaseControllerView):
         ))
 
         url_name_maps = {
-            i.get_controller().url_name(): i.get_detail_url()
-            for i in global_views_instance.get() or []
-            if hasattr(i, 'controller')
+            v.controller.url_name(): v.get_detail_url()
+            for v in global_list_view.get() or []
+            if hasattr(v, 'controller')
         }
 
         def url_builder(obj: Instance, url_type: str, **kwargs) -> str:
@@ -152,6 +155,8 @@ class ManyToManyTabView(TabBaseView, BaseControllerView):
 
             return ''
 
+        await self.prepare_related_views()
+
         data = await controller.get_list(
             **params._asdict(),
             filters=filters_list,
@@ -168,7 +173,7 @@ class ManyToManyTabView(TabBaseView, BaseControllerView):
                 'title': f"{parent.get_name()}#{self.get_pk(req)}",
                 'list': data,
                 "controller": controller,
-                "tabs": parent.tabs_list(),
+                "tabs": await parent.tabs_list(),
                 "detail_url": (
                     req.app.router[parent.get_url(parent.get_detail).name]
                     .url_for(pk=req.match_info['pk'])
@@ -0,0 +1,222 @@
+import asyncio
+import logging
+import time
+import typing as t
+from contextvars import ContextVar
+
+from aiohttp import web
+
+if t.TYPE_CHECKING:
+    from aiohttp_admin2.views.aiohttp.views.base import BaseAdminView # noqa
+
+
+__all__ = [
+    'ViewsRegistry',
+    'views_registry',
+    'global_views_instance',
+    'access_hooks_limit',
+]
+
+
+logger = logging.getLogger(__name__)
+
+# the max number of access hooks which can be run concurrently per request
+AccessHooksLimit = ContextVar[int]
+access_hooks_limit: AccessHooksLimit = ContextVar(
+    'access_hooks_limit',
+    default=10,
+)
+# the flag is set for access hooks which are run by the registry
+is_nested_check: ContextVar[bool] = ContextVar(
+    'is_nested_check',
+    default=False,
+)
+
+
+# this context map to share list of views instances which have been checked
+# for the current request
+ViewsInstanceMap = ContextVar[t.List['BaseAdminView']]
+global_views_instance: ViewsInstanceMap = ContextVar(
+    'views_instance_map',
+    default=None,
+)
+
+
+class ViewsRegistry:
+    """
+    This class need for lazy initialization of views during the request. The
+    admin have to know access settings of all views only for some cases (like
+    build of the aside menu) so we instantiate a view and call its access
+    hook only when somebody ask for it. Access hooks of the different views
+    are called concurrently (no more than `limit` at the same time) and the
+    result is memoized till the end of the request.
+
+    >>> registry = ViewsRegistry(request, [UsersPage, BooksPage])
+    >>> users_page = await registry.get(UsersPage)
+    >>> all_views = await registry.resolve_all()
+
+    The time spent in each access hook is saved to the `timings` mapping so
+    you can find slow hooks.
+    """
+
+    def __init__(
+        self,
+        request: web.Request,
+        views: t.Iterable[t.Type['BaseAdminView']],
+        limit: t.Optional[int] = None,
+    ) -> None:
+        self.request = request
+        self.timings: t.Dict[t.Type['BaseAdminView'], float] = {}
+        self._views = list(views)
+        self._instances: t.Dict[t.Type['BaseAdminView'], 'BaseAdminView'] = {}
+        # results of access hooks, hooks which have been started are saved
+        # to `_started` and tasks which wait for the semaphore to `_tasks`
+        self._checks: t.Dict[t.Type['BaseAdminView'], asyncio.Future] = {}
+        self._started: t.Set[t.Type['BaseAdminView']] = set()
+        self._tasks: t.List[asyncio.Task] = []
+        self._lookups: t.Dict[t.Hashable, asyncio.Future] = {}
+        self._semaphore = asyncio.Semaphore(limit or access_hooks_limit.get())
+
+    @property
+    def views(self) -> t.List[t.Type['BaseAdminView']]:
+        """List of all view classes registered for the admin interface."""
+        return self._views
+
+    def __contains__(self, view: t.Type['BaseAdminView']) -> bool:
+        return view in self._views
+
+    def _get_instance(self, view: t.Type['BaseAdminView']) -> 'BaseAdminView':
+        instance = self._instances.get(view)
+
+        if instance is None:
+            instance = view(self.request)
+            self._instances[view] = instance
+
+        return instance
+
+    async def _check_access(self, view: t.Type['BaseAdminView']) -> None:
+        async with self._semaphore:
+            await self._run_check(view)
+
+    async def _run_check(self, view: t.Type['BaseAdminView']) -> None:
+        """
+        Call the access hook of received view if it has not been started yet
+        and save the result to its future.
+        """
+        if view in self._started:
+            return
+
+        self._started.add(view)
+        future = self._checks[view]
+        token = is_nested_check.set(True)
+
+        try:
+            await self._call_access_hook(view)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+        else:
+            future.set_result(None)
+        finally:
+            is_nested_check.reset(token)
+
+    async def _call_access_hook(self, view: t.Type['BaseAdminView']) -> None:
+        start = time.perf_counter()
+
+        try:
+            await self._instances[view]._inner_access_hook()
+        finally:
+            self.timings[view] = time.perf_counter() - start
+            logger.debug(
+                f"Access hook of {view.__name__} took "
+                f"{self.timings[view]:.6f}s"
+            )
+
+    async def lookup(
+        self,
+        key: t.Hashable,
+        fn: t.Callable[[], t.Awaitable[t.Any]],
+    ) -> t.Any:
+        """
+        Call received function only once per request for each unique key and
+        return its result. It need to deduplicate identical permission
+        lookups which are made by access hooks of different views.
+        """
+        if key not in self._lookups:
+            self._lookups[key] = asyncio.ensure_future(fn())
+
+        return await asyncio.shield(self._lookups[key])
+
+    async def resolve(
+        self,
+        views: t.Iterable[t.Type['BaseAdminView']],
+    ) -> t.List['BaseAdminView']:
+        """
+        Return instances of received views with checked access. Access hooks
+        of views which have not been checked yet are called concurrently.
+        """
+        views = list(views)
+        loop = asyncio.get_running_loop()
+        is_nested = is_nested_check.get()
+
+        for view in views:
+            if view not in self._checks:
+                # views must be instantiated in the context of the current
+                # request because they create controllers via `builder`
+                self._get_instance(view)
+                self._checks[view] = loop.create_future()
+
+                if not is_nested:
+                    self._tasks.append(
+                        asyncio.ensure_future(self._check_access(view))
+                    )
+
+        # an access hook can wait for access hooks of other views, if they
+        # will wait for the semaphore which is held by the current hook than
+        # all hooks may wait for each other forever so we call them inside
+        # the current hook without the semaphore
+        if is_nested:
+            await asyncio.gather(*[
+                self._run_check(view)
+                for view in views
+                if view not in self._started
+            ])
+
+        if views:
+            await asyncio.gather(*[self._checks[view] for view in views])
+
+        return [self._instances[view] for view in views]
+
+    async def get(self, view: t.Type['BaseAdminView']) -> 'BaseAdminView':
+        """Return an instance of received view with checked access."""
+        instances = await self.resolve([view])
+        return instances[0]
+
+    async def resolve_all(self) -> t.List['BaseAdminView']:
+        """Return instances of all registered views with checked access."""
+        instances = await self.resolve(self._views)
+        global_views_instance.set(instances)
+
+        return instances
+
+    async def resolve_by_controllers(
+        self,
+        controllers: t.Iterable[t.Any],
+    ) -> t.List['BaseAdminView']:
+        """
+        Return instances of views with checked access which use one of
+        received controllers.
+        """
+        controllers = set(controllers)
+
+        return await self.resolve([
+            view for view in self._views
+            if getattr(view, 'controller', None) in controllers
+        ])
+
+
+# this context map to share the registry of views for the current request
+ViewsRegistryVar = ContextVar[t.Optional[ViewsRegistry]]
+views_registry: ViewsRegistryVar = ContextVar('views_registry', default=None)
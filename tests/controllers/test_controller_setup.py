@@ -0,0 +1,215 @@
+import asyncio
+
+import pytest
+
+from aiohttp_admin2.controllers.controller import Controller
+from aiohttp_admin2.controllers.relations import ToOneRelation
+from aiohttp_admin2.resources import DictResource
+
+
+def generate_controllers():
+    class AuthorController(Controller):
+        resource = DictResource({1: {"id": 1, "name": "Bob"}})
+
+    class BookController(Controller):
+        resource = DictResource({1: {"id": 1, "author_id": 1}})
+        relations_to_one = [
+            ToOneRelation(
+                name='author',
+                field_name='author_id',
+                controller=AuthorController,
+            ),
+            ToOneRelation(
+                name='editor',
+                field_name='editor_id',
+                controller=AuthorController,
+                hidden=True,
+            ),
+        ]
+
+        def title_field_sort(self, is_reverse):
+            return is_reverse
+
+    return BookController
+
+
+def test_controller_metadata_is_computed_once():
+    """
+    In this test we check that metadata of the controller is computed once
+    for the class and instances of the controller share it.
+
+        1. Maps of relations
+        2. Getters of foreign keys
+        3. Custom sort methods
+        4. Custom getter of the subclass is not replaced
+    """
+    controller_cls = generate_controllers()
+    controller_cls.setup()
+
+    # 1. Maps of relations
+    assert list(controller_cls.foreign_keys_map) == ['author', 'editor']
+    assert list(controller_cls.foreign_keys_field_map) == ['author_id']
+
+    first, second = controller_cls(), controller_cls()
+
+    assert 'foreign_keys_map' not in vars(first)
+    assert first.foreign_keys_map is second.foreign_keys_map
+
+    # 2. Getters of foreign keys
+    assert first.author_id_field is second.author_id_field
+    assert first.author_id_field.is_foreignkey
+    assert not hasattr(first, 'editor_id_field')
+
+    # 3. Custom sort methods
+    assert controller_cls.custom_sort_methods == {'title': 'title_field_sort'}
+    assert first.get_custom_sort_list()['title'](True) is True
+
+    # 4. Custom getter of the subclass is not replaced
+    class CustomBookController(controller_cls):
+        async def author_id_field(self, obj):
+            return 'author'
+
+    CustomBookController.setup()
+
+    assert not hasattr(CustomBookController().author_id_field, 'is_foreignkey')
+
+
+@pytest.mark.asyncio
+async def test_list_columns():
+    """
+    In this test we check plans of columns of the list page and that custom
+    getters of all rows are awaited concurrently.
+
+        1. Plans of columns are computed once
+        2. Custom getters are awaited concurrently
+        3. Urls of cells
+    """
+    stats = {"in_progress": 0, "max_in_progress": 0}
+
+    class ConcurrentBookController(generate_controllers()):
+        inline_fields = ['id', 'author_id', 'title']
+        per_page = 2
+
+        async def title_field(self, obj):
+            stats['in_progress'] += 1
+            stats['max_in_progress'] = max(
+                stats['max_in_progress'],
+                stats['in_progress'],
+            )
+            await asyncio.sleep(0.01)
+            stats['in_progress'] -= 1
+
+            return f'title {obj.data.id}'
+
+        title_field.is_safe = True
+
+    ConcurrentBookController.resource = DictResource({
+        1: {"id": 1, "author_id": 1},
+        2: {"id": 2, "author_id": None},
+    })
+
+    controller = ConcurrentBookController()
+
+    # 1. Plans of columns are computed once
+    columns = controller.get_list_columns()
+
+    assert columns is ConcurrentBookController().get_list_columns()
+    assert [(c.name, c.getter, c.is_safe) for c in columns] == [
+        ('id', None, False),
+        ('author_id', 'author_id_field', False),
+        ('title', 'title_field', True),
+    ]
+    assert columns[1].relation.name == 'author'
+
+    # 2. Custom getters are awaited concurrently
+    data = await controller.get_list(
+        url_builder=lambda obj, url_type, **kw: (url_type, kw),
+    )
+    rows = sorted(data.rows, key=lambda row: row[0].value)
+
+    assert stats['max_in_progress'] == 2
+    assert [row[2].value for row in rows] == ['title 1', 'title 2']
+    assert all(row[2].is_safe for row in rows)
+
+    # 3. Urls of cells
+    assert rows[0][0].url == ('detail', {})
+    assert rows[0][1].url == (
+        'foreignkey_detail',
+        {"url_name": "authorcontroller"},
+    )
+    assert rows[1][1].url is None
+    assert rows[0][2].url is None
+
+
+@pytest.mark.asyncio
+async def test_metadata_changed_by_access_hook():
+    """
+    In this test we check that changes of relations and getters which the
+    access hook makes for the instance are used instead of the metadata of
+    the class.
+
+        1. Metadata of the class is not changed
+        2. Getters and relations of the instance are used on the list page
+        3. Custom sort methods of the instance
+    """
+    book_controller_cls = generate_controllers()
+    author_controller_cls = book_controller_cls.relations_to_one[0].controller
+
+    class BookController(book_controller_cls):
+        inline_fields = ['id', 'author_id', 'editor_id']
+
+        async def access_hook(self):
+            async def author_id_field(obj):
+                return 'hidden'
+
+            author_id_field.is_safe = True
+
+            self.author_id_field = author_id_field
+            self.relations_to_one = [
+                ToOneRelation(
+                    name='editor',
+                    field_name='editor_id',
+                    controller=author_controller_cls,
+                ),
+            ]
+            self.editor_field_sort = lambda is_reverse: is_reverse
+
+    BookController.resource = DictResource({
+        1: {"id": 1, "author_id": 1, "editor_id": 1},
+    })
+    BookController.setup()
+    controller = BookController()
+
+    data = await controller.get_list(
+        url_builder=lambda obj, url_type, **kw: (url_type, kw),
+    )
+
+    # 1. Metadata of the class is not changed
+    assert list(BookController.foreign_keys_field_map) == ['author_id']
+    assert BookController.custom_sort_methods == {'title': 'title_field_sort'}
+    assert [c.getter for c in BookController().get_list_columns()] == [
+        None,
+        'author_id_field',
+        None,
+    ]
+
+    # 2. Getters and relations of the instance are used on the list page
+    columns = controller.get_list_columns()
+
+    assert [(c.name, c.getter, c.is_safe) for c in columns] == [
+        ('id', None, False),
+        ('author_id', 'author_id_field', True),
+        ('editor_id', 'editor_id_field', False),
+    ]
+    assert columns[1].relation is None
+    assert columns[2].relation.name == 'editor'
+    assert [cell.value for cell in data.rows[0][:2]] == [1, 'hidden']
+    assert data.rows[0][2].value.data.name == 'Bob'
+    assert data.rows[0][2].url[0] == 'foreignkey_detail'
+
+    # 3. Custom sort methods of the instance
+    assert controller.custom_sort_methods == {
+        'editor': 'editor_field_sort',
+        'title': 'title_field_sort',
+    }
+    assert controller.get_custom_sort_list()['editor'](True) is True
@@ -0,0 +1,147 @@
+import pytest
+
+from aiohttp_admin2.controllers.controller import Controller
+from aiohttp_admin2.controllers.exceptions import PermissionDenied
+from aiohttp_admin2.controllers.permission_cache import MemoryPermissionCache
+from aiohttp_admin2.controllers.permission_cache import access_identity
+from aiohttp_admin2.resources import DictResource
+
+
+def generate_controller(calls, ttl=60):
+    """
+    Generate controller which save identity of the current user to the `calls`
+    list after each call of the access hook.
+    """
+    class UserController(Controller):
+        resource = DictResource({1: {"id": 1, "name": "Bob"}})
+        permission_cache = MemoryPermissionCache(ttl=ttl)
+
+        async def access_hook(self) -> None:
+            identity = access_identity.get()
+            calls.append(identity)
+            self.can_view = identity == 'admin'
+
+    return UserController
+
+
+@pytest.mark.asyncio
+async def test_access_hook_is_cached_for_identity():
+    """
+    In this test we check that result of the access hook is shared between
+    requests of the same user.
+
+        1. Access hook is called once for the same identity
+        2. Different identities have different permissions
+        3. Access hook is called on each call without identity
+    """
+    calls = []
+    controller_cls = generate_controller(calls)
+
+    # 1. Access hook is called once for the same identity
+    access_identity.set('admin')
+
+    await controller_cls().get_detail(1)
+    await controller_cls().get_detail(1)
+
+    assert calls == ['admin']
+
+    # 2. Different identities have different permissions
+    access_identity.set('guest')
+
+    for _ in range(2):
+        with pytest.raises(PermissionDenied):
+            await controller_cls().get_detail(1)
+
+    assert calls == ['admin', 'guest']
+
+    # 3. Access hook is called on each call without identity
+    access_identity.set(None)
+
+    for _ in range(2):
+        with pytest.raises(PermissionDenied):
+            await controller_cls().get_detail(1)
+
+    assert calls == ['admin', 'guest', None, None]
+
+
+@pytest.mark.asyncio
+async def test_permission_cache_invalidation():
+    """
+    In this test we check that cached permissions are dropped after ttl and
+    after explicit invalidation.
+
+        1. Invalidation for identity
+        2. Invalidation for all identities
+        3. Expired permissions
+    """
+    calls = []
+    controller_cls = generate_controller(calls)
+
+    for identity in ['admin', 'guest']:
+        access_identity.set(identity)
+        await controller_cls()._inner_access_hook()
+
+    # 1. Invalidation for identity
+    await controller_cls.invalidate_permissions(identity='admin')
+
+    for identity in ['admin', 'guest']:
+        access_identity.set(identity)
+        await controller_cls()._inner_access_hook()
+
+    assert calls == ['admin', 'guest', 'admin']
+
+    # 2. Invalidation for all identities
+    calls.clear()
+    await controller_cls.invalidate_permissions()
+
+    for identity in ['admin', 'guest']:
+        access_identity.set(identity)
+        await controller_cls()._inner_access_hook()
+
+    assert calls == ['admin', 'guest']
+
+    # 3. Expired permissions
+    calls.clear()
+    controller_cls = generate_controller(calls, ttl=0)
+    access_identity.set('admin')
+
+    await controller_cls()._inner_access_hook()
+    await controller_cls()._inner_access_hook()
+
+    assert calls == ['admin', 'admin']
+
+
+@pytest.mark.asyncio
+async def test_memory_permission_cache_size(monkeypatch):
+    """
+    In this test we check that the memory permission cache doesn't grow
+    without bound.
+
+        1. The least recently used records are dropped
+        2. Expired records are dropped on save of new records
+    """
+    cache = MemoryPermissionCache(ttl=10, max_size=2)
+    now = 100
+
+    monkeypatch.setattr(
+        'aiohttp_admin2.controllers.permission_cache.time.monotonic',
+        lambda: now,
+    )
+
+    # 1. The least recently used records are dropped
+    await cache.set(('first', Controller), {"can_view": True})
+    await cache.set(('second', Controller), {"can_view": True})
+    await cache.get(('first', Controller))
+    await cache.set(('third', Controller), {"can_view": True})
+
+    assert list(cache._storage) == [
+        ('first', Controller),
+        ('third', Controller),
+    ]
+    assert await cache.get(('second', Controller)) is None
+
+    # 2. Expired records are dropped on save of new records
+    now = 115
+    await cache.set(('fourth', Controller), {"can_view": True})
+
+    assert list(cache._storage) == [('fourth', Controller)]
@@ -0,0 +1,147 @@
+import asyncio
+
+import pytest
+
+from aiohttp_admin2.controllers.controller import Controller
+from aiohttp_admin2.controllers.relations import ToOneRelation
+from aiohttp_admin2.resources import DictResource
+
+
+class SlowDictResource(DictResource):
+    """
+    Dict resource which save received ids to the `calls` list after each call
+    of the `get_many` method.
+    """
+
+    def __init__(self, *args, stats, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.calls = []
+        self.stats = stats
+
+    async def get_many(self, pks, field=None):
+        self.calls.append(list(pks))
+        self.stats['in_progress'] += 1
+        self.stats['max_in_progress'] = max(
+            self.stats['max_in_progress'],
+            self.stats['in_progress'],
+        )
+        await asyncio.sleep(0.01)
+        self.stats['in_progress'] -= 1
+
+        return await super().get_many(pks, field=field)
+
+
+def generate_controllers(eager_prefetch):
+    stats = {"in_progress": 0, "max_in_progress": 0}
+    authors = SlowDictResource({
+        1: {"id": 1, "name": "Bob"},
+        2: {"id": 2, "name": "Alice"},
+    }, stats=stats)
+    publishers = SlowDictResource({
+        1: {"id": 1, "code": "first", "name": "Publisher"},
+    }, stats=stats)
+
+    class AuthorController(Controller):
+        resource = authors
+
+    class PublisherController(Controller):
+        resource = publishers
+
+    class BookController(Controller):
+        resource = DictResource({
+            1: {"id": 1, "author_id": 1, "publisher_code": "first"},
+            2: {"id": 2, "author_id": 2, "publisher_code": "first"},
+            3: {"id": 3, "author_id": 1, "publisher_code": None},
+            4: {"id": 4, "author_id": None, "publisher_code": "first"},
+        })
+        inline_fields = ['id', 'author_id', 'publisher_code']
+        relations_to_one = [
+            ToOneRelation(
+                name='author',
+                field_name='author_id',
+                controller=AuthorController,
+            ),
+            ToOneRelation(
+                name='publisher',
+                field_name='publisher_code',
+                controller=PublisherController,
+                target_field_name='code',
+            ),
+        ]
+
+    BookController.eager_prefetch = eager_prefetch
+
+    return BookController, authors, publishers
+
+
+@pytest.mark.asyncio
+async def test_eager_prefetch_of_relations():
+    """
+    In this test we check that relations to one of the list page are fetched
+    concurrently by one request for each relation.
+
+        1. One request for each relation
+        2. Requests are executed concurrently
+        3. Ids are unique and without None
+        4. Instances have correct relations
+    """
+    controller_cls, authors, publishers = generate_controllers(True)
+    controller = controller_cls()
+
+    assert controller.get_prefetch_relations() == ['author', 'publisher']
+
+    data = await controller.get_list(url_builder=lambda *args, **kw: '')
+    rows = {row[0].value: row for row in data.rows}
+
+    # 1. One request for each relation
+    assert len(authors.calls) == 1
+    assert len(publishers.calls) == 1
+
+    # 2. Requests are executed concurrently
+    assert authors.stats['max_in_progress'] == 2
+
+    # 3. Ids are unique and without None
+    assert sorted(authors.calls[0]) == [1, 2]
+    assert publishers.calls[0] == ['first']
+
+    # 4. Instances have correct relations
+    for pk, author, publisher in [
+        (1, 'Bob', 'Publisher'),
+        (2, 'Alice', 'Publisher'),
+        (3, 'Bob', None),
+        (4, None, 'Publisher'),
+    ]:
+        author_instance = rows[pk][1].value
+        publisher_instance = rows[pk][2].value
+
+        assert getattr(author_instance, 'data', None) is None \
+            if author is None else author_instance.data.name == author
+        assert getattr(publisher_instance, 'data', None) is None \
+            if publisher is None else publisher_instance.data.name == publisher
+
+
+@pytest.mark.asyncio
+async def test_eager_prefetch_of_specified_relations():
+    """
+    In this test we check that only specified relations are prefetched and
+    that prefetch is disabled by default.
+
+        1. Only specified relations are prefetched
+        2. Without prefetch relations are fetched once for the whole page
+    """
+    # 1. Only specified relations are prefetched
+    controller_cls, authors, publishers = generate_controllers(['publisher'])
+
+    await controller_cls().get_list(url_builder=lambda *args, **kw: '')
+
+    assert publishers.calls == [['first']]
+    assert authors.calls == [[1, 2]]
+
+    # 2. Without prefetch relations are fetched once for the whole page
+    controller_cls, authors, publishers = generate_controllers(False)
+
+    await controller_cls().get_list(url_builder=lambda *args, **kw: '')
+
+    assert authors.calls == [[1, 2]]
+    assert publishers.calls == [['first']]
+    assert authors.stats['max_in_progress'] == 1
@@ -25,6 +25,7 @@ resource_params = [
     pytest.param("mongo", marks=pytest.mark.slow),
     pytest.param("mysql", marks=pytest.mark.slow),
     pytest.param("dict_resource"),
+    pytest.param("indexed_dict_resource"),
 ]
 
 table = sa.Table('table', sa.MetaData(),
@@ -108,6 +109,11 @@ async def dict_resource():
     yield DictResource()
 
 
+@pytest.fixture
+async def indexed_dict_resource():
+    yield DictResource(indexes=['val', 'val2'])
+
+
 @pytest.fixture(params=resource_params)
 def resource(request):
     yield request.getfixturevalue(request.param)
@@ -221,3 +221,68 @@ def test_choices_field():
 
     # rewrite choices
     assert SelectSecondMapper({}).fields['type'].choices == gender_choices
+
+
+def test_generated_fields_are_cached_for_sa_table():
+    """
+    In this test we check that fields of the table are generated only once
+    and mappers of the same table don't share values of fields.
+
+        1. Fields are generated once for the table
+        2. Mappers with other types of fields don't use the cache
+        3. Values are not shared between mappers
+        4. Redefined generation of fields is cached for each mapper
+    """
+    table = sa.Table(
+        'cached_tbl',
+        sa.MetaData(),
+        sa.Column('id', sa.Integer, primary_key=True),
+        sa.Column('title', sa.String(255)),
+    )
+
+    class FirstMapper(PostgresMapperGeneric, table=table):
+        pass
+
+    class SecondMapper(PostgresMapperGeneric, table=table):
+        pass
+
+    # 1. Fields are generated once for the table
+    assert FirstMapper._fields_cls[1] is SecondMapper._fields_cls[1]
+
+    # 2. Mappers with other types of fields don't use the cache
+    class LongStringMapper(PostgresMapperGeneric, table=table):
+        FIELDS_MAPPER = {
+            **PostgresMapperGeneric.FIELDS_MAPPER,
+            sa.String: fields.LongStringField,
+        }
+
+    title = LongStringMapper({})._fields["title"]
+
+    assert isinstance(title, fields.LongStringField)
+
+    # 3. Values are not shared between mappers
+    first = FirstMapper({"title": "first"})
+    second = SecondMapper({"title": "second"})
+
+    assert first.fields["title"].value == "first"
+    assert second.fields["title"].value == "second"
+    assert len(first.fields["title"].validators) == 1
+
+    # 4. Redefined generation of fields is cached for each mapper
+    def generate_title_fields(cls, table):
+        generated = PostgresMapperGeneric.generate_fields.__func__(cls, table)
+        generated["title"].required = cls.is_title_required
+
+        return generated
+
+    class OptionalTitleMapper(PostgresMapperGeneric, table=table):
+        is_title_required = False
+        generate_fields = classmethod(generate_title_fields)
+
+    class RequiredTitleMapper(PostgresMapperGeneric, table=table):
+        is_title_required = True
+        generate_fields = classmethod(generate_title_fields)
+
+    assert not OptionalTitleMapper({})._fields["title"].required
+    assert RequiredTitleMapper({})._fields["title"].required
+    assert not FirstMapper({})._fields["title"].required
@@ -1,5 +1,6 @@
 from aiohttp_admin2.mappers import fields
 from aiohttp_admin2.mappers.generics import MongoMapperGeneric
+from aiohttp_admin2.mappers.generics import get_marshmallow_schema
 from umongo import Document
 from umongo import fields as mongo_fields
 from umongo.frameworks import MotorAsyncIOInstance
@@ -102,3 +103,27 @@ def test_generic_validation_for_umongo_table():
     assert not user.is_valid()
     assert user.fields['age'].errors
     assert user.fields['email'].errors
+
+
+def test_marshmallow_schema_is_cached_for_umongo_table():
+    """
+    In this test we check that the marshmallow schema and fields are created
+    only once for the umongo document.
+    """
+    instance = MotorAsyncIOInstance()
+
+    @instance.register
+    class User(Document):
+        age = mongo_fields.IntegerField()
+
+    class FirstMapper(MongoMapperGeneric, table=User):
+        pass
+
+    class SecondMapper(MongoMapperGeneric, table=User):
+        pass
+
+    assert get_marshmallow_schema(User) is get_marshmallow_schema(User)
+    assert FirstMapper._fields["age"] is SecondMapper._fields["age"]
+
+    assert FirstMapper({"age": "18"}).is_valid()
+    assert not SecondMapper({"age": "old"}).is_valid()
@@ -210,3 +210,107 @@ def test_main_mapper_validation():
     assert not book.fields["description"].errors
     assert book.error
     assert book.fields["pages"].errors
+
+
+def test_fields_are_bound_without_new_validators():
+    """
+    In this test we check that fields of the mapper are copies of fields of
+    the mapper class and validators of fields are not duplicated.
+
+        1. Fields of mappers are different objects
+        2. Validators are not added for each mapper
+        3. Fields of choices are bound to the value
+    """
+    class BookMapping(Mapper):
+        title = fields.StringField(required=True, max_length=10)
+        tags = fields.ArrayField(field_cls=fields.IntField, max_length=2)
+        genre = fields.ChoicesField(
+            choices=[('drama', 'drama'), ('comedy', 'comedy')],
+            required=True,
+        )
+
+    # 1. Fields of mappers are different objects
+    first = BookMapping({"title": "first", "tags": "1", "genre": "drama"})
+    second = BookMapping({"title": "second", "genre": "comedy"})
+
+    assert first.fields["title"] is not second.fields["title"]
+    assert first.fields["title"].value == 'first'
+    assert second.fields["title"].value == 'second'
+    assert first.fields["title"].name == 'title'
+
+    # 2. Validators are not added for each mapper
+    for _ in range(3):
+        BookMapping({})
+
+    assert len(first.fields["title"].validators) == 2
+    assert len(first.fields["tags"].validators) == 1
+    assert first.fields["title"].validators is \
+        second.fields["title"].validators
+
+    # 3. Fields of choices are bound to the value
+    assert first.fields["genre"].value == 'drama'
+    assert second.fields["genre"].value == 'comedy'
+    assert first.fields["genre"].empty_value == '-- empty --'
+    assert first.is_valid()
+    assert not BookMapping({"title": "x" * 11}).is_valid()
+
+
+def test_validate_many():
+    """
+    In this test we check the validation of many rows by one call.
+
+        1. Data of valid rows is serialized
+        2. Errors of invalid rows are returned by indexes of rows
+        3. Errors of a row are not kept for the next rows
+        4. Results are the same as for the `is_valid` method
+    """
+    class BookMapping(Mapper):
+        id = fields.IntField(primary_key=True)
+        title = fields.StringField(required=True)
+        description = fields.StringField(default='empty')
+        pages = fields.IntField()
+
+        def validation_pages(self, value):
+            if value is not None and value < 0:
+                raise ValidationError("pages must be positive")
+
+        def validation(self):
+            if self.fields['title'].value == 'invalid':
+                raise ValidationError("title is invalid")
+
+    rows = [
+        {"title": "first", "pages": "10"},
+        {"pages": "many"},
+        {"title": "third", "pages": "-1"},
+        {"title": "invalid"},
+        {"id": "x", "title": "fifth", "description": "text"},
+    ]
+
+    result = BookMapping.validate_many(rows, skip_primary=True)
+
+    # 1. Data of valid rows is serialized
+    assert result.data == [
+        {"title": "first", "description": "empty", "pages": 10},
+        None,
+        None,
+        None,
+        {"title": "fifth", "description": "text", "pages": None},
+    ]
+
+    # 2. Errors of invalid rows are returned by indexes of rows
+    assert list(result.errors) == [1, 2, 3]
+    assert set(result.errors[1]) == {"title", "pages"}
+    assert result.errors[2] == {"pages": ["pages must be positive"]}
+    assert result.errors[3] == {"__all__": ["title is invalid"]}
+
+    # 3. Errors of a row are not kept for the next rows
+    assert 4 not in result.errors
+
+    # 4. Results are the same as for the `is_valid` method
+    for index, row in enumerate(rows):
+        mapper = BookMapping(row)
+
+        is_valid = mapper.is_valid(skip_primary=True)
+
+        assert is_valid is (index not in result.errors)
+        assert mapper.errors == result.errors.get(index, {})
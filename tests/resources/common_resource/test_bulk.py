@@ -0,0 +1,138 @@
+import pytest
+
+from aiohttp_admin2.resources import Instance
+from aiohttp_admin2.resources.types import FilterTuple
+
+from .utils import generate_fake_instance
+
+
+@pytest.mark.asyncio
+async def test_delete_many(resource):
+    """
+    In this test check corrected work of delete_many method in resource.
+
+        1. Delete instances by ids
+        2. Delete instances by filters
+        3. Ids which does not exist are ignored
+    """
+    instances = await generate_fake_instance(resource, 5)
+    ids = [i.get_pk() for i in instances]
+
+    # 1. Delete instances by ids
+    count = await resource.delete_many(ids[:2])
+
+    assert count == 2
+    assert not any((await resource.get_many(ids[:2])).values())
+
+    # 2. Delete instances by filters
+    count = await resource.delete_many(
+        filters=[FilterTuple('id', ids[3], "gte")],
+    )
+
+    assert count == 2
+    data = await resource.get_many(ids)
+
+    assert [pk for pk in ids if data.get(pk)] == [ids[2]]
+
+    # 3. Ids which does not exist are ignored
+    count = await resource.delete_many(ids)
+
+    assert count == 1
+
+
+@pytest.mark.asyncio
+async def test_update_fields(resource):
+    """
+    In this test check corrected work of update_fields method in resource.
+
+        1. Update instances by ids
+        2. Update instances by filters
+    """
+    instances = await generate_fake_instance(resource, 3)
+    ids = [i.get_pk() for i in instances]
+
+    # 1. Update instances by ids
+    count = await resource.update_fields({"val": "new"}, ids[:2])
+    data = await resource.get_many(ids)
+
+    assert count == 2
+    assert [data[pk].data.val for pk in ids] == ['new', 'new', 'val1 - 2']
+    assert data[ids[0]].data.val2 == 'val2 - 0'
+
+    # 2. Update instances by filters
+    count = await resource.update_fields(
+        {"val2": "new"},
+        filters=[FilterTuple('id', ids[0], "gt")],
+    )
+    data = await resource.get_many(ids)
+
+    assert count == 2
+    assert [data[pk].data.val2 for pk in ids] == ['val2 - 0', 'new', 'new']
+
+
+@pytest.mark.asyncio
+async def test_create_many(resource):
+    """
+    In this test check corrected work of create_many method in resource.
+
+        1. Instances are created in the same order
+        2. Created instances are available by their ids
+    """
+    instances = []
+
+    for i in range(3):
+        obj = Instance()
+        obj.data = {"val": f'val1 - {i}', 'val2': f'val2 - {i}'}
+        instances.append(obj)
+
+    # 1. Instances are created in the same order
+    created = await resource.create_many(instances)
+
+    assert [i.data.val for i in created] == [
+        'val1 - 0',
+        'val1 - 1',
+        'val1 - 2',
+    ]
+
+    # 2. Created instances are available by their ids
+    ids = [i.get_pk() for i in created]
+    data = await resource.get_many(ids)
+
+    assert [data[pk].data.val2 for pk in ids] == [
+        'val2 - 0',
+        'val2 - 1',
+        'val2 - 2',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_update_many(resource):
+    """
+    In this test check corrected work of update_many method in resource.
+
+        1. Instances are updated by their ids
+        2. Instances which does not exist are skipped
+    """
+    instances = await generate_fake_instance(resource, 3)
+    ids = [i.get_pk() for i in instances]
+    await resource.delete(ids[2])
+
+    changes = {}
+
+    for i, pk in enumerate(ids):
+        obj = Instance()
+        obj.data = {"val": f'new - {i}', 'val2': f'val2 - {i}'}
+        changes[pk] = obj
+
+    # 1. Instances are updated by their ids
+    updated = await resource.update_many(changes)
+    data = await resource.get_many(ids[:2])
+
+    assert list(updated) == ids[:2]
+    assert updated[ids[1]].data.val == 'new - 1'
+    assert [data[pk].data.val for pk in ids[:2]] == ['new - 0', 'new - 1']
+
+    # 2. Instances which does not exist are skipped
+    data = await resource.get_many([ids[2]])
+
+    assert data.get(ids[2]) is None
@@ -0,0 +1,114 @@
+import pytest
+
+from aiohttp_admin2.resources.types import CountStrategy
+from aiohttp_admin2.resources.types import FilterTuple
+
+from .utils import generate_fake_instance
+
+
+@pytest.mark.asyncio
+async def test_list_count_strategies(resource, monkeypatch):
+    """
+    In this test check corrected work of count strategies in get_list method
+    of resource.
+
+        1. Exact count
+        2. Capped count
+        3. Estimated count
+        4. Cached count
+    """
+    instances = await generate_fake_instance(resource, 5)
+
+    # 1. Exact count
+    list_objects = await resource.get_list(limit=2)
+
+    assert list_objects.count == 5
+    assert list_objects.count_strategy is CountStrategy.EXACT
+
+    # 2. Capped count
+    monkeypatch.setattr(resource, 'count_cap', 3)
+    list_objects = await resource.get_list(
+        limit=2,
+        count_strategy=CountStrategy.CAPPED,
+    )
+
+    assert list_objects.count == 3
+    assert list_objects.count_strategy is CountStrategy.CAPPED
+
+    monkeypatch.setattr(resource, 'count_cap', 10)
+    list_objects = await resource.get_list(
+        limit=2,
+        count_strategy=CountStrategy.CAPPED,
+    )
+
+    assert list_objects.count == 5
+    assert list_objects.count_strategy is CountStrategy.EXACT
+
+    # 3. Estimated count
+    list_objects = await resource.get_list(
+        limit=2,
+        page=3,
+        count_strategy=CountStrategy.ESTIMATED,
+    )
+
+    assert list_objects.count >= 5
+    assert list_objects.count_strategy is CountStrategy.ESTIMATED
+
+    # 4. Cached count
+    filters = [FilterTuple('id', instances[0].get_pk(), "ne")]
+    list_objects = await resource.get_list(
+        limit=2,
+        filters=filters,
+        count_strategy=CountStrategy.CACHED,
+    )
+
+    assert list_objects.count == 4
+    assert list_objects.count_strategy is CountStrategy.CACHED
+
+    await generate_fake_instance(resource, 1)
+    list_objects = await resource.get_list(
+        limit=2,
+        filters=filters,
+        count_strategy=CountStrategy.CACHED,
+    )
+
+    assert list_objects.count == 4
+
+    list_objects = await resource.get_list(limit=2)
+
+    assert list_objects.count == 6
+
+
+@pytest.mark.asyncio
+async def test_iterate_without_count(resource, monkeypatch):
+    """
+    In this test check that the iteration over all instances and the list
+    with the `none` count strategy don't calculate the total count.
+    """
+    instances = await generate_fake_instance(resource, 5)
+    calls = []
+
+    async def get_count(filters=None):
+        calls.append(filters)
+
+        return 0
+
+    monkeypatch.setattr(resource, 'get_count', get_count)
+
+    list_objects = await resource.get_list(
+        limit=2,
+        count_strategy=CountStrategy.NONE,
+    )
+
+    assert list_objects.count is None
+    assert list_objects.has_next
+
+    for order_by in (None, 'val', '-val2'):
+        pks = [
+            i.get_pk()
+            async for i in resource.iterate(order_by=order_by, chunk_size=2)
+        ]
+
+        assert sorted(pks) == sorted(i.get_pk() for i in instances)
+
+    assert calls == []
@@ -152,6 +152,8 @@ async def test_list_cursor_pagination(resource, ordering):
         - Check of correct work has_next and has_prev values
         - Check of correct work count value
 
+        2. Next page starts right after the last instance of the previous page
+
     """
     instance_count = 5
     await generate_fake_instance(resource, instance_count)
@@ -193,6 +195,20 @@ async def test_list_cursor_pagination(resource, ordering):
     assert list_objects.has_prev
     assert list_objects.count is None
 
+    # 2. Next page starts right after the last instance of the previous page
+    list_objects = await resource.get_list(limit=2, order_by=ordering)
+    list_objects_ids = [i.get_pk() for i in list_objects.instances]
+
+    while list_objects.has_next:
+        list_objects = await resource.get_list(
+            cursor=list_objects.next_id,
+            limit=2,
+            order_by=ordering,
+        )
+        list_objects_ids.extend(i.get_pk() for i in list_objects.instances)
+
+    assert list_objects_ids == full_list_objects_ids
+
 
 @pytest.mark.asyncio
 async def test_filter_api_for_get_list(resource):
@@ -366,3 +382,41 @@ async def test_common_filters_for_get_list(resource):
 
     assert len(list_objects_ids) == 1
     assert list_objects_ids[0] == instances[0].get_pk()
+
+
+@pytest.mark.asyncio
+async def test_list_projection(resource):
+    """
+    In this test check that get_list method of resource return only specified
+    fields.
+
+        1. Only specified fields and primary key are returned
+        2. Projection with sorting by field which is not specified
+        3. All fields are returned without projection
+    """
+    await generate_fake_instance(resource, 3)
+
+    # 1. Only specified fields and primary key are returned
+    list_objects = await resource.get_list(fields=['val', 'unknown'])
+
+    assert len(list_objects.instances) == 3
+
+    for instance in list_objects.instances:
+        assert instance.get_pk()
+        assert instance.data.val.startswith('val1')
+        assert not hasattr(instance.data, 'val2')
+
+    # 2. Projection with sorting by field which is not specified
+    list_objects = await resource.get_list(fields=['val'], order_by='-val2')
+
+    assert [i.data.val for i in list_objects.instances] == [
+        'val1 - 2',
+        'val1 - 1',
+        'val1 - 0',
+    ]
+
+    # 3. All fields are returned without projection
+    list_objects = await resource.get_list()
+
+    for instance in list_objects.instances:
+        assert instance.data.val2.startswith('val2')
@@ -0,0 +1,9 @@
+import pytest
+
+
+@pytest.fixture(params=[
+    pytest.param("postgres", marks=pytest.mark.slow),
+    pytest.param("mysql", marks=pytest.mark.slow),
+])
+def sql_resource(request):
+    yield request.getfixturevalue(request.param)
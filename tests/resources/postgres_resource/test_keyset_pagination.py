@@ -0,0 +1,154 @@
+import enum
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.schema import CreateTable
+from sqlalchemy.schema import DropTable
+
+from aiohttp_admin2.resources import Instance
+from aiohttp_admin2.resources import PostgresResource
+from aiohttp_admin2.resources.exceptions import ClientException
+
+
+class Status(enum.Enum):
+    draft = 1
+    published = 2
+
+
+enum_table = sa.Table(
+    'enum_table',
+    sa.MetaData(),
+    sa.Column('id', sa.Integer, primary_key=True),
+    sa.Column('status', sa.Enum(Status, native_enum=False), nullable=False),
+    sa.Column('name', sa.String(255)),
+    sa.Column('payload', sa.JSON),
+)
+
+
+async def create_instances(resource, values):
+    for val, val2 in values:
+        obj = Instance()
+        obj.data = {"val": val, "val2": val2}
+        await resource.create(obj)
+
+
+async def fetch_all_pages(resource, order_by, limit):
+    list_objects = await resource.get_list(limit=limit, order_by=order_by)
+    instances = list(list_objects.instances)
+
+    while list_objects.has_next:
+        list_objects = await resource.get_list(
+            cursor=list_objects.next_id,
+            limit=limit,
+            order_by=order_by,
+        )
+        instances.extend(list_objects.instances)
+
+    return instances
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ordering", ("val", "-val", "val2", "-val2"))
+async def test_keyset_pagination(sql_resource, ordering):
+    """
+    In this test check corrected work cursor pagination in get_list method of
+    sql resources with sorting by not primary key columns.
+
+        1. All instances are returned once in correct order (duplicated values
+        of the sort column and NULL values)
+        2. Cursor is opaque string
+    """
+    await create_instances(sql_resource, [
+        ('b', None),
+        ('a', 'x'),
+        ('b', 'y'),
+        ('c', None),
+        ('a', 'y'),
+        ('b', 'x'),
+        ('c', 'z'),
+    ])
+
+    full_list = await sql_resource.get_list(limit=10, order_by=ordering)
+
+    # 1. All instances are returned once in correct order
+    for limit in (1, 2, 3):
+        instances = await fetch_all_pages(sql_resource, ordering, limit)
+
+        assert [i.get_pk() for i in instances] == \
+            [i.get_pk() for i in full_list.instances]
+
+    # 2. Cursor is opaque string
+    list_objects = await sql_resource.get_list(limit=2, order_by=ordering)
+
+    assert isinstance(list_objects.next_id, str)
+    assert not hasattr(list_objects.instances[0].data, '_cursor_value')
+
+    with pytest.raises(ClientException):
+        await sql_resource.get_list(cursor='bad cursor', order_by=ordering)
+
+
+def test_is_cursor_sortable():
+    """
+    In this test we check that the cursor pagination is available only for
+    columns which values can be stored in the cursor.
+    """
+    resource = PostgresResource(
+        None,
+        enum_table,
+        custom_sort_list={"custom": lambda is_reverse: None},
+    )
+
+    assert resource.is_cursor_sortable('status')
+    assert resource.is_cursor_sortable('name')
+    assert resource.is_cursor_sortable('custom')
+    assert not resource.is_cursor_sortable('payload')
+    assert not resource.is_cursor_sortable('unknown')
+
+
+@pytest.mark.asyncio
+async def test_pagination_by_enum_column(sql_resource):
+    """
+    In this test we check pagination of the list sorted by the enum column.
+
+        1. Offset pagination
+        2. Cursor pagination
+    """
+    resource = type(sql_resource)(sql_resource.engine, enum_table)
+    statuses = [
+        Status.published,
+        Status.draft,
+        Status.published,
+        Status.draft,
+        Status.published,
+    ]
+
+    async with sql_resource.engine.acquire() as conn:
+        await conn.execute(CreateTable(enum_table))
+
+    try:
+        for status in statuses:
+            obj = Instance()
+            obj.data = {"status": status}
+            await resource.create(obj)
+
+        # 1. Offset pagination
+        pages = [
+            await resource.get_list(limit=2, page=page, order_by='status')
+            for page in (1, 2, 3)
+        ]
+
+        assert [
+            i.data.status
+            for page in pages
+            for i in page.instances
+        ] == sorted(statuses, key=lambda status: status.name)
+        assert isinstance(pages[0].next_id, str)
+
+        # 2. Cursor pagination
+        instances = await fetch_all_pages(resource, '-status', 2)
+
+        assert [i.data.status for i in instances] == \
+            sorted(statuses, key=lambda status: status.name, reverse=True)
+    finally:
+        async with sql_resource.engine.acquire() as conn:
+            await conn.execute(DropTable(enum_table))
@@ -0,0 +1,108 @@
+import enum
+import json
+from contextlib import asynccontextmanager
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from aiohttp_admin2.resources import PostgresResource
+from aiohttp_admin2.resources.types import FilterTuple
+
+from ..common_resource.utils import generate_fake_instance
+
+
+@pytest.mark.asyncio
+async def test_count_with_window_function(sql_resource, monkeypatch):
+    """
+    In this test check corrected work of the count which is calculated by the
+    window function together with the page.
+
+        1. Count without filters
+        2. Count with filters
+        3. Count for the page which is out of range
+    """
+    monkeypatch.setattr(sql_resource, 'count_with_window', True)
+    instances = await generate_fake_instance(sql_resource, 5)
+
+    # 1. Count without filters
+    list_objects = await sql_resource.get_list(limit=2)
+
+    assert list_objects.count == 5
+    assert len(list_objects.instances) == 2
+    assert not hasattr(list_objects.instances[0].data, '_total_count')
+
+    # 2. Count with filters
+    list_objects = await sql_resource.get_list(
+        limit=2,
+        filters=[FilterTuple('id', instances[0].get_pk(), 'ne')],
+    )
+
+    assert list_objects.count == 4
+
+    # 3. Count for the page which is out of range
+    list_objects = await sql_resource.get_list(limit=2, page=10)
+
+    assert list_objects.count == 5
+    assert not list_objects.instances
+
+
+class Status(enum.Enum):
+    draft = 1
+    published = 2
+
+
+class FakeCursor:
+    def __init__(self, value):
+        self.value = value
+
+    async def scalar(self):
+        return self.value
+
+
+class FakeEngine:
+    dialect = postgresql.dialect()
+
+    def __init__(self):
+        self.queries = []
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self
+
+    async def execute(self, query, *args):
+        self.queries.append((query, args))
+
+        return FakeCursor(json.dumps([{"Plan": {"Plan Rows": 7}}]))
+
+
+@pytest.mark.asyncio
+async def test_estimated_count_with_filters_is_executed_via_sqlalchemy():
+    """
+    In this test we check that the query of the estimated count is executed
+    via sqlalchemy so values of filters are processed by types of columns.
+    """
+    table = sa.Table(
+        'book',
+        sa.MetaData(),
+        sa.Column('id', sa.Integer, primary_key=True),
+        sa.Column('status', sa.Enum(Status)),
+    )
+    engine = FakeEngine()
+    resource = PostgresResource(engine, table)
+
+    count = await resource.get_estimated_count(
+        [FilterTuple('status', Status.published, 'eq')],
+    )
+    (query, args), = engine.queries
+    compiled = query.compile(dialect=engine.dialect)
+    status_param, = (
+        compiled._bind_processors[key](value)
+        for key, value in compiled.construct_params().items()
+        if key in compiled._bind_processors
+    )
+
+    assert count == 7
+    assert args == ()
+    assert str(compiled).startswith('EXPLAIN (FORMAT JSON) SELECT book.id')
+    assert status_param == 'published'
@@ -0,0 +1,47 @@
+import pytest
+
+from aiohttp_admin2.connection_injectors import ConnectionInjector
+from aiohttp_admin2.resources import Instance
+from aiohttp_admin2.resources import MySqlResource
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_create_many_with_auto_increment_step(mysql):
+    """
+    In this test we check that `create_many` of the mysql resource returns
+    created rows if ids of rows are not consecutive.
+    """
+    injector = ConnectionInjector()
+    injector.init(mysql.engine)
+    resource = MySqlResource(
+        mysql.engine,
+        mysql.table,
+        connection_injector=injector,
+    )
+    instances = []
+
+    for i in range(3):
+        obj = Instance()
+        obj.data = {"val": f'val1 - {i}', 'val2': f'val2 - {i}'}
+        instances.append(obj)
+
+    # all queries of the block use the same connection
+    async with injector.pin():
+        async with injector.acquire() as conn:
+            await conn.execute('SET SESSION auto_increment_increment = 3')
+
+        try:
+            created = await resource.create_many(instances)
+        finally:
+            async with injector.acquire() as conn:
+                await conn.execute('SET SESSION auto_increment_increment = 1')
+
+    ids = [i.get_pk() for i in created]
+
+    assert [i.data.val for i in created] == [
+        'val1 - 0',
+        'val1 - 1',
+        'val1 - 2',
+    ]
+    assert ids[1] - ids[0] == ids[2] - ids[1] == 3
@@ -0,0 +1,42 @@
+import enum
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from aiohttp_admin2.resources.postgres_resource.utils import PrefixedQuery
+
+
+class Status(enum.Enum):
+    draft = 1
+    published = 2
+
+
+table = sa.Table(
+    'test_table',
+    sa.MetaData(),
+    sa.Column('id', sa.Integer, primary_key=True),
+    sa.Column('status', sa.Enum(Status)),
+    sa.Column('json', sa.JSON),
+)
+
+
+def test_prefixed_query():
+    """
+    In this test we check that the query with the raw sql prefix is compiled
+    by sqlalchemy and values of parameters are processed by types of columns.
+    """
+    query = table.select().where(
+        (table.c.status == Status.published)
+        & (table.c.json == {"a": 1})
+    )
+    compiled = PrefixedQuery('EXPLAIN', query)\
+        .compile(dialect=postgresql.dialect())
+    params = compiled.construct_params()
+    processed = {
+        key: compiled._bind_processors[key](value)
+        if key in compiled._bind_processors else value
+        for key, value in params.items()
+    }
+
+    assert str(compiled).startswith('EXPLAIN SELECT test_table.id')
+    assert sorted(processed.values()) == ['published', '{"a": 1}']
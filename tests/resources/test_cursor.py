@@ -0,0 +1,69 @@
+import datetime
+import decimal
+import enum
+import uuid
+
+import pytest
+
+from aiohttp_admin2.resources.cursor import decode_cursor
+from aiohttp_admin2.resources.cursor import encode_cursor
+from aiohttp_admin2.resources.cursor import is_cursor_type
+from aiohttp_admin2.resources.exceptions import ClientException
+
+
+@pytest.mark.parametrize('value', [
+    None,
+    True,
+    10,
+    1.5,
+    'string',
+    decimal.Decimal('1.10'),
+    datetime.datetime(2020, 1, 1, 10, 30, tzinfo=datetime.timezone.utc),
+    datetime.date(2020, 1, 1),
+    datetime.time(10, 30),
+    uuid.UUID('12345678123456781234567812345678'),
+])
+def test_encode_and_decode_cursor(value):
+    """
+    In this test we check that the cursor keep value of the sort column and
+    primary key without changes.
+    """
+    cursor = encode_cursor(value, 1)
+
+    assert cursor.isascii() and '=' not in cursor
+    assert decode_cursor(cursor) == (value, 1)
+    assert type(decode_cursor(cursor)[0]) is type(value)
+
+
+@pytest.mark.parametrize('cursor', [
+    10,
+    '',
+    'invalid',
+    encode_cursor(1, 1)[:-2],
+])
+def test_decode_invalid_cursor(cursor):
+    """
+    In this test we check that invalid cursor raise the client error.
+    """
+    with pytest.raises(ClientException):
+        decode_cursor(cursor)
+
+
+class Status(enum.Enum):
+    draft = 1
+    published = 2
+
+
+def test_cursor_with_enum():
+    """
+    In this test we check that members of enums are stored in the cursor by
+    names and that types which can't be stored are recognized.
+    """
+    assert decode_cursor(encode_cursor(Status.published, 1)) == \
+        ('published', 1)
+    assert is_cursor_type(Status)
+    assert is_cursor_type(int)
+    assert not is_cursor_type(dict)
+
+    with pytest.raises(ClientException):
+        encode_cursor({"a": 1}, 1)
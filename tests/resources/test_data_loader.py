@@ -0,0 +1,150 @@
+import asyncio
+
+import pytest
+
+from aiohttp_admin2.controllers.controller import Controller
+from aiohttp_admin2.mappers import Mapper
+from aiohttp_admin2.mappers import fields
+from aiohttp_admin2.resources import DictResource
+from aiohttp_admin2.resources.data_loader import data_loaders
+
+
+class CountDictResource(DictResource):
+    """
+    Dict resource which save received ids to the `calls` list after each call
+    of the `get_many` method.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.calls = []
+        self.error = None
+
+    async def get_many(self, pks, field=None):
+        self.calls.append(sorted(pks))
+        await asyncio.sleep(0)
+
+        if self.error:
+            raise self.error
+
+        return await super().get_many(pks, field=field)
+
+
+def generate_resource():
+    return CountDictResource({
+        1: {"id": 1, "name": "Drama"},
+        2: {"id": 2, "name": "Comedy"},
+        3: {"id": 3, "name": "Horror"},
+    })
+
+
+@pytest.mark.asyncio
+async def test_load_many_coalesce_calls():
+    """
+    In this test we check that concurrent calls of the `load_many` method are
+    coalesced into one call of the `get_many` method.
+
+        1. Concurrent calls are coalesced
+        2. Result is cached for the request
+        3. Each call receives own instances
+        4. Calls for different fields use different batches
+        5. Without request calls are not coalesced
+    """
+    resource = generate_resource()
+    data_loaders.set({})
+
+    # 1. Concurrent calls are coalesced
+    first, second = await asyncio.gather(
+        resource.load_many([1, 2]),
+        resource.load_many([2, 3, 4]),
+    )
+
+    assert resource.calls == [[1, 2, 3, 4]]
+    assert list(first) == [1, 2]
+    assert first[2].data is second[2].data
+    assert second[3].data.name == 'Horror'
+    assert second[4] is None
+
+    # 2. Result is cached for the request
+    data = await resource.load_many([3, 1])
+
+    assert resource.calls == [[1, 2, 3, 4]]
+    assert data[1].data is first[1].data
+
+    # 3. Each call receives own instances
+    first[1].set_name('Changed')
+
+    assert data[1] is not first[1]
+    assert str(data[1]) != 'Changed'
+
+    # 4. Calls for different fields use different batches
+    data = await resource.load_many(['Drama'], field='name')
+
+    assert resource.calls == [[1, 2, 3, 4], ['Drama']]
+    assert data['Drama'].data.id == 1
+
+    # 5. Without request calls are not coalesced
+    resource.calls.clear()
+    data_loaders.set(None)
+
+    await asyncio.gather(
+        resource.load_many([1]),
+        resource.load_many([1]),
+    )
+
+    assert resource.calls == [[1], [1]]
+
+
+@pytest.mark.asyncio
+async def test_load_many_errors():
+    """
+    In this test we check that an error of the batch is raised for all calls
+    and failed ids are fetched again by the next call.
+    """
+    resource = generate_resource()
+    resource.error = ValueError('error')
+    data_loaders.set({})
+
+    results = await asyncio.gather(
+        resource.load_many([1]),
+        resource.load_many([2]),
+        return_exceptions=True,
+    )
+
+    assert [type(r) for r in results] == [ValueError, ValueError]
+
+    resource.error = None
+    data = await resource.load_many([1, 2])
+
+    assert resource.calls == [[1, 2], [1, 2]]
+    assert data[1].data.name == 'Drama'
+
+
+@pytest.mark.asyncio
+async def test_data_loader_is_cleared_after_changes():
+    """
+    In this test we check that cached instances of the resource are dropped
+    after the controller change data of the resource.
+    """
+    resource = generate_resource()
+    data_loaders.set({})
+
+    class GenreMapper(Mapper):
+        id = fields.IntField()
+        name = fields.StringField()
+
+    class GenreController(Controller):
+        mapper = GenreMapper
+
+    GenreController.resource = resource
+
+    controller = GenreController()
+    data = await controller.get_many([1])
+
+    assert data[1].data.name == 'Drama'
+
+    await controller.update(1, {"name": "Thriller"})
+    data = await controller.get_many([1])
+
+    assert data[1].data.name == 'Thriller'
+    assert resource.calls == [[1], [1]]
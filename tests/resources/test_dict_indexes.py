@@ -0,0 +1,149 @@
+import random
+
+import pytest
+
+from aiohttp_admin2.resources import DictResource
+from aiohttp_admin2.resources import Instance
+from aiohttp_admin2.resources.types import FilterTuple
+
+
+def generate_instance(data):
+    instance = Instance()
+    instance.data = dict(data)
+
+    return instance
+
+
+def generate_resources(count):
+    rows = {
+        i: {"id": i, "genre": i % 5, "pages": i % 37, "title": f"book {i}"}
+        for i in range(1, count + 1)
+    }
+
+    return (
+        DictResource({pk: dict(row) for pk, row in rows.items()}),
+        DictResource(rows, indexes=['genre', 'pages']),
+    )
+
+
+async def get_pks(resource, **kwargs):
+    data = await resource.get_list(**kwargs)
+
+    return [i.get_pk() for i in data.instances], data.count, data.has_next
+
+
+@pytest.mark.asyncio
+async def test_indexed_list_is_same_as_full_scan():
+    """
+    In this test we check that pages of the indexed resource are the same as
+    pages of the resource without indexes.
+
+        1. Ordering and pagination
+        2. Indexed and not indexed filters
+        3. Cursor pagination
+        4. Same results after changes of rows
+    """
+    resource, indexed = generate_resources(200)
+    filters_list = [
+        [],
+        [FilterTuple('genre', 2, 'eq')],
+        [FilterTuple('genre', [1, 3], 'in')],
+        [FilterTuple('pages', 10, 'gt'), FilterTuple('pages', 20, 'lte')],
+        [FilterTuple('genre', 4, 'eq'), FilterTuple('pages', 30, 'lt')],
+        [FilterTuple('genre', 0, 'eq'), FilterTuple('title', 'k 1', 'like')],
+        [FilterTuple('title', '5', 'like')],
+    ]
+
+    async def check():
+        for filters in filters_list:
+            # 1. Ordering and pagination
+            # 2. Indexed and not indexed filters
+            for order_by in ['id', '-id', 'pages', '-pages', '-genre']:
+                for page in [1, 2, 5]:
+                    params = dict(
+                        filters=filters,
+                        order_by=order_by,
+                        page=page,
+                        limit=7,
+                    )
+                    expected = await get_pks(resource, **params)
+                    result = await get_pks(indexed, **params)
+
+                    # rows with the same value of the sort field are ordered
+                    # by pk in the index
+                    field = order_by.lstrip('-')
+
+                    assert result[1:] == expected[1:]
+                    assert [
+                        indexed.engine[pk][field] for pk in result[0]
+                    ] == [
+                        resource.engine[pk][field] for pk in expected[0]
+                    ]
+
+            # 3. Cursor pagination
+            for order_by in ['id', '-id']:
+                params = dict(filters=filters, order_by=order_by, limit=7)
+                assert await get_pks(resource, cursor=50, **params) == \
+                    await get_pks(indexed, cursor=50, **params)
+
+            assert await resource.get_count(filters) == \
+                await indexed.get_count(filters)
+
+    await check()
+
+    # 4. Same results after changes of rows
+    random.seed(1)
+
+    for pk in random.sample(range(1, 201), 40):
+        await resource.delete(pk)
+        await indexed.delete(pk)
+
+    await resource.update_fields({"genre": 1}, filters=filters_list[3])
+    await indexed.update_fields({"genre": 1}, filters=filters_list[3])
+
+    for pk in list(resource.engine)[:20]:
+        data = {**resource.engine[pk], "pages": 36 - pk % 37}
+        await resource.update(pk, generate_instance(data))
+        await indexed.update(pk, generate_instance(data))
+
+    for data in [{"genre": 2, "pages": 1, "title": "new"}] * 3:
+        await resource.create(generate_instance(data))
+        await indexed.create(generate_instance(data))
+
+    await check()
+
+
+@pytest.mark.asyncio
+async def test_indexed_resource_without_sortable_values():
+    """
+    In this test we check that the resource falls back to the full scan if
+    the indexed field contains `None` values and that relations are fetched
+    by the hash index.
+    """
+    indexed = DictResource({
+        1: {"id": 1, "code": "b"},
+        2: {"id": 2, "code": None},
+        3: {"id": 3, "code": "a"},
+    }, indexes=['code'])
+
+    assert not indexed.indexes['code'].is_sortable
+
+    data = await indexed.get_list(
+        filters=[FilterTuple('code', 'a', 'eq')],
+        order_by='code',
+    )
+
+    assert [i.get_pk() for i in data.instances] == [3]
+
+    data = await indexed.get_many(['a', 'b', 'c'], field='code')
+
+    assert data['a'].get_pk() == 3
+    assert data['b'].get_pk() == 1
+    assert data['c'] is None
+
+    await indexed.delete(2)
+
+    assert indexed.indexes['code'].is_sortable
+    assert [i.get_pk() for i in (await indexed.get_list(
+        order_by='code',
+    )).instances] == [3, 1]
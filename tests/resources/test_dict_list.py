@@ -0,0 +1,132 @@
+import pytest
+
+from aiohttp_admin2.resources import DictResource
+from aiohttp_admin2.resources.dict_resource.filters import DictBaseFilter
+from aiohttp_admin2.resources.dict_resource.filters import LT
+from aiohttp_admin2.resources.types import FilterTuple
+
+
+class CountDictResource(DictResource):
+    """
+    Dict resource which count instances created by the `_row_to_instance`
+    method.
+    """
+    created = 0
+
+    def _row_to_instance(self, row):
+        self.created += 1
+
+        return super()._row_to_instance(row)
+
+
+class EvenFilter(DictBaseFilter):
+    """Custom filter without the `compare` function."""
+
+    def apply(self):
+        return self._update_query(lambda a, b: a % 2 == b)
+
+
+class OddLT(LT):
+    """Subclass of the concrete filter which redefines only `apply`."""
+
+    def apply(self):
+        return self._update_query(lambda a, b: a < b and a % 2)
+
+
+def generate_resource(count):
+    return CountDictResource({
+        i: {"id": i, "pages": i * 7919 % 101}
+        for i in range(1, count + 1)
+    })
+
+
+@pytest.mark.asyncio
+async def test_partial_sort_of_list():
+    """
+    In this test we check that the partial sort returns the same pages as the
+    full sort and that instances are created only for rows of the page.
+
+        1. Pages of the partial and full sorts
+        2. Instances are created only for the page
+        3. Filters without the `compare` function
+    """
+    resource = generate_resource(300)
+
+    # 1. Pages of the partial and full sorts
+    for order_by in ['id', '-id', 'pages', '-pages']:
+        for page in [1, 3, 30]:
+            params = dict(order_by=order_by, page=page, limit=10)
+            resource.partial_sort_limit = 1000
+            partial = await resource.get_list(**params)
+            resource.partial_sort_limit = 0
+            full = await resource.get_list(**params)
+            field = order_by.lstrip('-')
+
+            assert [getattr(i.data, field) for i in partial.instances] == \
+                [getattr(i.data, field) for i in full.instances]
+            assert partial.has_next == full.has_next
+
+    # 2. Instances are created only for the page
+    resource.created = 0
+    resource.partial_sort_limit = 1000
+    data = await resource.get_list(
+        filters=[FilterTuple('pages', 50, 'lt')],
+        order_by='pages',
+        page=2,
+        limit=10,
+    )
+
+    assert resource.created == 11
+    assert data.count == len([
+        row for row in resource.engine.values() if row['pages'] < 50
+    ])
+
+    # 3. Filters without the `compare` function
+    data = await resource.get_list(
+        filters=[FilterTuple('id', 0, EvenFilter)],
+        cursor=100,
+        limit=5,
+    )
+
+    assert [i.get_pk() for i in data.instances] == [98, 96, 94, 92, 90]
+
+
+@pytest.mark.asyncio
+async def test_pages_with_same_values():
+    """
+    In this test we check that rows with the same value of the sort field
+    are neither duplicated nor skipped between pages of the partial and the
+    full sort and that subclasses of filters with own `apply` are used.
+
+        1. Pages of the partial and full sorts don't overlap
+        2. Subclass of the filter with own `apply` method
+    """
+    resource = CountDictResource({
+        i: {"id": i, "pages": i % 3}
+        for i in range(1, 61)
+    })
+    # first two pages are selected by the partial sort, the third page
+    # starts inside the group of rows with the same value
+    resource.partial_sort_limit = 16
+
+    # 1. Pages of the partial and full sorts don't overlap
+    for order_by in ['pages', '-pages']:
+        pks = []
+
+        for page in range(1, 10):
+            data = await resource.get_list(
+                order_by=order_by,
+                page=page,
+                limit=7,
+            )
+            pks.extend(i.get_pk() for i in data.instances)
+
+        assert sorted(pks) == list(range(1, 61))
+
+    # 2. Subclass of the filter with own `apply` method
+    data = await resource.get_list(
+        filters=[FilterTuple('id', 10, OddLT)],
+        order_by='id',
+    )
+
+    assert [i.get_pk() for i in data.instances] == [1, 3, 5, 7, 9]
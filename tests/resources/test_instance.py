@@ -0,0 +1,189 @@
+import asyncio
+import copy
+from collections.abc import Mapping
+
+import pytest
+import sqlalchemy as sa
+
+from aiohttp_admin2.controllers.controller import Controller
+from aiohttp_admin2.exceptions import AdminException
+from aiohttp_admin2.resources.abc import Data
+from aiohttp_admin2.resources import Instance
+from aiohttp_admin2.resources import InstanceBatch
+from aiohttp_admin2.resources import PostgresResource
+
+
+class Row(Mapping):
+    """The row of the driver which is not a dict."""
+
+    def __init__(self, **fields):
+        self._fields = fields
+
+    def __getitem__(self, name):
+        return self._fields[name]
+
+    def __getattr__(self, name):
+        try:
+            return self._fields[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+
+def test_instance_is_compact():
+    """
+    In this test we check that the instance doesn't have the dict of
+    attributes and the row is used as fields of the instance without copy.
+
+        1. Dict row is used without copy
+        2. Driver row is used without copy and service fields are hidden
+        3. Driver row is copied only on changes
+    """
+    # 1. Dict row is used without copy
+    row = {"id": 1, "name": "Bob"}
+    instance = Instance()
+    instance.data = row
+
+    assert not hasattr(instance, '__dict__')
+    assert instance.data.to_dict() is row
+    assert instance.data.name == instance.data['name'] == 'Bob'
+    assert instance.get_pk() == 1
+
+    instance.data = {"name": "Bob"}
+
+    with pytest.raises(AdminException):
+        instance.get_pk()
+
+    # 2. Driver row is used without copy and service fields are hidden
+    row = Row(id=2, name='Alice', _total_count=10)
+    instance.data = Data(row, {'_total_count'})
+
+    assert instance.data.to_row() is row
+    assert instance.data.name == 'Alice'
+    assert instance.get_pk() == 2
+    assert not hasattr(instance.data, '_total_count')
+    assert '_total_count' not in instance.data
+
+    # 3. Driver row is copied only on changes
+    instance.data.name = 'Bob'
+
+    assert instance.data.to_dict() == {"id": 2, "name": "Bob"}
+    assert row['name'] == 'Alice'
+    assert copy.copy(instance.data).name == 'Bob'
+
+
+@pytest.mark.asyncio
+async def test_postgres_instance_name_is_lazy():
+    """
+    In this test we check that the name of the instance of the postgres
+    resource is computed only on the first use and that the `object_name`
+    method receives the row of the driver.
+    """
+    table = sa.Table('book', sa.MetaData(), sa.Column('id', sa.Integer))
+    calls = []
+
+    class BookResource(PostgresResource):
+        def object_name(self, row):
+            calls.append(row)
+
+            return f'book {row.id}'
+
+    resource = BookResource(None, table)
+    row = Row(id=1)
+    instance = resource._row_to_instance(row)
+
+    await Controller().prepare_instances([instance])
+
+    assert calls == []
+    assert str(instance) == 'book 1'
+    assert str(instance) == 'book 1'
+    assert calls == [row]
+    assert calls[0] is row
+
+    instance.set_name('Book')
+
+    assert str(instance) == 'Book'
+
+
+def test_postgres_instance_name_after_to_dict():
+    """
+    In this test we check that the name of the instance of the postgres
+    resource is computed from the row of the driver after the conversion of
+    fields to the dict (also for copies of the instance).
+    """
+    table = sa.Table('book', sa.MetaData(), sa.Column('id', sa.Integer))
+    resource = PostgresResource(None, table)
+    instance = resource._row_to_instance(Row(id=1))
+    copy = instance.copy()
+
+    instance.data.to_dict()['id'] = 2
+
+    assert repr(copy) == '<book id=1>'
+    assert repr(instance) == '<book id=1>'
+    assert instance.data.id == 2
+
+
+def generate_instance(data):
+    instance = Instance()
+    instance.data = data
+
+    return instance
+
+
+@pytest.mark.asyncio
+async def test_instance_batch():
+    """
+    In this test we check that instances fetched together share the batch
+    and that the loader of the batch is called once for each key.
+
+        1. Instances share the batch
+        2. Unique values of the field
+        3. Concurrent loads call the loader once
+        4. Failed load is repeated
+    """
+    instances = [
+        generate_instance({"id": i, "author_id": author_id})
+        for i, author_id in enumerate([1, 2, None, 1])
+    ]
+    batch = InstanceBatch(instances)
+
+    # 1. Instances share the batch
+    assert all(i.batch is batch for i in instances)
+    assert instances[0].prefetch_together is batch.instances
+    assert InstanceBatch.of(instances[1:]) is batch
+    assert InstanceBatch.of([instances[0], Instance()]) is not batch
+    assert generate_instance({}).prefetch_together
+
+    # 2. Unique values of the field
+    assert batch.get_values('author_id') == [1, 2]
+
+    # 3. Concurrent loads call the loader once
+    calls = []
+
+    async def loader():
+        calls.append(len(calls))
+        await asyncio.sleep(0.01)
+
+        if len(calls) == 1:
+            raise ValueError
+
+    batch = InstanceBatch(instances)
+    results = await asyncio.gather(
+        batch.load('author', loader),
+        batch.load('author', loader),
+        return_exceptions=True,
+    )
+
+    assert calls == [0]
+    assert all(isinstance(r, ValueError) for r in results)
+
+    # 4. Failed load is repeated
+    await batch.load('author', loader)
+    await batch.load('author', loader)
+
+    assert calls == [0, 1]
@@ -1,4 +1,12 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+import sqlalchemy as sa
 from aiohttp_admin2.connection_injectors import ConnectionInjector
+from aiohttp_admin2.connection_injectors import ConnectionAcquireTimeout
+from aiohttp_admin2.controllers.postgres_controller import PostgresController
+from aiohttp_admin2.resources import PostgresResource
 from aiohttp import web
 
 
@@ -30,3 +38,447 @@ async def test_connection_injector(aiohttp_client):
     assert isinstance(TestController.connection_injector, ConnectionInjector)
     assert \
         TestController.connection_injector.connection == db_connection_string
+
+
+class FakeTransaction:
+    def __init__(self, connection) -> None:
+        self.connection = connection
+
+    async def commit(self):
+        self.connection.queries.append('COMMIT')
+        self.connection.in_transaction = False
+
+    async def rollback(self):
+        self.connection.queries.append('ROLLBACK')
+        self.connection.in_transaction = False
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.queries = []
+        self.in_transaction = False
+
+    async def execute(self, query):
+        self.queries.append(query)
+
+    async def begin(self):
+        self.queries.append('BEGIN')
+        self.in_transaction = True
+
+        return FakeTransaction(self)
+
+
+class FakeDialect:
+    name = 'postgresql'
+
+
+class FakeEngine:
+    """The engine which imitate a pool of connections."""
+    dialect = FakeDialect()
+
+    def __init__(self, minsize=1, maxsize=1, reuse=False):
+        self.minsize = minsize
+        self.maxsize = maxsize
+        self.size = 0
+        self.connections = []
+        self.closed = False
+        # return released connections back to the pool like real pools do
+        self.reuse = reuse
+        self._free = []
+        self._semaphore = asyncio.Semaphore(maxsize)
+
+    @property
+    def freesize(self):
+        return self.maxsize - self.size
+
+    @asynccontextmanager
+    async def acquire(self):
+        async with self._semaphore:
+            self.size += 1
+
+            if self.reuse and self._free:
+                connection = self._free.pop()
+            else:
+                connection = FakeConnection()
+                self.connections.append(connection)
+
+            try:
+                yield connection
+            finally:
+                self.size -= 1
+
+                if self.reuse:
+                    self._free.append(connection)
+
+    def close(self):
+        self.closed = True
+
+    async def wait_closed(self):
+        pass
+
+
+async def create_fake_engine(**kwargs):
+    return FakeEngine(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_connection_injector_pool():
+    """
+    In this test we check management of the pool by ConnectionInjector:
+
+        1. create the pool via factory
+        2. acquire timeout and statistic of the pool
+        3. statement timeout is set once per connection of the own pool
+        4. statement timeout is reset after queries to a shared pool
+        5. close the pool
+    """
+    injector = ConnectionInjector(acquire_timeout=0.01, statement_timeout=2)
+
+    # 1. create the pool via factory
+    engine = await injector.create(
+        create_fake_engine,
+        minsize=1,
+        maxsize=1,
+        reuse=True,
+    )
+
+    assert injector.connection is engine
+    assert engine.maxsize == 1
+
+    # 2. acquire timeout and statistic of the pool
+    async with injector.acquire():
+        assert injector.stats.free_size == 0
+
+        with pytest.raises(ConnectionAcquireTimeout):
+            async with injector.acquire():
+                pass
+
+    stats = injector.stats
+
+    assert stats.free_size == 1
+    assert stats.acquired_count == 1
+    assert stats.timeouts_count == 1
+    assert stats.waiting == 0
+
+    # 3. statement timeout is set once per connection of the own pool
+    async with injector.acquire() as conn:
+        await conn.execute('select')
+
+    assert len(engine.connections) == 1
+    assert engine.connections[0].queries == [
+        'SET statement_timeout = 2000',
+        'select',
+    ]
+
+    # 4. statement timeout is reset after queries to a shared pool
+    shared_injector = ConnectionInjector(statement_timeout=2)
+    shared_engine = FakeEngine(reuse=True)
+    shared_injector.init(shared_engine)
+
+    async with shared_injector.acquire() as conn:
+        await conn.execute('select')
+
+    assert shared_engine.connections[0].queries == [
+        'SET statement_timeout = 2000',
+        'select',
+        'SET statement_timeout = DEFAULT',
+    ]
+
+    # 5. close the pool
+    await injector.close()
+
+    assert engine.closed
+
+
+@pytest.mark.asyncio
+async def test_connection_injector_pin():
+    """
+    In this test we check that ConnectionInjector share one connection
+    between all queries inside the pin block.
+
+        1. connection is acquired lazily
+        2. one connection for sequential and concurrent queries
+        3. connection is released after the block
+    """
+    injector = ConnectionInjector()
+    engine = FakeEngine(maxsize=2)
+    injector.init(engine)
+
+    async def query(name):
+        async with injector.acquire() as conn:
+            await asyncio.sleep(0)
+            await conn.execute(name)
+
+    async with injector.pin():
+        # 1. connection is acquired lazily
+        assert not engine.connections
+
+        # 2. one connection for sequential and concurrent queries
+        await query('first')
+        await asyncio.gather(query('second'), query('third'))
+
+        async with injector.acquire():
+            await query('nested')
+
+        assert len(engine.connections) == 1
+        assert engine.connections[0].queries == \
+            ['first', 'second', 'third', 'nested']
+        assert engine.size == 1
+
+    # 3. connection is released after the block
+    assert engine.size == 0
+
+    await query('without pin')
+
+    assert len(engine.connections) == 2
+
+
+@pytest.mark.asyncio
+async def test_connection_injector_transaction():
+    """
+    In this test we check that ConnectionInjector execute queries inside the
+    pin block in one transaction.
+
+        1. transaction is committed after success
+        2. transaction is rolled back after error
+        3. nested blocks join the outer transaction
+    """
+    injector = ConnectionInjector()
+    engine = FakeEngine(maxsize=2)
+    injector.init(engine)
+
+    async def query(name):
+        async with injector.acquire() as conn:
+            await conn.execute(name)
+
+    # 1. transaction is committed after success
+    async with injector.pin(transaction=True):
+        await query('update')
+
+    assert engine.connections[-1].queries == ['BEGIN', 'update', 'COMMIT']
+
+    # 2. transaction is rolled back after error
+    with pytest.raises(ValueError):
+        async with injector.pin(transaction=True):
+            await query('update')
+            raise ValueError
+
+    assert engine.connections[-1].queries == ['BEGIN', 'update', 'ROLLBACK']
+
+    # 3. nested blocks join the outer transaction
+    async with injector.pin():
+        await query('select')
+
+        async with injector.pin(transaction=True):
+            await query('update')
+
+            async with injector.pin(transaction=True):
+                await query('delete')
+
+    assert engine.connections[-1].queries == \
+        ['select', 'BEGIN', 'update', 'delete', 'COMMIT']
+    assert engine.size == 0
+
+
+async def test_connection_injector_middleware(aiohttp_client):
+    """
+    In this test we check that the middleware of ConnectionInjector execute
+    requests with unsafe methods in one transaction.
+
+        1. safe request without transaction
+        2. redirect after success update commit transaction
+        3. error roll back transaction
+    """
+    injector = ConnectionInjector()
+    engine = FakeEngine(maxsize=2)
+    injector.init(engine)
+
+    async def handler(request):
+        async with injector.acquire() as conn:
+            await conn.execute(request.method)
+
+        if request.query.get('error'):
+            raise web.HTTPBadRequest()
+
+        if request.method == 'POST':
+            raise web.HTTPFound('/')
+
+        return web.Response()
+
+    application = web.Application(middlewares=[injector.middleware])
+    application.router.add_route('*', '/', handler)
+    cli = await aiohttp_client(application)
+
+    # 1. safe request without transaction
+    res = await cli.get('/')
+
+    assert res.status == 200
+    assert engine.connections[-1].queries == ['GET']
+
+    # 2. redirect after success update commit transaction
+    res = await cli.post('/', allow_redirects=False)
+
+    assert res.status == 302
+    assert engine.connections[-1].queries == ['BEGIN', 'POST', 'COMMIT']
+
+    # 3. error roll back transaction
+    res = await cli.post('/?error=1')
+
+    assert res.status == 400
+    assert engine.connections[-1].queries == ['BEGIN', 'POST', 'ROLLBACK']
+
+
+@pytest.mark.asyncio
+async def test_connection_injector_replicas():
+    """
+    In this test we check that ConnectionInjector execute read-only queries
+    on replicas.
+
+        1. read-only queries are balanced between replicas
+        2. writes are executed on the primary
+        3. inside the pin block reads share the connection to the replica
+        4. reads after writes of the pin block are executed on the primary
+        5. reads inside the transaction are executed on the primary
+        6. replicas are created and closed together with the primary
+    """
+    injector = ConnectionInjector()
+    engine, replica, other_replica = FakeEngine(), FakeEngine(), FakeEngine()
+    injector.init(engine, replicas=[replica, other_replica])
+
+    async def query(name, readonly=False):
+        async with injector.acquire(readonly=readonly) as conn:
+            await conn.execute(name)
+
+    # 1. read-only queries are balanced between replicas
+    await query('first', readonly=True)
+    await query('second', readonly=True)
+    await query('third', readonly=True)
+
+    assert [c.queries for c in replica.connections] == [['first'], ['third']]
+    assert [c.queries for c in other_replica.connections] == [['second']]
+
+    # 2. writes are executed on the primary
+    await query('update')
+
+    assert [c.queries for c in engine.connections] == [['update']]
+
+    # 3. inside the pin block reads share the connection to the replica
+    async with injector.pin():
+        await query('select', readonly=True)
+        await query('count', readonly=True)
+
+        # 4. reads after writes of the pin block are executed on the primary
+        await query('update')
+        await query('select after update', readonly=True)
+
+    assert other_replica.connections[-1].queries == ['select', 'count']
+    assert engine.connections[-1].queries == ['update', 'select after update']
+
+    # 5. reads inside the transaction are executed on the primary
+    async with injector.pin(transaction=True):
+        await query('select', readonly=True)
+
+    assert engine.connections[-1].queries == ['BEGIN', 'select', 'COMMIT']
+    assert len(replica.connections) + len(other_replica.connections) == 4
+
+    # 6. replicas are created and closed together with the primary
+    injector = ConnectionInjector()
+    await injector.create(create_fake_engine, maxsize=2, replicas=[{}])
+
+    assert len(injector.replicas) == 1
+    assert injector.replicas[0].maxsize == 2
+
+    await injector.close()
+
+    assert injector.connection.closed
+    assert injector.replicas[0].closed
+
+
+async def test_connection_injector_middleware_replicas(aiohttp_client):
+    """
+    In this test we check that the middleware of ConnectionInjector execute
+    read-only queries of the session on the primary after writes.
+
+        1. reads are executed on the replica
+        2. request with unsafe method without writes doesn't set the cookie
+        3. redirect after the write set the cookie
+        4. reads of the next request are executed on the primary
+    """
+    injector = ConnectionInjector(sticky_time=5)
+    engine, replica = FakeEngine(maxsize=2), FakeEngine(maxsize=2)
+    injector.init(engine, replicas=[replica])
+
+    async def handler(request):
+        async with injector.acquire(readonly=True) as conn:
+            await conn.execute(request.method)
+
+        if request.query.get('write'):
+            async with injector.acquire() as conn:
+                await conn.execute('UPDATE')
+
+        if request.method == 'POST':
+            raise web.HTTPFound('/')
+
+        return web.Response()
+
+    application = web.Application(middlewares=[injector.middleware])
+    application.router.add_route('*', '/', handler)
+    cli = await aiohttp_client(application)
+
+    # 1. reads are executed on the replica
+    res = await cli.get('/')
+
+    assert res.status == 200
+    assert injector.sticky_cookie_name not in res.cookies
+    assert replica.connections[-1].queries == ['GET']
+
+    # 2. request with unsafe method without writes doesn't set the cookie
+    res = await cli.post('/', allow_redirects=False)
+
+    assert res.status == 302
+    assert injector.sticky_cookie_name not in res.cookies
+    assert engine.connections[-1].queries == ['BEGIN', 'POST', 'COMMIT']
+
+    # 3. redirect after the write set the cookie
+    res = await cli.post('/?write=1', allow_redirects=False)
+    cookie = res.cookies[injector.sticky_cookie_name]
+
+    assert res.status == 302
+    assert cookie['max-age'] == '5'
+    assert engine.connections[-1].queries == \
+        ['BEGIN', 'POST', 'UPDATE', 'COMMIT']
+
+    # 4. reads of the next request are executed on the primary
+    res = await cli.get('/')
+
+    assert res.status == 200
+    assert engine.connections[-1].queries == ['GET']
+    assert len(replica.connections) == 1
+
+
+def test_connection_injector_of_custom_resource():
+    """
+    In this test we check that the injector is passed to the resource of the
+    sql controller which redefine `__init__` without the
+    `connection_injector` argument.
+    """
+    table = sa.Table(
+        'book',
+        sa.MetaData(),
+        sa.Column('id', sa.Integer, primary_key=True),
+    )
+    injector = ConnectionInjector()
+    injector.init(FakeEngine())
+
+    class CustomResource(PostgresResource):
+        def __init__(self, engine, table, custom_sort_list=None):
+            super().__init__(engine, table, custom_sort_list)
+
+    @injector.inject
+    class BookController(PostgresController, table=table):
+        resource = CustomResource
+
+    resource = BookController().get_resource()
+
+    assert isinstance(resource, CustomResource)
+    assert resource.connection_injector is injector
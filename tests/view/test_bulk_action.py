@@ -0,0 +1,198 @@
+from aiohttp import web
+from aiohttp_admin2 import setup_admin
+from aiohttp_admin2.controllers.controller import Controller
+from aiohttp_admin2.mappers import Mapper
+from aiohttp_admin2.mappers import fields
+from aiohttp_admin2.resources import DictResource
+from aiohttp_admin2.views import ControllerView
+
+from .utils import generate_new_admin_class
+
+
+class BookMapper(Mapper):
+    id = fields.IntField()
+    title = fields.StringField()
+    pages = fields.IntField()
+    genre = fields.StringField()
+
+
+def generate_app(count, **controller_attrs):
+    resource = DictResource({
+        i: {
+            "id": i,
+            "title": f"book {i}",
+            "pages": i * 10,
+            "genre": "drama" if i % 2 else "comedy",
+        }
+        for i in range(1, count + 1)
+    })
+
+    class BookController(Controller):
+        mapper = BookMapper
+        name = 'book'
+        list_filter = ['genre', ]
+        bulk_actions = ['delete', 'update']
+
+    BookController.resource = resource
+
+    for name, value in controller_attrs.items():
+        setattr(BookController, name, value)
+
+    class BookView(ControllerView):
+        controller = BookController
+
+    app = web.Application()
+    setup_admin(
+        app,
+        views=[BookView, ],
+        admin_class=generate_new_admin_class(),
+    )
+
+    return app, resource
+
+
+async def test_bulk_action(aiohttp_client):
+    """
+    In this test we check bulk actions of the list page.
+
+        1. Update selected instances
+        2. Delete selected instances
+        3. Delete all instances which match filters
+        4. Invalid values and unknown actions are not applied
+    """
+    app, resource = generate_app(6)
+    cli = await aiohttp_client(app)
+
+    # 1. Update selected instances
+    res = await cli.post(
+        '/admin/book/bulk/',
+        data=[
+            ("action", "update"),
+            ("pk", "1"),
+            ("pk", "2"),
+            ("value_pages", "5"),
+        ],
+        allow_redirects=False,
+    )
+
+    assert res.status == 302
+    assert res.headers['Location'].startswith('/admin/book/?message=')
+    assert [resource.engine[i]["pages"] for i in range(1, 4)] == [5, 5, 30]
+
+    # 2. Delete selected instances
+    await cli.post(
+        '/admin/book/bulk/',
+        data=[("action", "delete"), ("pk", "1"), ("pk", "2")],
+    )
+
+    assert list(resource.engine) == [3, 4, 5, 6]
+
+    # 3. Delete all instances which match filters
+    res = await cli.post(
+        '/admin/book/bulk/?single_value_genre=drama',
+        data={"action": "delete", "select_all": "1"},
+        allow_redirects=False,
+    )
+
+    assert list(resource.engine) == [4, 6]
+    assert 'single_value_genre=drama' in res.headers['Location']
+
+    # 4. Invalid values and unknown actions are not applied
+    for data in [
+        [("action", "update"), ("pk", "4"), ("value_pages", "many")],
+        [("action", "update"), ("pk", "4"), ("value_id", "10")],
+        [("action", "update"), ("pk", "4")],
+        [("action", "archive"), ("pk", "4")],
+        [("action", "delete")],
+    ]:
+        res = await cli.post(
+            '/admin/book/bulk/',
+            data=data,
+            allow_redirects=False,
+        )
+
+        assert res.status == 302
+
+    assert list(resource.engine) == [4, 6]
+    assert resource.engine[4]["pages"] == 40
+
+
+async def test_bulk_action_form_on_list_page(aiohttp_client):
+    """
+    In this test we check that the list page contains the form of bulk
+    actions and checkboxes of instances.
+    """
+    app, _ = generate_app(2)
+    cli = await aiohttp_client(app)
+
+    res = await cli.get('/admin/book/')
+    text = await res.text()
+
+    assert res.status == 200
+    assert 'id="bulk-action-form"' in text
+    assert text.count('form="bulk-action-form"') == 2
+
+
+async def test_bulk_delete_of_all_instances(aiohttp_client):
+    """
+    In this test we check the bulk delete of all instances.
+
+        1. Action without filters must be confirmed
+        2. Hooks of each instance are called by the bulk delete
+    """
+    deleted = []
+
+    async def pre_delete(self, pk):
+        deleted.append(('pre', pk))
+
+    async def post_delete(self, pk):
+        deleted.append(('post', pk))
+
+    app, resource = generate_app(
+        4,
+        pre_delete=pre_delete,
+        post_delete=post_delete,
+    )
+    cli = await aiohttp_client(app)
+
+    # 1. Action without filters must be confirmed
+    await cli.post(
+        '/admin/book/bulk/',
+        data={"action": "delete", "select_all": "1"},
+    )
+
+    assert list(resource.engine) == [1, 2, 3, 4]
+
+    # 2. Hooks of each instance are called by the bulk delete
+    await cli.post(
+        '/admin/book/bulk/',
+        data={"action": "delete", "select_all": "1", "confirm_all": "1"},
+    )
+
+    assert list(resource.engine) == []
+    assert sorted(deleted) == [
+        *[('post', pk) for pk in range(1, 5)],
+        *[('pre', pk) for pk in range(1, 5)],
+    ]
+
+
+async def test_bulk_actions_are_disabled_by_default(aiohttp_client):
+    """
+    In this test we check that bulk actions are not available if they are
+    not specified for the controller.
+    """
+    assert Controller.bulk_actions == []
+
+    app, resource = generate_app(2, bulk_actions=Controller.bulk_actions)
+    cli = await aiohttp_client(app)
+
+    res = await cli.get('/admin/book/')
+
+    assert 'id="bulk-action-form"' not in await res.text()
+
+    await cli.post(
+        '/admin/book/bulk/',
+        data=[("action", "delete"), ("pk", "1")],
+    )
+
+    assert list(resource.engine) == [1, 2]
@@ -0,0 +1,149 @@
+import gzip
+import json
+
+from aiohttp import web
+from aiohttp_admin2 import setup_admin
+from aiohttp_admin2.controllers.controller import Controller
+from aiohttp_admin2.mappers import Mapper
+from aiohttp_admin2.mappers import fields
+from aiohttp_admin2.resources import DictResource
+from aiohttp_admin2.views import ControllerView
+from aiohttp_admin2.views.aiohttp.export import EXPORT_FORMATS
+
+from .utils import generate_new_admin_class
+
+
+class BookMapper(Mapper):
+    id = fields.IntField()
+    title = fields.StringField()
+    pages = fields.IntField()
+    genre = fields.StringField()
+
+
+def generate_app(count, export_formats=EXPORT_FORMATS):
+    class BookController(Controller):
+        mapper = BookMapper
+        name = 'book'
+        list_filter = ['genre', ]
+        export_chunk_size = 3
+        resource = DictResource({
+            i: {
+                "id": i,
+                "title": f"book {i}",
+                "pages": i * 10,
+                "genre": "drama" if i % 2 else "comedy",
+            }
+            for i in range(1, count + 1)
+        })
+
+    class BookView(ControllerView):
+        controller = BookController
+
+    BookView.export_formats = export_formats
+
+    app = web.Application()
+    setup_admin(
+        app,
+        views=[BookView, ],
+        admin_class=generate_new_admin_class(),
+    )
+
+    return app
+
+
+async def test_export_list(aiohttp_client):
+    """
+    In this test we check the export of all instances of the list page.
+
+        1. Export to csv
+        2. Export to jsonl
+        3. Export with filters and ordering
+        4. Compressed export
+        5. Unknown format
+    """
+    cli = await aiohttp_client(generate_app(10))
+
+    # 1. Export to csv
+    res = await cli.get('/admin/book/export/', params={"sort": "id"})
+    lines = (await res.text()).splitlines()
+
+    assert res.status == 200
+    assert res.headers['Content-Type'].startswith('text/csv')
+    assert 'book.csv' in res.headers['Content-Disposition']
+    assert len(lines) == 11
+    assert lines[0] == 'id,title,pages,genre'
+    assert lines[1] == '1,book 1,10,drama'
+
+    # 2. Export to jsonl
+    res = await cli.get('/admin/book/export/', params={"format": "jsonl"})
+    lines = (await res.text()).splitlines()
+
+    assert res.status == 200
+    assert len(lines) == 10
+    assert json.loads(lines[0]) == {
+        "id": 1,
+        "title": "book 1",
+        "pages": 10,
+        "genre": "drama",
+    }
+
+    # 3. Export with filters and ordering
+    res = await cli.get('/admin/book/export/', params={
+        "single_value_genre": "comedy",
+        "sort": "pages",
+        "sortDir": "desc",
+    })
+    lines = (await res.text()).splitlines()
+
+    assert [line.split(',')[0] for line in lines[1:]] == [
+        '10', '8', '6', '4', '2',
+    ]
+
+    # 4. Compressed export
+    res = await cli.get('/admin/book/export/', params={"gzip": "1"})
+    lines = gzip.decompress(await res.read()).decode().splitlines()
+
+    assert res.headers['Content-Type'] == 'application/gzip'
+    assert 'book.csv.gz' in res.headers['Content-Disposition']
+    assert len(lines) == 11
+
+    # 5. Unknown format
+    res = await cli.get('/admin/book/export/', params={"format": "xml"})
+
+    assert res.status == 400
+
+
+async def test_export_empty_list(aiohttp_client):
+    """
+    In this test we check that the export of the empty list contains only the
+    header.
+    """
+    cli = await aiohttp_client(generate_app(0))
+
+    res = await cli.get('/admin/book/export/')
+
+    assert res.status == 200
+    assert await res.text() == 'id,title,pages,genre\r\n'
+
+
+async def test_export_is_disabled_by_default(aiohttp_client):
+    """
+    In this test we check that the export route and the button of the list
+    page are available only if export formats are specified.
+    """
+    cli = await aiohttp_client(generate_app(2, export_formats={}))
+
+    res = await cli.get('/admin/book/export/')
+
+    # the url is handled by the detail page
+    assert 'Content-Disposition' not in res.headers
+
+    res = await cli.get('/admin/book/')
+
+    assert res.status == 200
+    assert '/admin/book/export/' not in await res.text()
+
+    cli = await aiohttp_client(generate_app(2))
+    res = await cli.get('/admin/book/')
+
+    assert '/admin/book/export/' in await res.text()
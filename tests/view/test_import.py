@@ -0,0 +1,188 @@
+import json
+
+from aiohttp import FormData
+from aiohttp import web
+from aiohttp_admin2 import setup_admin
+from aiohttp_admin2.controllers.controller import Controller
+from aiohttp_admin2.mappers import Mapper
+from aiohttp_admin2.mappers import fields
+from aiohttp_admin2.resources import DictResource
+from aiohttp_admin2.views import ControllerView
+from aiohttp_admin2.views.aiohttp.importer import IMPORT_FORMATS
+
+from .utils import generate_new_admin_class
+
+
+class BookMapper(Mapper):
+    id = fields.IntField()
+    title = fields.StringField(required=True)
+    pages = fields.IntField()
+
+
+class CountDictResource(DictResource):
+    """
+    Dict resource which save count of instances after each call of the
+    `create_many` method.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.calls = []
+
+    async def create_many(self, instances):
+        self.calls.append(len(instances))
+
+        return await super().create_many(instances)
+
+
+def generate_app(import_formats=IMPORT_FORMATS, can_create=True):
+    resource = CountDictResource({})
+
+    class BookController(Controller):
+        mapper = BookMapper
+        name = 'book'
+        import_batch_size = 2
+        import_max_errors = 1
+
+    BookController.resource = resource
+    BookController.can_create = can_create
+
+    class BookView(ControllerView):
+        controller = BookController
+
+    BookView.import_formats = import_formats
+
+    app = web.Application()
+    setup_admin(
+        app,
+        views=[BookView, ],
+        admin_class=generate_new_admin_class(),
+    )
+
+    return app, resource
+
+
+def file_data(content, filename):
+    data = FormData()
+    data.add_field('file', content.encode(), filename=filename)
+
+    return data
+
+
+async def test_import(aiohttp_client):
+    """
+    In this test we check the import of instances from a file.
+
+        1. Import from csv
+        2. Invalid rows are reported and valid rows are created
+        3. Import from jsonl
+        4. Unknown format
+        5. Invalid file
+    """
+    app, resource = generate_app()
+    cli = await aiohttp_client(app)
+
+    res = await cli.get('/admin/book/import/')
+
+    assert res.status == 200
+    assert 'name="file"' in await res.text()
+
+    # 1. Import from csv
+    res = await cli.post('/admin/book/import/', data=file_data(
+        'title,pages\r\nfirst,10\r\n"second, ""part"" 2",20\r\nthird,30\r\n',
+        'books.csv',
+    ))
+    text = await res.text()
+
+    assert res.status == 200
+    assert '3 of 3 rows have been imported' in text
+    assert 'rows/sec' in text
+    assert resource.calls == [2, 1]
+    assert [r["title"] for r in resource.engine.values()] == [
+        'first',
+        'second, "part" 2',
+        'third',
+    ]
+    assert resource.engine[1]["pages"] == 10
+
+    # 2. Invalid rows are reported and valid rows are created
+    resource.engine.clear()
+    res = await cli.post('/admin/book/import/', data=file_data(
+        'title,pages\nfirst,many\n,20\nthird,30\n',
+        'books.csv',
+    ))
+    text = await res.text()
+
+    assert '1 of 3 rows have been imported' in text
+    assert 'and 1 more invalid rows' in text
+    assert [r["title"] for r in resource.engine.values()] == ['third']
+
+    # 3. Import from jsonl
+    resource.engine.clear()
+    res = await cli.post('/admin/book/import/', data=file_data(
+        '\n'.join(json.dumps({"title": f"book {i}"}) for i in range(5)),
+        'books.jsonl',
+    ))
+
+    assert '5 of 5 rows have been imported' in await res.text()
+    assert len(resource.engine) == 5
+
+    # 4. Unknown format
+    res = await cli.post('/admin/book/import/', data=file_data('', 'b.xml'))
+
+    assert 'The import format `xml` is not supported' in await res.text()
+
+    # 5. Invalid file
+    resource.engine.clear()
+    res = await cli.post('/admin/book/import/', data=file_data(
+        '{"title": "first"}\n{"title": \n{"title": "third"}\n',
+        'books.jsonl',
+    ))
+    text = await res.text()
+
+    assert 'The file is invalid' in text
+    assert [r["title"] for r in resource.engine.values()] == ['first']
+
+
+async def test_import_is_disabled(aiohttp_client):
+    """
+    In this test we check that the import is available only if import
+    formats are specified and the controller can create instances.
+
+        1. The import is disabled by default
+        2. The import is not available without the create permission
+    """
+    # 1. The import is disabled by default
+    app, resource = generate_app(import_formats={})
+    cli = await aiohttp_client(app)
+
+    res = await cli.get('/admin/book/')
+
+    assert '/admin/book/import/' not in await res.text()
+
+    await cli.post('/admin/book/import/', data=file_data(
+        'title\r\nfirst\r\n',
+        'books.csv',
+    ))
+
+    assert not resource.engine
+
+    # 2. The import is not available without the create permission
+    app, resource = generate_app(can_create=False)
+    cli = await aiohttp_client(app)
+
+    res = await cli.get('/admin/book/')
+
+    assert '/admin/book/import/' not in await res.text()
+
+    res = await cli.get('/admin/book/import/')
+
+    assert res.status != 200
+
+    res = await cli.post('/admin/book/import/', data=file_data(
+        'title\r\nfirst\r\n',
+        'books.csv',
+    ))
+
+    assert res.status != 200
+    assert not resource.engine
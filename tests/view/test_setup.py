@@ -1,7 +1,13 @@
 from aiohttp import web
 from aiohttp_admin2 import setup_admin
+from aiohttp_admin2.controllers.controller import Controller
+from aiohttp_admin2.mappers import Mapper
+from aiohttp_admin2.mappers import fields
+from aiohttp_admin2.resources import DictResource
 from aiohttp_admin2.views import Admin
+from aiohttp_admin2.views import ControllerView
 from aiohttp_admin2.views import DashboardView
+from aiohttp_admin2.views.aiohttp.views.utils import route
 
 from .utils import generate_new_admin_class
 
@@ -60,3 +66,67 @@ async def test_setup_with_custom_dashboard(aiohttp_client):
 
     assert res.status == 200
     assert MyDashboardView.name in await res.text()
+
+
+async def test_static_routes_before_routes_with_variables(aiohttp_client):
+    """
+    In this test we check that static routes of the view are registered
+    before routes with variable parts regardless of names of handlers.
+
+        1. Static routes are registered before routes with variables
+        2. Static routes are not matched by the detail routes
+        3. The detail routes still work
+    """
+    class BookMapper(Mapper):
+        id = fields.IntField()
+
+    class BookController(Controller):
+        mapper = BookMapper
+        name = 'book'
+        resource = DictResource({"1": {"id": 1}})
+
+    class BookView(ControllerView):
+        controller = BookController
+
+        # names of handlers are sorted after names of the detail handlers
+        @route(r'/summary/')
+        async def z_summary(self, req):
+            return web.Response(text='summary')
+
+        @route(r'/archive/', method='POST')
+        async def z_archive(self, req):
+            return web.Response(text='archive')
+
+    app = web.Application()
+    setup_admin(
+        app,
+        views=[BookView, ],
+        admin_class=generate_new_admin_class(),
+    )
+    # 1. Static routes are registered before routes with variables
+    urls = [
+        resource.canonical
+        for resource in app['aiohttp_admin'].router.resources()
+        if resource.canonical.startswith('/admin/book/')
+    ]
+    first_variable = next(i for i, url in enumerate(urls) if '{' in url)
+
+    assert '/admin/book/summary/' in urls[:first_variable]
+    assert '/admin/book/archive/' in urls[:first_variable]
+    assert not any('{' not in url for url in urls[first_variable:])
+
+    cli = await aiohttp_client(app)
+
+    # 2. Static routes are not matched by the detail routes
+    res = await cli.get('/admin/book/summary/')
+
+    assert await res.text() == 'summary'
+
+    res = await cli.post('/admin/book/archive/')
+
+    assert await res.text() == 'archive'
+
+    # 3. The detail routes still work
+    res = await cli.get('/admin/book/1/')
+
+    assert res.status == 200
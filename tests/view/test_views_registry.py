@@ -0,0 +1,232 @@
+import asyncio
+
+from aiohttp import web
+from aiohttp_admin2 import setup_admin
+from aiohttp_admin2.views import TemplateView
+from aiohttp_admin2.views.aiohttp.views.utils import route
+from aiohttp_admin2.views.aiohttp.views.registry import views_registry
+
+from .utils import generate_new_admin_class
+
+
+def generate_views(count, calls, delay=0):
+    """
+    Generate list of template views which save name of the view to the
+    `calls` list after each call of the access hook.
+    """
+    views = []
+
+    for index in range(count):
+        class View(TemplateView):
+            name = f'view_{index}'
+            index_url = f'/view_{index}/'
+
+            async def access_hook(self) -> None:
+                calls.append(self.name)
+                await asyncio.sleep(delay)
+
+        views.append(View)
+
+    return views
+
+
+async def test_only_current_view_is_checked_without_context(aiohttp_client):
+    """
+    In this test we check that the admin doesn't call access hooks of views
+    which are not required for the current page.
+
+        1. Only current view is checked
+        2. Views are checked once per request
+    """
+    calls = []
+
+    class RawView(TemplateView):
+        name = 'raw'
+
+        async def access_hook(self) -> None:
+            calls.append(self.name)
+
+        @route('/')
+        async def get(self, req: web.Request) -> web.Response:
+            return web.Response(text='raw')
+
+    app = web.Application()
+    views = [RawView, *generate_views(3, calls)]
+    setup_admin(app, views=views, admin_class=generate_new_admin_class())
+
+    cli = await aiohttp_client(app)
+
+    # 1. Only current view is checked
+    res = await cli.get('/admin/rawview/')
+
+    assert res.status == 200
+    assert calls == ['raw']
+
+    # 2. Views are checked once per request
+    calls.clear()
+    res = await cli.get('/admin/view_0/')
+
+    assert res.status == 200
+    assert sorted(calls) == ['raw', 'view_0', 'view_1', 'view_2']
+
+
+async def test_access_hooks_are_called_concurrently(aiohttp_client):
+    """
+    In this test we check that access hooks of all views which are needed for
+    the navigation menu are called concurrently.
+    """
+    calls = []
+    in_progress = 0
+    max_in_progress = 0
+
+    async def slow_access_hook(self) -> None:
+        nonlocal in_progress, max_in_progress
+        in_progress += 1
+        max_in_progress = max(max_in_progress, in_progress)
+        await asyncio.sleep(0.01)
+        in_progress -= 1
+
+    class SlowView(TemplateView):
+        name = 'slow'
+        access_hook = slow_access_hook
+
+    class SecondSlowView(TemplateView):
+        name = 'second_slow'
+        access_hook = slow_access_hook
+
+    app = web.Application()
+    views = [SlowView, SecondSlowView, *generate_views(2, calls)]
+    setup_admin(app, views=views, admin_class=generate_new_admin_class())
+
+    cli = await aiohttp_client(app)
+    res = await cli.get('/admin/')
+
+    assert res.status == 200
+    assert max_in_progress == 2
+    assert sorted(calls) == ['view_0', 'view_1']
+
+
+async def test_access_hooks_limit(aiohttp_client):
+    """
+    In this test we check that the admin doesn't run more access hooks
+    concurrently than specified in the `access_hooks_limit`.
+    """
+    in_progress = 0
+    max_in_progress = 0
+
+    async def slow_access_hook(self) -> None:
+        nonlocal in_progress, max_in_progress
+        in_progress += 1
+        max_in_progress = max(max_in_progress, in_progress)
+        await asyncio.sleep(0.01)
+        in_progress -= 1
+
+    views = []
+
+    for index in range(3):
+        views.append(type(f'SlowView{index}', (TemplateView, ), {
+            "access_hook": slow_access_hook,
+        }))
+
+    class MyAdmin(generate_new_admin_class()):
+        access_hooks_limit = 1
+
+    app = web.Application()
+    setup_admin(app, views=views, admin_class=MyAdmin)
+
+    cli = await aiohttp_client(app)
+    res = await cli.get('/admin/')
+
+    assert res.status == 200
+    assert max_in_progress == 1
+
+
+async def test_permission_lookups_and_timings(aiohttp_client):
+    """
+    In this test we check deduplication of permission lookups and timings of
+    access hooks.
+
+        1. Identical permission lookups are called once per request
+        2. Registry has timing for each called access hook
+    """
+    lookups = []
+
+    async def can_view():
+        lookups.append(1)
+        await asyncio.sleep(0.01)
+        return True
+
+    async def check_access_hook(self) -> None:
+        self.has_access = await self.check_permission('can_view', can_view)
+
+    class TimingsView(TemplateView):
+        access_hook = check_access_hook
+
+        @route('/')
+        async def get(self, req: web.Request) -> web.Response:
+            registry = views_registry.get()
+            await registry.resolve_all()
+
+            return web.json_response({
+                view.__name__: timing
+                for view, timing in registry.timings.items()
+            })
+
+    class SecondView(TemplateView):
+        access_hook = check_access_hook
+
+    app = web.Application()
+    setup_admin(
+        app,
+        views=[TimingsView, SecondView],
+        admin_class=generate_new_admin_class(),
+    )
+
+    cli = await aiohttp_client(app)
+    res = await cli.get('/admin/timingsview/')
+
+    assert res.status == 200
+
+    # 1. Identical permission lookups are called once per request
+    assert len(lookups) == 1
+
+    # 2. Registry has timing for each called access hook
+    timings = await res.json()
+
+    assert set(timings) == {'TimingsView', 'SecondView', 'MockDashboard'}
+    assert timings['TimingsView'] >= 0.01
+
+
+async def test_nested_access_hooks_with_limit(aiohttp_client):
+    """
+    In this test we check that the access hook which waits for the access
+    hook of other view doesn't wait for the semaphore which is held by
+    itself.
+    """
+    calls = []
+
+    class InnerView(TemplateView):
+        name = 'inner'
+
+        async def access_hook(self) -> None:
+            calls.append(self.name)
+
+    class OuterView(TemplateView):
+        name = 'outer'
+
+        async def access_hook(self) -> None:
+            inner = await views_registry.get().get(InnerView)
+            calls.append(self.name)
+            self.has_access = inner.has_access
+
+    class MyAdmin(generate_new_admin_class()):
+        access_hooks_limit = 1
+
+    app = web.Application()
+    setup_admin(app, views=[OuterView, InnerView], admin_class=MyAdmin)
+
+    cli = await aiohttp_client(app)
+    res = await asyncio.wait_for(cli.get('/admin/'), 2)
+
+    assert res.status == 200
+    assert calls == ['inner', 'outer']